@@ -1,14 +1,20 @@
 """Main JSON interface views."""
 
 import collections
+import concurrent.futures
+import copy
+import functools
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import transaction
+from django.db import connection, connections, transaction
 from django.http import JsonResponse
 from django.urls import path, reverse
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 from django.views.generic.base import RedirectView
 
@@ -22,9 +28,11 @@ from rest_framework.response import Response
 from rest_framework.serializers import ValidationError
 from rest_framework.views import APIView
 
+import InvenTree.cache
 import InvenTree.config
 import InvenTree.permissions
 import InvenTree.version
+from common.models import SETTINGS_LOCAL_CACHE
 from common.settings import get_global_setting
 from InvenTree import helpers, ready
 from InvenTree.auth_overrides import registration_enabled
@@ -261,6 +269,7 @@ class InfoApiSerializer(serializers.Serializer):
     installer = serializers.CharField(read_only=True)
     target = serializers.CharField(read_only=True, allow_null=True)
     django_admin = serializers.CharField(read_only=True)
+    settings_cache = serializers.JSONField(read_only=True, allow_null=True)
     settings = SettingsSerializer(read_only=True, many=False)
 
 
@@ -324,6 +333,7 @@ class InfoView(APIView):
             'django_admin': settings.INVENTREE_ADMIN_URL
             if (is_staff and settings.INVENTREE_ADMIN_ENABLED)
             else None,
+            'settings_cache': SETTINGS_LOCAL_CACHE.stats() if is_staff else None,
             'settings': {
                 'sso_registration': registration_enabled('LOGIN_ENABLE_SSO_REG'),
                 'registration_enabled': registration_enabled('LOGIN_ENABLE_REG'),
@@ -710,6 +720,58 @@ class ListCreateDestroyAPIView(BulkDeleteMixin, ListCreateAPI):
     """Custom API endpoint which provides BulkDelete functionality in addition to List and Create."""
 
 
+# Shared pools of worker threads for running global search queries (keyed by pool size)
+SEARCH_EXECUTORS: dict[int, ThreadPoolExecutor] = {}
+SEARCH_EXECUTORS_LOCK = threading.Lock()
+
+
+def get_search_executor(workers: int) -> ThreadPoolExecutor:
+    """Return the shared thread pool used to run global search queries.
+
+    The pool is shared between requests, so that the total number of search threads
+    (and database connections) is bounded, regardless of the number of concurrent requests.
+
+    Arguments:
+        workers: Maximum number of worker threads in the pool
+    """
+    with SEARCH_EXECUTORS_LOCK:
+        if workers not in SEARCH_EXECUTORS:
+            SEARCH_EXECUTORS[workers] = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix='inventree-search'
+            )
+
+        return SEARCH_EXECUTORS[workers]
+
+
+def set_statement_timeout(timeout) -> None:
+    """Limit the execution time of database queries for the current connection.
+
+    A query which exceeds the timeout is cancelled by the database server (raising an exception),
+    so that a slow query cannot occupy a search worker thread indefinitely.
+
+    Note: Not supported for SQLite databases.
+
+    Arguments:
+        timeout: Maximum execution time for each query (seconds)
+    """
+    if not timeout:
+        return
+
+    ms = max(1, int(float(timeout) * 1000))
+
+    if connection.vendor == 'postgresql':
+        query = f'SET statement_timeout = {ms}'
+    elif connection.vendor == 'mysql' and connection.mysql_is_mariadb:
+        query = f'SET SESSION max_statement_time = {ms / 1000}'
+    elif connection.vendor == 'mysql':
+        query = f'SET SESSION max_execution_time = {ms}'
+    else:
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(query)
+
+
 class APISearchViewSerializer(serializers.Serializer):
     """Serializer for the APISearchView."""
 
@@ -767,6 +829,82 @@ class APISearchView(GenericAPIView):
             'customer': {'is_customer': True},
         }
 
+    def search_model(self, view, request, *args, **kwargs) -> dict:
+        """Perform the search query against a single model.
+
+        Arguments:
+            view: The list view instance (with the cloned request attached)
+            request: The original request object
+
+        Returns:
+            The serialized list data, or an error message
+        """
+        try:
+            return view.list(request, *args, **kwargs).data
+        except Exception as exc:
+            return {'error': str(exc)}
+
+    def run_searches(self, searches: dict, timeout=None) -> dict:
+        """Run the provided search queries, concurrently if possible.
+
+        Each query is run in a thread from a shared pool (with its own database connection),
+        the size of which is set by the SEARCH_WORKERS setting.
+        Any query which does not complete within the provided time budget
+        is returned as a timeout marker, without blocking the other results.
+        Queries are also subject to a database statement timeout (where supported),
+        so that a slow query does not occupy a worker thread after the budget has expired.
+
+        Arguments:
+            searches: Mapping of result key to a callable which performs the search
+            timeout: Time budget (in seconds) for the search queries
+
+        Returns:
+            A dict of search results, keyed by result type
+        """
+        workers = int(settings.SEARCH_WORKERS)
+
+        # Fall back to running the queries in sequence
+        if workers <= 1 or len(searches) <= 1:
+            return {key: search() for key, search in searches.items()}
+
+        language = translation.get_language()
+
+        def run_search(search):
+            """Run a single search query in a worker thread."""
+            InvenTree.cache.create_session_cache(None)
+
+            try:
+                set_statement_timeout(timeout)
+
+                with translation.override(language):
+                    return search()
+            except Exception as exc:
+                return {'error': str(exc)}
+            finally:
+                InvenTree.cache.delete_session_cache()
+                connections.close_all()
+
+        results = {}
+
+        executor = get_search_executor(workers)
+
+        futures = {
+            key: executor.submit(run_search, search) for key, search in searches.items()
+        }
+
+        concurrent.futures.wait(futures.values(), timeout=timeout)
+
+        for key, future in futures.items():
+            if future.done():
+                results[key] = future.result()
+            else:
+                # Queries which have not yet started are discarded
+                future.cancel()
+                logger.warning("Search query for '%s' timed out", key)
+                results[key] = {'error': _('Search query timed out'), 'timeout': True}
+
+        return results
+
     def post(self, request, *args, **kwargs):
         """Perform search query against available models."""
         data = request.data
@@ -788,13 +926,11 @@ class APISearchView(GenericAPIView):
 
         search_filters = self.get_result_filters()
 
-        # Create a clone of the request object to modify
-        # Use GET method for the individual list views
-        cloned_request = clone_request(request, 'GET')
-
         # Fetch and cache all groups associated with the current user
         groups = prefetch_rule_sets(request.user)
 
+        searches = {}
+
         for key, cls in self.get_result_types().items():
             # Only return results which are specifically requested
             if key in data:
@@ -817,6 +953,12 @@ class APISearchView(GenericAPIView):
 
                 view = cls()
 
+                # Create a clone of the request object for each search type
+                # Use GET method for the individual list views
+                # The underlying HttpRequest is also copied, as the searches may run concurrently
+                cloned_request = clone_request(request, 'GET')
+                cloned_request._request = copy.copy(request._request)
+
                 # Override regular query params with specific ones for this search request
                 cloned_request._request.GET = params
                 view.request = cloned_request
@@ -833,10 +975,11 @@ class APISearchView(GenericAPIView):
                     }
                     continue
 
-                try:
-                    results[key] = view.list(request, *args, **kwargs).data
-                except Exception as exc:
-                    results[key] = {'error': str(exc)}
+                searches[key] = functools.partial(
+                    self.search_model, view, request, *args, **kwargs
+                )
+
+        results.update(self.run_searches(searches, timeout=settings.SEARCH_TIMEOUT))
 
         return Response(results)
 
@@ -1,11 +1,26 @@
 """InvenTree API version information."""
 
 # InvenTree API version
-INVENTREE_API_VERSION = 479
+INVENTREE_API_VERSION = 484
 """Increment this API version number whenever there is a significant change to the API that any clients need to know about."""
 
 INVENTREE_API_TEXT = """
 
+v484 -> 2026-10-18
+    - Adds optional cursor (keyset) pagination and "skip_count" option to the part, stock item, stock tracking and order list endpoints
+
+v483 -> 2026-10-18
+    - Adds "reserve" field to the GenerateSerialNumber API endpoint, which reserves the generated serial numbers
+
+v482 -> 2026-10-18
+    - Global search queries are run concurrently, and any search query which exceeds the time budget returns an error with a "timeout" marker
+
+v481 -> 2026-10-18
+    - Adds "dry_run" field to the BuildAutoAllocate API endpoint, which returns the planned allocations without saving them
+
+v480 -> 2026-10-18
+    - Adds "settings_cache" field to the /api/ endpoint (staff only), with hit / miss statistics for the local settings cache
+
 v479 -> 2026-04-11 : https://github.com/inventree/InvenTree/pull/11723
     - POST /api//notifications/readall/ now requires a POST action
     - POST /api/admin/email/test/ - now returns a 200 on. a successful test
@@ -1,5 +1,7 @@
 """AppConfig for InvenTree app."""
 
+import atexit
+import multiprocessing
 import sys
 from importlib import import_module
 from pathlib import Path
@@ -52,6 +54,9 @@ class InvenTreeConfig(AppConfig):
         ):
             return
 
+        if InvenTree.ready.isInWorkerThread():
+            self.register_worker_status()
+
         # Skip if running migrations
         if InvenTree.ready.isRunningMigrations():
             return
@@ -85,6 +90,14 @@ class InvenTreeConfig(AppConfig):
 
         social_account_updated.connect(sso.ensure_sso_groups)
 
+    def register_worker_status(self):
+        """Push the background worker status when the worker cluster starts or stops."""
+        import InvenTree.status
+
+        if multiprocessing.parent_process() is None:
+            # Only the main cluster process reports that the worker has stopped
+            atexit.register(InvenTree.status.worker_stopped)
+
     @ignore_ready_warning
     def remove_obsolete_tasks(self):
         """Delete any obsolete scheduled tasks in the database."""
@@ -0,0 +1,661 @@
+"""Performance benchmarks for InvenTree.
+
+This module provides:
+
+- DatasetGenerator: Generates a (scalable) synthetic dataset of parts, BOMs, stock and orders
+- BenchmarkRunner: Times a set of key operations against the current database
+
+The benchmarks are run via the 'benchmark' management command (or 'invoke dev.benchmark'),
+and the results are exported as JSON, so that performance can be compared across releases.
+
+Note: Each benchmark run is performed inside a database transaction which is rolled back,
+so that the dataset is not modified by the benchmarks themselves.
+"""
+
+import random
+import statistics
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import Max
+
+import structlog
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+import InvenTree.version
+from InvenTree.querystats import record_queries
+
+logger = structlog.get_logger('inventree')
+
+# Prefix applied to the names of all generated data
+PREFIX = 'BENCH'
+
+
+def next_tree_id(model) -> int:
+    """Return the next available MPTT tree_id for the provided model."""
+    return (model.objects.aggregate(Max('tree_id'))['tree_id__max'] or 0) + 1
+
+
+class DatasetGenerator:
+    """Generate a synthetic dataset for performance benchmarking.
+
+    The dataset consists of:
+
+    - A category tree (of the specified depth)
+    - A stock location tree
+    - Parts, split into multiple BOM levels (assemblies) and purchaseable components
+    - Multi-level BOMs (each assembly consumes parts from the level below)
+    - Supplier parts for each component
+    - Stock items (spread across the stock locations)
+    - Purchase orders, sales orders and build orders
+
+    Bulk operations are used wherever possible, so large datasets can be generated quickly.
+    """
+
+    def __init__(
+        self,
+        parts: int = 1000,
+        stock: int = 10000,
+        orders: int = 50,
+        builds: int = 10,
+        category_depth: int = 4,
+        bom_levels: int = 3,
+        bom_items: int = 5,
+        seed: int = 0,
+    ):
+        """Initialize the dataset generator.
+
+        Arguments:
+            parts: Number of parts to generate
+            stock: Number of stock items to generate
+            orders: Number of purchase orders (and sales orders) to generate
+            builds: Number of build orders to generate
+            category_depth: Depth of the part category tree
+            bom_levels: Number of assembly levels in the BOM structure
+            bom_items: Number of BOM items for each assembly
+            seed: Random seed (for a repeatable dataset)
+        """
+        self.n_parts = max(parts, 10)
+        self.n_stock = stock
+        self.n_orders = orders
+        self.n_builds = builds
+        self.category_depth = max(category_depth, 1)
+        self.bom_levels = max(bom_levels, 1)
+        self.bom_items = max(bom_items, 1)
+
+        self.random = random.Random(seed)
+
+        # Parts in each BOM level (the final level contains the components)
+        self.levels: list[list] = []
+
+    def generate(self) -> dict:
+        """Generate the complete dataset.
+
+        Returns:
+            A dict of the number of generated objects of each type
+        """
+        t1 = time.perf_counter()
+
+        with transaction.atomic():
+            categories = self.create_tree('part.PartCategory', 'Category', 3)
+            self.locations = self.create_tree('stock.StockLocation', 'Location', 4)
+            self.create_parts(categories)
+            self.create_boms()
+            self.create_companies()
+            self.create_stock()
+            self.create_orders()
+            self.create_builds()
+
+        logger.info(
+            'Generated benchmark dataset in %.1f seconds', time.perf_counter() - t1
+        )
+
+        return self.counts()
+
+    def counts(self) -> dict:
+        """Return the number of objects of each type in the database."""
+        from build.models import Build
+        from order.models import PurchaseOrderLineItem, SalesOrderLineItem
+        from part.models import BomItem, Part, PartCategory
+        from stock.models import StockItem, StockLocation
+
+        return {
+            model.__name__: model.objects.count()
+            for model in [
+                PartCategory,
+                Part,
+                BomItem,
+                StockLocation,
+                StockItem,
+                PurchaseOrderLineItem,
+                SalesOrderLineItem,
+                Build,
+            ]
+        }
+
+    def create_tree(self, model_name: str, label: str, branching: int) -> list:
+        """Create a tree of (MPTT) objects, returning the leaf nodes.
+
+        Arguments:
+            model_name: The model to create ('app.Model')
+            label: Name label for the created objects
+            branching: Number of children for each node
+        """
+        from django.apps import apps
+
+        model = apps.get_model(model_name)
+
+        nodes = [model.objects.create(name=f'{PREFIX} {label}', description=label)]
+
+        for level in range(1, self.category_depth + 1):
+            nodes = [
+                model.objects.create(
+                    name=f'{PREFIX} {label} {level}-{idx}',
+                    description=label,
+                    parent=parent,
+                )
+                for parent in nodes
+                for idx in range(branching)
+            ]
+
+        return nodes
+
+    def create_parts(self, categories: list):
+        """Create parts, split into BOM levels.
+
+        Each assembly level contains ~5% of the parts, the remaining parts are components.
+        """
+        from part.models import Part
+
+        n_assemblies = max(1, self.n_parts // 20)
+        tree_id = next_tree_id(Part)
+
+        parts = []
+
+        for idx in range(self.n_parts):
+            level = min(idx // n_assemblies, self.bom_levels)
+            assembly = level < self.bom_levels
+
+            parts.append(
+                Part(
+                    name=f'{PREFIX} Part {idx}',
+                    description=f'Benchmark part (level {level})',
+                    IPN=f'{PREFIX}-{idx:06d}',
+                    category=self.random.choice(categories),
+                    assembly=assembly,
+                    component=level > 0,
+                    purchaseable=not assembly,
+                    salable=level == 0,
+                    active=True,
+                    tree_id=tree_id + idx,
+                    level=0,
+                    lft=1,
+                    rght=2,
+                )
+            )
+
+        Part.objects.bulk_create(parts, batch_size=1000)
+
+        parts = list(Part.objects.filter(IPN__startswith=f'{PREFIX}-').order_by('IPN'))
+
+        self.levels = [
+            parts[level * n_assemblies : (level + 1) * n_assemblies]
+            for level in range(self.bom_levels)
+        ]
+
+        self.levels.append(parts[self.bom_levels * n_assemblies :])
+
+    @property
+    def assemblies(self) -> list:
+        """Return all generated assemblies."""
+        return [part for level in self.levels[:-1] for part in level]
+
+    @property
+    def components(self) -> list:
+        """Return all generated components."""
+        return self.levels[-1] or self.levels[-2]
+
+    def create_boms(self):
+        """Create a multi-level BOM for each assembly."""
+        from part.models import BomItem
+
+        items = []
+
+        for level, assemblies in enumerate(self.levels[:-1]):
+            sub_parts = self.levels[level + 1]
+
+            for assembly in assemblies:
+                for sub_part in self.random.sample(
+                    sub_parts, min(self.bom_items, len(sub_parts))
+                ):
+                    items.append(
+                        BomItem(
+                            part=assembly,
+                            sub_part=sub_part,
+                            quantity=self.random.randint(1, 5),
+                        )
+                    )
+
+        BomItem.objects.bulk_create(items, batch_size=1000)
+
+    def create_companies(self):
+        """Create a supplier and customer, and supplier parts for each component."""
+        from company.models import Company, SupplierPart
+
+        self.supplier = Company.objects.create(
+            name=f'{PREFIX} Supplier', is_supplier=True
+        )
+
+        self.customer = Company.objects.create(
+            name=f'{PREFIX} Customer', is_customer=True
+        )
+
+        SupplierPart.objects.bulk_create(
+            [
+                SupplierPart(
+                    part=part, supplier=self.supplier, SKU=f'{PREFIX}-SKU-{part.pk}'
+                )
+                for part in self.components
+            ],
+            batch_size=1000,
+        )
+
+        self.supplier_parts = list(SupplierPart.objects.filter(supplier=self.supplier))
+
+    def create_stock(self):
+        """Create stock items for the generated parts.
+
+        Most stock is for components (so that builds can be allocated),
+        with the remainder spread across the assemblies.
+        """
+        from stock.models import StockItem
+
+        tree_id = next_tree_id(StockItem)
+        assemblies = self.assemblies
+
+        batch = []
+
+        for idx in range(self.n_stock):
+            if idx % 5 == 0:
+                part = self.random.choice(assemblies)
+            else:
+                part = self.random.choice(self.components)
+
+            batch.append(
+                StockItem(
+                    part=part,
+                    location=self.random.choice(self.locations),
+                    quantity=Decimal(self.random.randint(1, 100)),
+                    batch=f'{PREFIX}-{idx // 100}',
+                    tree_id=tree_id + idx,
+                    level=0,
+                    lft=1,
+                    rght=2,
+                )
+            )
+
+            if len(batch) >= 5000:
+                StockItem.objects.bulk_create(batch)
+                batch = []
+
+        StockItem.objects.bulk_create(batch)
+
+    def create_orders(self, lines: int = 10):
+        """Create purchase orders and sales orders (with line items).
+
+        Arguments:
+            lines: Number of line items for each order
+        """
+        from order.models import (
+            PurchaseOrder,
+            PurchaseOrderLineItem,
+            SalesOrder,
+            SalesOrderLineItem,
+        )
+        from order.status_codes import PurchaseOrderStatus, SalesOrderStatus
+
+        po_lines = []
+        so_lines = []
+
+        for _idx in range(self.n_orders):
+            po = PurchaseOrder.objects.create(
+                reference=PurchaseOrder.generate_reference(),
+                supplier=self.supplier,
+                status=PurchaseOrderStatus.PLACED.value,
+            )
+
+            po_lines.extend(
+                PurchaseOrderLineItem(
+                    order=po,
+                    part=supplier_part,
+                    quantity=self.random.randint(10, 100),
+                    destination=self.random.choice(self.locations),
+                )
+                for supplier_part in self.random.sample(
+                    self.supplier_parts, min(lines, len(self.supplier_parts))
+                )
+            )
+
+            so = SalesOrder.objects.create(
+                reference=SalesOrder.generate_reference(),
+                customer=self.customer,
+                status=SalesOrderStatus.IN_PROGRESS.value,
+            )
+
+            so_lines.extend(
+                SalesOrderLineItem(
+                    order=so, part=part, quantity=self.random.randint(1, 10)
+                )
+                for part in self.random.sample(
+                    self.levels[0], min(lines, len(self.levels[0]))
+                )
+            )
+
+        PurchaseOrderLineItem.objects.bulk_create(po_lines, batch_size=1000)
+        SalesOrderLineItem.objects.bulk_create(so_lines, batch_size=1000)
+
+    def create_builds(self):
+        """Create build orders against the generated assemblies."""
+        from build.models import Build
+        from build.status_codes import BuildStatus
+
+        for _idx in range(self.n_builds):
+            Build.objects.create(
+                reference=Build.generate_reference(),
+                title='Benchmark build',
+                part=self.random.choice(self.assemblies),
+                quantity=self.random.randint(1, 20),
+                status=BuildStatus.PRODUCTION.value,
+            )
+
+
+class RollbackError(Exception):
+    """Raised to roll back the database transaction for a benchmark run."""
+
+
+class BenchmarkRunner:
+    """Time a set of key operations against the current database.
+
+    Each benchmark is run multiple times, and the timing statistics are recorded.
+    Each run is performed inside a database transaction, which is then rolled back.
+    """
+
+    def __init__(self, user, repeat: int = 3, page_size: int = 100):
+        """Initialize the benchmark runner.
+
+        Arguments:
+            user: The (superuser) account used for API requests
+            repeat: Number of times to run each benchmark
+            page_size: Number of results for API list requests
+        """
+        self.user = user
+        self.repeat = max(repeat, 1)
+        self.page_size = page_size
+        self.factory = APIRequestFactory()
+
+    @property
+    def benchmarks(self) -> dict[str, Callable]:
+        """Return the available benchmarks (keyed by name)."""
+        return {
+            'part_list': self.bench_part_list,
+            'bom_list': self.bench_bom_list,
+            'stock_list': self.bench_stock_list,
+            'po_receive': self.bench_po_receive,
+            'build_auto_allocate': self.bench_build_auto_allocate,
+            'pricing_update': self.bench_pricing_update,
+            'report_print': self.bench_report_print,
+            'barcode_scan': self.bench_barcode_scan,
+        }
+
+    def run(self, names: Optional[list[str]] = None) -> dict:
+        """Run the specified benchmarks (or all benchmarks).
+
+        Arguments:
+            names: List of benchmark names to run (default = all)
+
+        Returns:
+            A dict containing metadata and the results for each benchmark
+        """
+        benchmarks = self.benchmarks
+
+        if names:
+            if unknown := set(names) - set(benchmarks.keys()):
+                raise ValueError(f'Unknown benchmarks: {", ".join(sorted(unknown))}')
+
+            benchmarks = {name: benchmarks[name] for name in names}
+
+        results = {}
+
+        for name, benchmark in benchmarks.items():
+            logger.info('Running benchmark: %s', name)
+            results[name] = self.measure(benchmark)
+
+        return {
+            'version': InvenTree.version.inventreeVersion(),
+            'api_version': InvenTree.version.inventreeApiVersion(),
+            'commit': InvenTree.version.inventreeCommitHash(),
+            'database': InvenTree.version.inventreeDatabase(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'repeat': self.repeat,
+            'results': results,
+        }
+
+    def measure(self, benchmark: Callable) -> dict:
+        """Run a single benchmark multiple times, and return the timing statistics.
+
+        The benchmark function performs any (untimed) setup,
+        and returns a callable which performs the timed operation.
+        """
+        timings = []
+        stats = None
+
+        try:
+            for _idx in range(self.repeat):
+                with self.rollback():
+                    operation = benchmark()
+
+                    t1 = time.perf_counter()
+
+                    with record_queries() as stats:
+                        operation()
+
+                    timings.append(time.perf_counter() - t1)
+        except Exception as exc:
+            logger.exception('Benchmark failed: %s', exc)
+            return {'error': str(exc)}
+
+        return {
+            'runs': len(timings),
+            'min': min(timings),
+            'max': max(timings),
+            'mean': statistics.mean(timings),
+            'median': statistics.median(timings),
+            'queries': stats.queries,
+            'db_time': stats.db_time,
+            'serializer_time': stats.serializer_time,
+        }
+
+    @contextmanager
+    def rollback(self):
+        """Run the enclosed code inside a transaction which is always rolled back."""
+        try:
+            with transaction.atomic():
+                yield
+                raise RollbackError
+        except RollbackError:
+            pass
+
+    def api_list(self, view_class, **params) -> Callable:
+        """Return a callable which performs an API list request against the provided view."""
+        view = view_class.as_view()
+        params = {'limit': self.page_size, **params}
+
+        def operation():
+            request = self.factory.get('/api/', params)
+            force_authenticate(request, user=self.user)
+            response = view(request)
+            response.render()
+
+            if response.status_code != 200:
+                raise ValueError(f'API request failed: {response.status_code}')
+
+        return operation
+
+    def bench_part_list(self) -> Callable:
+        """Part list API request (with stock annotations)."""
+        from part.api import PartList
+
+        return self.api_list(PartList, category_detail=True)
+
+    def bench_bom_list(self) -> Callable:
+        """BOM list API request."""
+        from part.api import BomList
+
+        return self.api_list(BomList, sub_part_detail=True)
+
+    def bench_stock_list(self) -> Callable:
+        """Stock list API request."""
+        from stock.api import StockList
+
+        return self.api_list(StockList, part_detail=True, location_detail=True)
+
+    def bench_po_receive(self, lines: int = 20) -> Callable:
+        """Receive all line items against a new purchase order."""
+        from company.models import SupplierPart
+        from order.models import PurchaseOrder, PurchaseOrderLineItem
+        from order.status_codes import PurchaseOrderStatus
+        from stock.models import StockLocation
+
+        supplier_parts = list(
+            SupplierPart.objects.filter(SKU__startswith=f'{PREFIX}-')[:lines]
+        )
+
+        if not supplier_parts:
+            raise ValueError('No supplier parts available')
+
+        location = StockLocation.objects.filter(name__startswith=PREFIX).last()
+
+        po = PurchaseOrder.objects.create(
+            reference=PurchaseOrder.generate_reference(),
+            supplier=supplier_parts[0].supplier,
+            status=PurchaseOrderStatus.PLACED.value,
+        )
+
+        items = [
+            {
+                'line_item': PurchaseOrderLineItem.objects.create(
+                    order=po, part=supplier_part, quantity=10
+                ),
+                'quantity': 10,
+            }
+            for supplier_part in supplier_parts
+        ]
+
+        return lambda: po.receive_line_items(location, items, self.user)
+
+    def bench_build_auto_allocate(self) -> Callable:
+        """Automatically allocate stock against a new build order."""
+        from build.models import Build
+        from part.models import Part
+
+        # Find an assembly whose BOM consists of stocked components
+        part = (
+            Part.objects
+            .filter(
+                IPN__startswith=f'{PREFIX}-',
+                assembly=True,
+                bom_items__sub_part__assembly=False,
+            )
+            .order_by('-IPN')
+            .first()
+        )
+
+        if part is None:
+            raise ValueError('No assemblies available')
+
+        build = Build.objects.create(
+            reference=Build.generate_reference(),
+            title='Benchmark build',
+            part=part,
+            quantity=10,
+        )
+
+        return lambda: build.auto_allocate_stock(substitutes=True, optional_items=True)
+
+    def bench_pricing_update(self, count: int = 10) -> Callable:
+        """Recalculate pricing for a set of top-level assemblies."""
+        from part.models import Part
+
+        parts = list(
+            Part.objects.filter(
+                IPN__startswith=f'{PREFIX}-', assembly=True, salable=True
+            ).order_by('IPN')[:count]
+        )
+
+        def operation():
+            for part in parts:
+                part.pricing.update_pricing(cascade=False)
+
+        return operation
+
+    def bench_report_print(self, count: int = 10) -> Callable:
+        """Render a part report for a set of parts."""
+        from part.models import Part
+        from report.models import ReportTemplate
+
+        template = ReportTemplate.objects.filter(
+            model_type='part', enabled=True
+        ).first()
+
+        if template is None:
+            raise ValueError('No part report template available')
+
+        parts = list(Part.objects.filter(IPN__startswith=f'{PREFIX}-')[:count])
+
+        return lambda: template.print(parts)
+
+    def bench_barcode_scan(self, count: int = 50, repeat: int = 4) -> Callable:
+        """Scan a set of barcodes against the barcode scan API endpoint.
+
+        Half of the scanned stock items have a third-party barcode assigned,
+        the remainder are scanned using the internal barcode format.
+        Each barcode is scanned multiple times (as would happen at a busy receiving station).
+        """
+        from plugin.base.barcodes.api import BarcodeScan
+        from stock.models import StockItem
+
+        items = list(StockItem.objects.filter(batch__startswith=f'{PREFIX}-')[:count])
+
+        if not items:
+            raise ValueError('No stock items available')
+
+        barcodes = []
+
+        for idx, item in enumerate(items):
+            if idx % 2 == 0:
+                barcode = f'{PREFIX}-BARCODE-{item.pk}'
+                item.assign_barcode(barcode_data=barcode)
+            else:
+                barcode = item.format_barcode()
+
+            barcodes.append(barcode)
+
+        view = BarcodeScan.as_view()
+
+        def operation():
+            for barcode in barcodes * repeat:
+                request = self.factory.post(
+                    '/api/barcode/', {'barcode': barcode}, format='json'
+                )
+                force_authenticate(request, user=self.user)
+                response = view(request)
+                response.render()
+
+                if response.status_code != 200:
+                    raise ValueError(f'Barcode scan failed: {response.status_code}')
+
+        return operation
@@ -1,7 +1,10 @@
 """Configuration options for InvenTree external cache."""
 
+import pickle
 import socket
 import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
 from django.db.utils import OperationalError, ProgrammingError
@@ -197,3 +200,183 @@ def get_cached_content_types(cache_key: str = 'all_content_types') -> list:
         content_types = []
 
     return content_types
+
+
+class LocalLRUCache:
+    """Bounded, process-local cache with least-recently-used eviction.
+
+    Each entry is stored against a "version" stamp. When an entry is retrieved,
+    the requested version must match the stored version, otherwise the entry is
+    considered stale and is evicted. This allows entries to be invalidated across
+    multiple processes, by changing a version stamp held in the global cache.
+
+    If the cached values are mutable objects which are shared between threads (e.g. model instances),
+    the cache should be created with serialize=True. Each value is then stored in pickled form,
+    and a fresh copy is returned for each lookup.
+
+    Attributes:
+        maxsize: Maximum number of entries to store (zero disables the cache)
+        serialize: If True, store a pickled copy of each value (and return a new instance on each lookup)
+        hits: Number of successful lookups
+        misses: Number of unsuccessful (or stale) lookups
+    """
+
+    def __init__(self, maxsize: int = 1024, serialize: bool = False):
+        """Initialize an empty cache."""
+        self.maxsize = maxsize
+        self.serialize = serialize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, tuple[Any, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+        return len(self._data)
+
+    def get(self, key: str, version: Any = None) -> Any:
+        """Return a cached value, or None if the value is not cached (or is stale).
+
+        Arguments:
+            key: The cache key
+            version: The current version stamp for the cached data
+        """
+        with self._lock:
+            entry = self._data.get(key, None)
+
+            if entry is None or entry[0] != version:
+                if entry is not None:
+                    del self._data[key]
+
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+
+            value = entry[1]
+
+        if self.serialize:
+            return pickle.loads(value)
+
+        return value
+
+    def set(self, key: str, value: Any, version: Any = None) -> None:
+        """Store a value in the cache, evicting the least recently used entry if required.
+
+        Arguments:
+            key: The cache key
+            value: The value to store
+            version: The current version stamp for the cached data
+        """
+        if self.maxsize <= 0:
+            return
+
+        if self.serialize:
+            value = pickle.dumps(value)
+
+        with self._lock:
+            self._data[key] = (version, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a value from the cache."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values from the cache, and reset the hit/miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Return usage statistics for this cache."""
+        lookups = self.hits + self.misses
+
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else None,
+        }
+
+
+class CacheVersion:
+    """Version stamp for process-local cached data, shared via the global cache.
+
+    Incrementing the version (on any process) invalidates any data which has been
+    cached against the previous version (on every process).
+
+    To avoid a round-trip to the global cache for every lookup, the version is
+    read at most once per request (via the session cache), or at most once
+    per *interval* seconds when no request is active (e.g. background worker).
+    """
+
+    def __init__(self, name: str, interval: float = 1.0):
+        """Initialize the version stamp.
+
+        Arguments:
+            name: Unique name for the version stamp (used as the global cache key)
+            interval: Minimum interval (seconds) between global cache lookups, outside of a request
+        """
+        self.key = f'cache-version:{name}'
+        self.interval = interval
+        self._value = None
+        self._expiry = 0.0
+
+    @staticmethod
+    def initial_value() -> int:
+        """Return a starting value for the version stamp.
+
+        A time-based value is used so that a version stamp which is re-created
+        (e.g. after the global cache is flushed) does not collide with a previous value.
+        """
+        return time.time_ns()
+
+    def _store(self, value) -> None:
+        """Store the current version locally."""
+        self._value = value
+        self._expiry = time.monotonic() + self.interval
+        set_session_cache(self.key, value)
+
+    def get(self) -> Any:
+        """Return the current version stamp."""
+        from django.core.cache import cache
+
+        if hasattr(thread_data, 'request'):
+            if (value := get_session_cache(self.key)) is not None:
+                return value
+        elif time.monotonic() < self._expiry:
+            return self._value
+
+        value = cache.get(self.key, None)
+
+        if value is None:
+            # The version key does not yet exist (or has been evicted)
+            cache.add(self.key, self.initial_value(), timeout=None)
+            value = cache.get(self.key, None)
+
+        self._store(value)
+
+        return value
+
+    def bump(self) -> Any:
+        """Increment the version stamp, invalidating data cached against the previous version."""
+        from django.core.cache import cache
+
+        try:
+            value = cache.incr(self.key)
+        except ValueError:
+            # The version key does not yet exist (or has been evicted)
+            cache.add(self.key, self.initial_value(), timeout=None)
+            value = cache.incr(self.key)
+
+        self._store(value)
+
+        return value
@@ -4,9 +4,11 @@ import datetime
 import hashlib
 import inspect
 import io
+import itertools
 import json
 import os.path
 import re
+from collections.abc import Iterable, Iterator
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from typing import Optional, TypeVar
@@ -1158,6 +1160,26 @@ def inheritors(
     return subcls
 
 
+Chunked_T = TypeVar('Chunked_T')
+
+
+def chunked(iterable: Iterable[Chunked_T], size: int) -> Iterator[list[Chunked_T]]:
+    """Split the supplied iterable into lists of (at most) the specified size.
+
+    Args:
+        iterable: The items to split into chunks
+        size: The maximum number of items in each chunk
+
+    Yields:
+        list: The next chunk of items
+    """
+    size = max(1, int(size))
+    iterator = iter(iterable)
+
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
 def pui_url(subpath: str) -> str:
     """Return the URL for a web subpath."""
     if not subpath.startswith('/'):
@@ -0,0 +1,142 @@
+"""Custom management command to run the performance benchmark suite.
+
+- Generates a synthetic dataset (of configurable size)
+- Times a set of key operations against the dataset
+- Exports the results as JSON (for comparison across releases)
+"""
+
+import json
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Generate a benchmark dataset, and run the benchmark suite."""
+
+    def add_arguments(self, parser):
+        """Add the arguments for this command."""
+        parser.add_argument(
+            '--parts', type=int, default=1000, help='Number of parts to generate'
+        )
+        parser.add_argument(
+            '--stock', type=int, default=10000, help='Number of stock items to generate'
+        )
+        parser.add_argument(
+            '--orders',
+            type=int,
+            default=50,
+            help='Number of purchase orders and sales orders to generate',
+        )
+        parser.add_argument(
+            '--builds', type=int, default=10, help='Number of build orders to generate'
+        )
+        parser.add_argument(
+            '--depth', type=int, default=4, help='Depth of the part category tree'
+        )
+        parser.add_argument(
+            '--bom-levels', type=int, default=3, help='Number of BOM levels'
+        )
+        parser.add_argument(
+            '--seed', type=int, default=0, help='Random seed for the dataset'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=3, help='Number of runs for each benchmark'
+        )
+        parser.add_argument(
+            '--only',
+            type=str,
+            default='',
+            help='Comma-separated list of benchmarks to run (default = all)',
+        )
+        parser.add_argument(
+            '--output', type=str, default='', help='Output file for the JSON results'
+        )
+        parser.add_argument(
+            '--user',
+            type=str,
+            default='',
+            help='Username of the account used for API requests (default = first superuser)',
+        )
+        parser.add_argument(
+            '--skip-generate',
+            action='store_true',
+            help='Run the benchmarks against the existing database',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Generate the dataset even if the database is not empty',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Generate the dataset, and run the benchmarks."""
+        from InvenTree.benchmark import BenchmarkRunner, DatasetGenerator
+        from part.models import Part
+
+        generator = DatasetGenerator(
+            parts=kwargs['parts'],
+            stock=kwargs['stock'],
+            orders=kwargs['orders'],
+            builds=kwargs['builds'],
+            category_depth=kwargs['depth'],
+            bom_levels=kwargs['bom_levels'],
+            seed=kwargs['seed'],
+        )
+
+        if kwargs['skip_generate']:
+            dataset = generator.counts()
+        else:
+            if Part.objects.exists() and not kwargs['force']:
+                raise CommandError(
+                    'Database is not empty - use --force to generate the benchmark dataset anyway'
+                )
+
+            logger.info('Generating benchmark dataset')
+            dataset = generator.generate()
+
+        users = get_user_model().objects
+
+        if username := kwargs['user']:
+            user = users.filter(username=username).first()
+
+            if user is None:
+                raise CommandError(f"User '{username}' does not exist")
+        else:
+            user = users.filter(is_superuser=True).first()
+
+        runner = BenchmarkRunner(user, repeat=kwargs['repeat'])
+
+        names = [name.strip() for name in kwargs['only'].split(',') if name.strip()]
+
+        try:
+            if user is None:
+                # Run the benchmarks as a temporary superuser (which is not retained)
+                with runner.rollback():
+                    runner.user = users.create_user(
+                        f'benchmark-{uuid.uuid4().hex[:8]}',
+                        is_staff=True,
+                        is_superuser=True,
+                    )
+                    results = runner.run(names)
+            else:
+                results = runner.run(names)
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        results['dataset'] = dataset
+
+        output = json.dumps(results, indent=2)
+
+        if filename := kwargs['output']:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(output)
+
+            logger.info('Benchmark results written to %s', filename)
+        else:
+            self.stdout.write(output)
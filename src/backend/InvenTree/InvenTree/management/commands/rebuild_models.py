@@ -30,6 +30,7 @@ class Command(BaseCommand):
             from part.models import Part
 
             Part.objects.rebuild()
+            Part.tree_changed()
         except Exception:
             logger.info('Error rebuilding Part objects')
 
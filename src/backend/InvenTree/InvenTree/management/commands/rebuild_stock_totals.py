@@ -0,0 +1,34 @@
+"""Custom management command to rebuild the pre-calculated part stock totals.
+
+- Required after enabling the PART_STOCK_TOTALS setting
+- May be required after importing a new dataset, for example
+"""
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Rebuild the PartStockTotal table."""
+
+    def add_arguments(self, parser):
+        """Add the arguments for this command."""
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of parts to recalculate at once',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Recalculate the stock totals for all parts."""
+        from part.models import PartStockTotal
+
+        logger.info('Rebuilding part stock totals')
+
+        n = PartStockTotal.rebuild(batch_size=kwargs['batch_size'])
+
+        logger.info('Rebuilt stock totals for %s parts', n)
@@ -289,6 +289,32 @@ class InvenTreeExceptionProcessor(ExceptionProcessor):
         log_error(path)
 
 
+class InvenTreeQueryStatsMiddleware:
+    """Middleware to record database query statistics for each API request.
+
+    This middleware is only active if the QUERY_STATS setting is enabled.
+    Refer to InvenTree.querystats for further information.
+    """
+
+    def __init__(self, get_response):
+        """Save response object."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Process the request, recording the database queries issued."""
+        from InvenTree.querystats import record_queries, report_stats
+
+        if not settings.QUERY_STATS or not request.path_info.startswith('/api/'):
+            return self.get_response(request)
+
+        with record_queries() as stats:
+            response = self.get_response(request)
+
+        report_stats(request, stats)
+
+        return response
+
+
 class InvenTreeRequestCacheMiddleware(MiddlewareMixin):
     """Middleware to perform caching against the request object.
 
@@ -309,6 +335,44 @@ class InvenTreeRequestCacheMiddleware(MiddlewareMixin):
         return response
 
 
+class InvenTreeStockUpdateMiddleware:
+    """Middleware to coalesce part updates triggered by stock changes during a request.
+
+    Any low-stock checks or pricing updates which are triggered by stock item changes
+    are collected for the duration of the request, and offloaded as a single batch.
+    """
+
+    def __init__(self, get_response):
+        """Save response object."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Process the request within a coalescing scope."""
+        from stock.coalesce import coalesce_part_updates
+
+        with coalesce_part_updates():
+            return self.get_response(request)
+
+
+class InvenTreeEventBatchMiddleware:
+    """Middleware to batch plugin events triggered during a request.
+
+    Any plugin events which are triggered (e.g. when database entries are saved)
+    are collected for the duration of the request, and offloaded as a single batch.
+    """
+
+    def __init__(self, get_response):
+        """Save response object."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Process the request within an event batching scope."""
+        from plugin.base.event.events import batch_events
+
+        with batch_events():
+            return self.get_response(request)
+
+
 class InvenTreeHostSettingsMiddleware(MiddlewareMixin):
     """Middleware to check the host settings.
 
@@ -1,6 +1,8 @@
 """Generic models which provide extra functionality over base Django model types."""
 
+import threading
 from collections.abc import Callable
+from contextlib import contextmanager
 from datetime import datetime
 from string import Formatter
 from typing import Any, Optional
@@ -35,6 +37,9 @@ import InvenTree.sentry
 
 logger = structlog.get_logger('inventree')
 
+# Thread-local storage for the active (deferred) tree update buffer
+_tree_data = threading.local()
+
 
 class DiffMixin:
     """Mixin which can be used to determine which fields have changed, compared to the instance saved to the database."""
@@ -689,6 +694,175 @@ class InvenTreeAttachmentMixin(InvenTreePermissionCheckMixin):
         Attachment.objects.create(**kwargs)
 
 
+class TreeUpdateBuffer:
+    """Collection of trees which require maintenance, deferred until the end of a bulk operation.
+
+    Attributes:
+        trees: Dict of {model class: set of tree_id values} which require a (partial) rebuild
+        paths: Dict of {model class: set of tree_id values} which require a pathstring rebuild
+        moved: Dict of {model class: set of tree_id values} affected by re-parented nodes
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.trees: dict[type, set[int]] = {}
+        self.paths: dict[type, set[int]] = {}
+        self.moved: dict[type, set[int]] = {}
+
+    @staticmethod
+    def repair_tree_ids(model, tree_ids) -> int:
+        """Reassign the tree_id of each node in the provided trees, based on the parent links.
+
+        When nodes are re-parented within a deferred scope, the tree fields of the
+        moved subtrees are calculated from stale (in-memory) values, and may not match the new parent.
+        As a partial rebuild only considers nodes which share the tree_id of the root node,
+        the tree_id of each node must first be corrected.
+
+        Arguments:
+            model: The tree model class
+            tree_ids: The tree_id values affected by re-parented nodes
+
+        Returns:
+            The number of nodes which were updated
+        """
+        opts = model._mptt_meta
+
+        nodes = {
+            pk: (parent, tree_id)
+            for pk, parent, tree_id in model.objects.filter(**{
+                f'{opts.tree_id_attr}__in': tree_ids
+            }).values_list('pk', opts.parent_attr, opts.tree_id_attr)
+        }
+
+        roots: dict[int, int] = {}
+
+        def root_tree_id(pk: int) -> int:
+            """Find the tree_id of the root node for the provided node."""
+            chain = []
+
+            while pk not in roots:
+                chain.append(pk)
+                parent = nodes[pk][0]
+
+                if parent is None or parent not in nodes or parent in chain:
+                    roots[pk] = nodes[pk][1]
+                    break
+
+                pk = parent
+
+            for node in chain:
+                roots[node] = roots[pk]
+
+            return roots[pk]
+
+        updates: dict[int, list[int]] = {}
+
+        for pk, (_parent, tree_id) in nodes.items():
+            if (root_id := root_tree_id(pk)) != tree_id:
+                updates.setdefault(root_id, []).append(pk)
+
+        for tree_id, pks in updates.items():
+            model.objects.filter(pk__in=pks).update(**{opts.tree_id_attr: tree_id})
+
+        return sum(len(pks) for pks in updates.values())
+
+    def flush(self):
+        """Rebuild each of the marked trees (once), and then rebuild the pathstrings.
+
+        If any partial rebuild fails, the entire tree for that model is rebuilt.
+        """
+        for model, tree_ids in self.moved.items():
+            self.repair_tree_ids(model, tree_ids)
+
+        for model, tree_ids in self.trees.items():
+            result = True
+
+            for tree_id in sorted(tree_ids):
+                try:
+                    model.objects.partial_rebuild(tree_id)
+                except Exception as e:
+                    # This is a critical error, explicitly report to sentry
+                    InvenTree.sentry.report_exception(e)
+                    InvenTree.exceptions.log_error(f'{model.__name__}.partial_rebuild')
+                    result = False
+
+            if not result:
+                # Rebuild the entire tree (expensive!!!)
+                model.objects.rebuild()
+                model.tree_changed()
+
+        for model, tree_ids in self.paths.items():
+            model.rebuild_pathstrings(tree_ids)
+
+        self.trees = {}
+        self.paths = {}
+        self.moved = {}
+
+
+def get_tree_buffer() -> Optional[TreeUpdateBuffer]:
+    """Return the active (deferred) tree update buffer for this thread (if any)."""
+    return getattr(_tree_data, 'buffer', None)
+
+
+@contextmanager
+def defer_tree_updates():
+    """Context manager which defers tree maintenance until the end of a bulk operation.
+
+    Within the scope, any tree which would be rebuilt (e.g. when a node is re-parented,
+    or a stock item is split) is instead marked as "dirty".
+    Each dirty tree is rebuilt once when the scope exits, and the pathstrings
+    for any affected trees are then recalculated with a single bulk update.
+
+    The scope is wrapped in a database transaction, so the trees are rebuilt
+    before the changes are committed (and are discarded if an exception is raised).
+    Scopes may be nested - the trees are only rebuilt when the outermost scope exits.
+
+    Note that within the scope, the tree fields (lft, rght, level) of affected nodes may be stale.
+
+    Example:
+        with defer_tree_updates():
+            for item in items:
+                item.splitStock(quantity, location, user)
+    """
+    if get_tree_buffer() is not None:
+        # Already inside a deferred scope
+        yield
+        return
+
+    buffer = TreeUpdateBuffer()
+
+    with transaction.atomic():
+        _tree_data.buffer = buffer
+
+        try:
+            yield
+        finally:
+            _tree_data.buffer = None
+
+        buffer.flush()
+
+
+def queue_tree_rebuild(model, tree_id: int) -> bool:
+    """Mark a tree as requiring a rebuild, if tree updates are deferred.
+
+    Arguments:
+        model: The tree model class
+        tree_id: The tree_id value to rebuild
+
+    Returns:
+        True if the rebuild has been deferred, otherwise False (the caller must rebuild the tree)
+    """
+    buffer = get_tree_buffer()
+
+    if buffer is None:
+        return False
+
+    if tree_id:
+        buffer.trees.setdefault(model, set()).add(tree_id)
+
+    return True
+
+
 class InvenTreeTree(ContentTypeMixin, MPTTModel):
     """Provides an abstracted self-referencing tree model, based on the MPTTModel class.
 
@@ -799,6 +973,9 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
         if not result:
             # Rebuild the entire tree (expensive!!!)
             self.__class__.objects.rebuild()
+            self.__class__.tree_changed()
+        else:
+            self.__class__.tree_changed(trees)
 
     def handle_tree_delete(self, delete_children=False, delete_items=False):
         """Delete a single instance of the tree, based on provided kwargs.
@@ -915,11 +1092,25 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
             # New instance, so we need to rebuild the tree (if it has a parent)
             trees.add(self.tree_id)
 
+        if db_instance and (buffer := get_tree_buffer()):
+            if getattr(db_instance, self.NODE_PARENT_KEY) != parent:
+                # Re-parented node: the tree_id values of the subtree must be repaired
+                moved = buffer.moved.setdefault(self.__class__, set())
+                moved.update(tree_id for tree_id in trees if tree_id)
+
+                if parent and parent.tree_id:
+                    moved.add(parent.tree_id)
+                    trees.add(parent.tree_id)
+
         for tree_id in trees:
             if tree_id:
                 self.partial_rebuild(tree_id)
 
-        if len(trees) > 0:
+        if db_instance and trees:
+            # An existing node has been moved within (or between) trees
+            self.__class__.tree_changed(trees)
+
+        if len(trees) > 0 and get_tree_buffer() is None:
             # A tree update was performed, so we need to refresh the instance
             try:
                 self.refresh_from_db()
@@ -931,11 +1122,25 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
                 InvenTree.sentry.report_exception(e)
                 InvenTree.exceptions.log_error(f'{self.__class__.__name__}.save')
 
+    @classmethod
+    def tree_changed(cls, tree_ids=None):
+        """Called when the structure of one or more trees has changed.
+
+        Subclasses can override this method to invalidate any data which is keyed on the tree_id value.
+
+        Arguments:
+            tree_ids: The tree_id values of the affected trees (or None if all trees have been rebuilt)
+        """
+
     def partial_rebuild(self, tree_id: int) -> bool:
         """Perform a partial rebuild of the tree structure.
 
+        If tree updates are deferred (see defer_tree_updates), the tree is marked for a later rebuild.
         If a failure occurs, log the error and return False.
         """
+        if queue_tree_rebuild(self.__class__, tree_id):
+            return True
+
         try:
             self.__class__.objects.partial_rebuild(tree_id)
             return True
@@ -1062,11 +1267,10 @@ class PathStringMixin(models.Model):
             super().save(*args, **kwargs)
 
             # Bulk-update any child nodes, if applicable
-            lower_nodes = list(
-                self.get_descendants(include_self=False).values_list('pk', flat=True)
-            )
-
-            self.rebuild_lower_nodes(lower_nodes)
+            if buffer := get_tree_buffer():
+                buffer.paths.setdefault(self.__class__, set()).add(self.tree_id)
+            else:
+                self.rebuild_pathstrings([self.tree_id])
 
     def delete(self, *args, **kwargs):
         """Custom delete method for PathStringMixin.
@@ -1104,19 +1308,81 @@ class PathStringMixin(models.Model):
         - This is used when the pathstring for this node is updated, and we need to update all lower nodes.
         - We use a bulk-update to update the pathstring for all lower nodes in the tree.
         """
-        nodes = self.__class__.objects.filter(pk__in=lower_nodes)
+        tree_ids = set(
+            self.__class__.objects
+            .filter(pk__in=lower_nodes)
+            .values_list('tree_id', flat=True)
+            .distinct()
+        )
+
+        if buffer := get_tree_buffer():
+            buffer.paths.setdefault(self.__class__, set()).update(tree_ids)
+        else:
+            self.rebuild_pathstrings(tree_ids)
+
+    @classmethod
+    def rebuild_pathstrings(cls, tree_ids) -> int:
+        """Recalculate the pathstring for every node in the provided trees.
+
+        - All nodes are fetched with a single query
+        - The path for each node is constructed from the path of its parent (without any further queries)
+        - Paths are resolved via the parent links, so stale tree fields (lft, rght) do not affect the result
+        - Any changed pathstrings are written with a single bulk update
+
+        Arguments:
+            tree_ids: The tree_id values of the trees to update
+
+        Returns:
+            The number of nodes which were updated
+        """
+        tree_ids = [tree_id for tree_id in tree_ids if tree_id]
+
+        if not tree_ids:
+            return 0
 
+        nodes = (
+            cls.objects
+            .filter(tree_id__in=tree_ids)
+            .order_by('tree_id', 'lft')
+            .only('pk', 'parent', 'pathstring', cls.PATH_FIELD)
+        )
+
+        nodes = {node.pk: node for node in nodes}
+        paths = {}
         nodes_to_update = []
 
-        for node in nodes:
-            new_path = node.construct_pathstring()
+        def get_path(node) -> list:
+            """Construct the path for a node, from the (cached) paths of its parents."""
+            chain = []
+
+            while node.pk not in paths:
+                chain.append(node)
+                parent = nodes.get(node.parent_id)
+
+                if parent is None or parent in chain:
+                    break
+
+                node = parent
 
-            if new_path != node.pathstring:
-                node.pathstring = new_path
+            for item in reversed(chain):
+                paths[item.pk] = [
+                    *paths.get(item.parent_id, []),
+                    getattr(item, cls.PATH_FIELD),
+                ]
+
+            return paths[chain[0].pk] if chain else paths[node.pk]
+
+        for node in nodes.values():
+            pathstring = InvenTree.helpers.constructPathString(get_path(node))
+
+            if pathstring != node.pathstring:
+                node.pathstring = pathstring
                 nodes_to_update.append(node)
 
-        if len(nodes_to_update) > 0:
-            self.__class__.objects.bulk_update(nodes_to_update, ['pathstring'])
+        if nodes_to_update:
+            cls.objects.bulk_update(nodes_to_update, ['pathstring'], batch_size=500)
+
+        return len(nodes_to_update)
 
     def construct_pathstring(self, refresh: bool = False) -> str:
         """Construct the pathstring for this tree node.
@@ -1331,6 +1597,12 @@ class InvenTreeBarcodeMixin(models.Model):
         """Check if a model instance exists with the specified third-party barcode hash."""
         return cls.objects.filter(barcode_hash=barcode_hash).first()
 
+    def update_barcode_index(self):
+        """Update the barcode index entry for this model instance."""
+        from plugin.base.barcodes.helper import index_barcodes
+
+        index_barcodes([self])
+
     def assign_barcode(
         self,
         barcode_hash: Optional[str] = None,
@@ -1361,6 +1633,7 @@ class InvenTreeBarcodeMixin(models.Model):
 
         if save:
             self.save()
+            self.update_barcode_index()
 
         return True
 
@@ -1370,6 +1643,7 @@ class InvenTreeBarcodeMixin(models.Model):
         self.barcode_hash = ''
 
         self.save()
+        self.update_barcode_index()
 
 
 def notify_staff_users_of_error(instance, label: str, context: dict):
@@ -0,0 +1,248 @@
+"""Custom pagination classes for the InvenTree API.
+
+Limit / offset pagination requires the database to count the entire result set,
+and to scan past every row before the requested offset.
+For very large tables (e.g. stock tracking history) deep pages become progressively slower.
+
+The InvenTreePagination class provides two (opt-in) alternatives:
+
+- Cursor pagination: Provide the 'cursor' query parameter (initially empty) to seek
+  directly to the next page using an indexed ordering key, rather than an offset
+- Skip count: Provide 'skip_count=true' to skip the COUNT(*) query for the result set
+"""
+
+import base64
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from InvenTree.helpers import str2bool
+
+
+class InvenTreePagination(LimitOffsetPagination):
+    """Limit / offset pagination with optional cursor (keyset) pagination.
+
+    By default, this class behaves exactly like the LimitOffsetPagination class.
+
+    If the 'cursor' query parameter is provided, the results are instead ordered by the
+    'cursor_ordering' key of the view (default = 'pk'), and each page is fetched by
+    seeking past the last item of the previous page (WHERE key > value LIMIT n).
+    The 'next' and 'previous' links contain an opaque cursor value for the adjacent pages.
+
+    The cursor ordering key must be unique and indexed (the primary key is recommended).
+    Only the cursor ordering key (ascending or descending) may be used with the 'ordering' parameter.
+
+    If the 'skip_count' query parameter is provided, the total count is not calculated,
+    and the 'count' field of the response is null.
+    """
+
+    cursor_query_param = 'cursor'
+    skip_count_query_param = 'skip_count'
+
+    # Default ordering key for cursor pagination (may be overridden by the view)
+    cursor_ordering = 'pk'
+
+    # Default page size for cursor pagination (if no limit is specified)
+    cursor_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate the queryset, using either limit / offset or cursor pagination."""
+        self.request = request
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        self.skip_count = str2bool(
+            request.query_params.get(self.skip_count_query_param, False)
+        )
+
+        self.next_cursor = None
+        self.previous_cursor = None
+
+        if self.cursor_mode:
+            return self.paginate_cursor(queryset, request, view)
+
+        if not self.skip_count:
+            return super().paginate_queryset(queryset, request, view)
+
+        # Limit / offset pagination, without counting the result set
+        self.limit = self.get_limit(request)
+
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        self.count = None
+
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+
+        return results[: self.limit]
+
+    def get_cursor_ordering(self, request, view) -> tuple[str, bool]:
+        """Return the ordering key and direction for cursor pagination.
+
+        Returns:
+            A tuple of (field, descending)
+
+        Raises:
+            ValidationError: If an unsupported ordering is requested
+        """
+        key = getattr(view, 'cursor_ordering', self.cursor_ordering)
+        field = key.lstrip('-')
+        descending = key.startswith('-')
+
+        if ordering := request.query_params.get('ordering'):
+            if ordering not in [field, f'-{field}']:
+                raise ValidationError({
+                    'ordering': _(
+                        'Cursor pagination only supports ordering by {field}'
+                    ).format(field=field)
+                })
+
+            descending = ordering.startswith('-')
+
+        return field, descending
+
+    def decode_cursor(self, request) -> tuple:
+        """Decode the cursor value provided in the request.
+
+        Returns:
+            A tuple of (position, reverse), or (None, False) for the first page
+
+        Raises:
+            NotFound: If the cursor value is invalid
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if not encoded:
+            return None, False
+
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            return data['p'], bool(data.get('r', False))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(_('Invalid cursor'))
+
+    def encode_cursor(self, position, reverse: bool = False) -> str:
+        """Encode a cursor value for the provided position."""
+        data = json.dumps({'p': position, 'r': reverse}, cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    def paginate_cursor(self, queryset, request, view=None):
+        """Return a single page of results, by seeking on the cursor ordering key."""
+        field, descending = self.get_cursor_ordering(request, view)
+        position, reverse = self.decode_cursor(request)
+
+        self.limit = self.get_limit(request) or self.cursor_page_size
+        self.count = None if self.skip_count else self.get_count(queryset)
+
+        # When fetching the previous page, seek in the opposite direction
+        seek_descending = descending != reverse
+
+        if position is not None:
+            lookup = 'lt' if seek_descending else 'gt'
+            queryset = queryset.filter(**{f'{field}__{lookup}': position})
+
+        queryset = queryset.order_by(f'-{field}' if seek_descending else field)
+
+        results = list(queryset[: self.limit + 1])
+        has_more = len(results) > self.limit
+        results = results[: self.limit]
+
+        if reverse:
+            results.reverse()
+
+        if results:
+            first = getattr(results[0], field)
+            last = getattr(results[-1], field)
+
+            if has_more or reverse:
+                self.next_cursor = self.encode_cursor(last)
+
+            if (has_more and reverse) or (position is not None and not reverse):
+                self.previous_cursor = self.encode_cursor(first, reverse=True)
+
+        return results
+
+    def get_next_link(self):
+        """Return the link to the next page of results."""
+        url = self.request.build_absolute_uri()
+
+        if self.cursor_mode:
+            if self.next_cursor is None:
+                return None
+
+            url = remove_query_param(url, self.offset_query_param)
+            return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+        if self.count is None:
+            if not self.has_next:
+                return None
+
+            url = replace_query_param(url, self.limit_query_param, self.limit)
+            return replace_query_param(
+                url, self.offset_query_param, self.offset + self.limit
+            )
+
+        return super().get_next_link()
+
+    def get_previous_link(self):
+        """Return the link to the previous page of results."""
+        if self.cursor_mode:
+            if self.previous_cursor is None:
+                return None
+
+            url = remove_query_param(
+                self.request.build_absolute_uri(), self.offset_query_param
+            )
+            return replace_query_param(
+                url, self.cursor_query_param, self.previous_cursor
+            )
+
+        return super().get_previous_link()
+
+    def get_paginated_response(self, data):
+        """Return the paginated response data."""
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        """Return the schema for the paginated response (count may be null)."""
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties']['count']['nullable'] = True
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        """Return the schema parameters for pagination."""
+        parameters = super().get_schema_operation_parameters(view)
+
+        parameters.extend([
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(
+                    _(
+                        'Cursor value for keyset pagination (provide an empty value to fetch the first page)'
+                    )
+                ),
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.skip_count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(_('Skip calculation of the total result count')),
+                'schema': {'type': 'boolean'},
+            },
+        ])
+
+        return parameters
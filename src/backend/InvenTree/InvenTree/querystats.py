@@ -0,0 +1,239 @@
+"""Per-request database query statistics for API views.
+
+When enabled (via the QUERY_STATS setting), each request is instrumented to record:
+
+- The number of database queries issued, and the total time spent in the database
+- The time spent serializing model instances (and the queries issued while serializing)
+- Repeated query "shapes" - the same parameterized SQL issued many times in one request,
+  which is the signature of an N+1 query pattern
+
+The recorded statistics are attached to the active OpenTelemetry span,
+and exported as OpenTelemetry metrics (see InvenTree.tracing).
+Repeated query shapes are logged as warnings.
+
+A per-view query budget can also be specified, either using the 'query_budget' attribute
+of the view class, or the QUERY_BUDGETS setting (a mapping of URL name to maximum query count).
+Exceeding the query budget is logged as a warning,
+or raises a QueryBudgetExceededError if the QUERY_BUDGETS_STRICT setting is enabled.
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Optional
+
+from django.conf import settings
+from django.db import connection
+
+import structlog
+from opentelemetry import metrics, trace
+
+logger = structlog.get_logger('inventree')
+
+# Thread-local storage for the active query statistics
+_thread_data = threading.local()
+
+# Collapse variable-length parameter lists e.g. "IN (%s, %s, %s)" -> "IN (...)"
+PARAM_LIST_REGEX = re.compile(r'\((?:\s*%s\s*,)+\s*%s\s*\)')
+
+meter = metrics.get_meter('inventree.querystats')
+
+QUERY_COUNT = meter.create_histogram(
+    'inventree.api.queries',
+    unit='{query}',
+    description='Number of database queries issued per API request',
+)
+
+DB_TIME = meter.create_histogram(
+    'inventree.api.db_time',
+    unit='ms',
+    description='Time spent in the database per API request',
+)
+
+SERIALIZER_TIME = meter.create_histogram(
+    'inventree.api.serializer_time',
+    unit='ms',
+    description='Time spent serializing data per API request',
+)
+
+DUPLICATE_QUERIES = meter.create_counter(
+    'inventree.api.duplicate_queries',
+    unit='{query}',
+    description='Number of repeated (N+1) database queries issued by API requests',
+)
+
+
+class QueryBudgetExceededError(AssertionError):
+    """Raised (in strict mode) when a view exceeds its query budget."""
+
+
+class QueryStats:
+    """Database query statistics for a single request.
+
+    Attributes:
+        queries: Total number of queries issued
+        db_time: Total time spent executing queries (seconds)
+        serializer_time: Total time spent serializing model instances (seconds)
+        serializer_queries: Number of queries issued while serializing model instances
+        shapes: Counter of {normalized SQL: count}
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.queries = 0
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.serializer_queries = 0
+        self.shapes: Counter = Counter()
+
+        # Depth of nested serializer calls (only the outermost call is timed)
+        self.serializer_depth = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """Database execute wrapper, which records each query."""
+        t1 = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - t1
+            self.queries += 1
+
+            if self.serializer_depth > 0:
+                self.serializer_queries += 1
+
+            self.shapes[PARAM_LIST_REGEX.sub('(...)', sql)] += 1
+
+    def duplicates(self, threshold: int) -> dict[str, int]:
+        """Return the query shapes which were repeated at least 'threshold' times."""
+        return {sql: n for sql, n in self.shapes.items() if n >= threshold}
+
+
+def get_active_stats() -> Optional[QueryStats]:
+    """Return the query statistics being recorded for this thread (if any)."""
+    return getattr(_thread_data, 'stats', None)
+
+
+@contextmanager
+def record_queries():
+    """Context manager which records database query statistics.
+
+    Yields:
+        QueryStats: The statistics recorded for the wrapped block
+
+    Example:
+        with record_queries() as stats:
+            response = view(request)
+
+        print(stats.queries, stats.db_time)
+    """
+    stats = QueryStats()
+    previous = get_active_stats()
+    _thread_data.stats = stats
+
+    try:
+        with connection.execute_wrapper(stats):
+            yield stats
+    finally:
+        _thread_data.stats = previous
+
+
+@contextmanager
+def time_serializer():
+    """Context manager which records the time spent serializing data.
+
+    Nested calls (e.g. for nested serializers) are only counted once.
+    """
+    stats = get_active_stats()
+
+    if stats is None:
+        yield
+        return
+
+    stats.serializer_depth += 1
+    t1 = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        stats.serializer_depth -= 1
+
+        if stats.serializer_depth == 0:
+            stats.serializer_time += time.perf_counter() - t1
+
+
+def get_query_budget(request) -> Optional[int]:
+    """Return the query budget for the view which handled the provided request.
+
+    The QUERY_BUDGETS setting (keyed by URL name) takes precedence over the 'query_budget' view attribute.
+    """
+    match = getattr(request, 'resolver_match', None)
+
+    if match is None:
+        return None
+
+    budgets = getattr(settings, 'QUERY_BUDGETS', None) or {}
+
+    if match.url_name in budgets:
+        return int(budgets[match.url_name])
+
+    view = getattr(match.func, 'view_class', None) or getattr(match.func, 'cls', None)
+
+    return getattr(view, 'query_budget', None)
+
+
+def report_stats(request, stats: QueryStats):
+    """Report the query statistics for a completed request.
+
+    - Statistics are exported as OpenTelemetry metrics (and attached to the active span)
+    - Repeated query shapes (possible N+1 queries) are logged
+    - The query budget for the view is checked
+
+    Raises:
+        QueryBudgetExceededError: If the query budget is exceeded (in strict mode only)
+    """
+    match = getattr(request, 'resolver_match', None)
+    view_name = (match.url_name or match.view_name) if match else 'unknown'
+
+    attributes = {'view': view_name or 'unknown', 'method': request.method}
+
+    duplicates = stats.duplicates(settings.QUERY_STATS_DUPLICATE_THRESHOLD)
+    n_duplicates = sum(duplicates.values())
+
+    QUERY_COUNT.record(stats.queries, attributes)
+    DB_TIME.record(stats.db_time * 1000, attributes)
+    SERIALIZER_TIME.record(stats.serializer_time * 1000, attributes)
+
+    if n_duplicates:
+        DUPLICATE_QUERIES.add(n_duplicates, attributes)
+
+    span = trace.get_current_span()
+
+    if span.is_recording():
+        span.set_attributes({
+            'inventree.queries': stats.queries,
+            'inventree.db_time_ms': stats.db_time * 1000,
+            'inventree.serializer_time_ms': stats.serializer_time * 1000,
+            'inventree.serializer_queries': stats.serializer_queries,
+            'inventree.duplicate_queries': n_duplicates,
+        })
+
+    for sql, n in duplicates.items():
+        logger.warning(
+            'Possible N+1 query in view %s: query repeated %s times: %s',
+            view_name,
+            n,
+            sql[:500],
+        )
+
+    budget = get_query_budget(request)
+
+    if budget is not None and stats.queries > budget:
+        msg = f'Query budget exceeded for view {view_name}: {stats.queries} queries (budget {budget})'
+
+        if settings.QUERY_BUDGETS_STRICT:
+            raise QueryBudgetExceededError(msg)
+
+        logger.warning(msg)
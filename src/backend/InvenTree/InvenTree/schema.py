@@ -107,7 +107,7 @@ class ExtendedAutoSchema(AutoSchema):
         # what the schema defines to be the expected result. This forces limit to be present, producing the expected
         # type.
         pagination_class = getattr(self.view, 'pagination_class', None)
-        if pagination_class and pagination_class == LimitOffsetPagination:
+        if pagination_class and issubclass(pagination_class, LimitOffsetPagination):
             for parameter in parameters:
                 if parameter['name'] == 'limit':
                     parameter['required'] = True
@@ -32,6 +32,7 @@ from common.currency import currency_code_default, currency_code_mappings
 from InvenTree.fields import InvenTreeRestURLField, InvenTreeURLField
 from InvenTree.helpers import str2bool
 from InvenTree.helpers_model import getModelsWithMixin
+from InvenTree.querystats import get_active_stats, time_serializer
 
 
 @dataclass
@@ -600,6 +601,14 @@ class InvenTreeModelSerializer(serializers.ModelSerializer):
         """
         return []
 
+    def to_representation(self, instance):
+        """Serialize the instance, recording the time taken (if query statistics are enabled)."""
+        if get_active_stats() is None:
+            return super().to_representation(instance)
+
+        with time_serializer():
+            return super().to_representation(instance)
+
     def save(self, **kwargs):
         """Catch any django ValidationError thrown at the moment `save` is called, and re-throw as a DRF ValidationError."""
         try:
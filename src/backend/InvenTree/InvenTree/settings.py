@@ -385,7 +385,10 @@ MIDDLEWARE = CONFIG.get(
         'oauth2_provider.middleware.OAuth2TokenMiddleware',  # oauth2_provider
         'maintenance_mode.middleware.MaintenanceModeMiddleware',
         'InvenTree.middleware.InvenTreeExceptionProcessor',  # Error reporting
+        'InvenTree.middleware.InvenTreeQueryStatsMiddleware',  # Database query statistics
         'InvenTree.middleware.InvenTreeRequestCacheMiddleware',  # Request caching
+        'InvenTree.middleware.InvenTreeStockUpdateMiddleware',  # Coalesce stock-triggered updates
+        'InvenTree.middleware.InvenTreeEventBatchMiddleware',  # Batch plugin events
         'InvenTree.middleware.InvenTreeHostSettingsMiddleware',  # Ensuring correct hosting/security settings
         'django_structlog.middlewares.RequestMiddleware',  # Structured logging
         'InvenTree.middleware.InvenTreeVersionHeaderMiddleware',
@@ -600,11 +603,55 @@ TRACING_DETAILS: Optional[dict] = tracing.configure_tracing(
     DB_ENGINE, TRACING_ENABLED, inventree_tags
 )
 
+# Record database query statistics for each API request
+# Enabled by default if tracing is enabled (statistics are exported as OpenTelemetry metrics)
+QUERY_STATS = get_boolean_setting(
+    'INVENTREE_QUERY_STATS', 'query_stats', TRACING_ENABLED
+)
+
+# Number of repeats of the same query (within a request) which indicates an N+1 query
+QUERY_STATS_DUPLICATE_THRESHOLD = get_setting(
+    'INVENTREE_QUERY_STATS_DUPLICATE_THRESHOLD',
+    'query_stats_duplicate_threshold',
+    10,
+    typecast=int,
+)
+
+# Maximum number of database queries for specific API views (keyed by URL name)
+QUERY_BUDGETS = get_setting(
+    'INVENTREE_QUERY_BUDGETS', 'query_budgets', {}, typecast=dict
+)
+
+# Raise an error (rather than logging a warning) if a query budget is exceeded
+QUERY_BUDGETS_STRICT = get_boolean_setting(
+    'INVENTREE_QUERY_BUDGETS_STRICT', 'query_budgets_strict', False
+)
+
 # Cache configuration
 GLOBAL_CACHE_ENABLED = is_global_cache_enabled()
 
 CACHES = {'default': get_cache_config(GLOBAL_CACHE_ENABLED)}
 
+# Number of subprocesses used to render PDF reports in parallel (background worker only)
+REPORT_RENDER_WORKERS = get_setting(
+    'INVENTREE_REPORT_WORKERS', 'report.workers', 1, typecast=int
+)
+
+# Number of worker threads used to run global search queries concurrently
+SEARCH_WORKERS = get_setting(
+    'INVENTREE_SEARCH_WORKERS', 'search.workers', 4, typecast=int
+)
+
+# Time budget (in seconds) for global search queries
+SEARCH_TIMEOUT = get_setting(
+    'INVENTREE_SEARCH_TIMEOUT', 'search.timeout', 10, typecast=float
+)
+
+# Maintain (and read from) the pre-calculated part stock totals table
+PART_STOCK_TOTALS = get_boolean_setting(
+    'INVENTREE_PART_STOCK_TOTALS', 'part_stock_totals', False
+)
+
 # Background task processing with django-q
 Q_CLUSTER = worker.get_worker_config(
     DB_ENGINE,
@@ -1,12 +1,16 @@
 """Provides system status functionality checks."""
 
+import time
 from datetime import timedelta
 
 from django.conf import settings
+from django.core.cache import cache
+from django.dispatch import receiver
 from django.utils import timezone
 
 import structlog
 from django_q.models import Success
+from django_q.signals import post_spawn
 from django_q.status import Stat
 
 import InvenTree.helpers_email
@@ -15,8 +19,71 @@ import InvenTree.ready
 logger = structlog.get_logger('inventree')
 
 
-def is_worker_running(**kwargs):
-    """Return True if the background worker process is operational."""
+# Number of seconds for which a worker status is considered fresh
+WORKER_STATUS_TTL = 30
+
+# Number of seconds for which a worker status pushed by the worker itself is retained in the global cache
+# Note: Once older than WORKER_STATUS_TTL, the retained status is confirmed by probing the cluster
+WORKER_HEARTBEAT_TTL = 10 * 60
+
+WORKER_STATUS_CACHE_KEY = 'worker-status'
+
+# Process-local copy of the worker status, as a tuple of (expiry, running)
+_worker_status: tuple[float, bool] | None = None
+
+
+def set_worker_status(running: bool, ttl: float = WORKER_STATUS_TTL, shared=True):
+    """Record the status of the background worker.
+
+    The status is stored in process memory, and also in the global cache
+    (along with the time at which it was recorded), so that it is available to other processes.
+
+    Arguments:
+        running: True if the background worker is running
+        ttl: Number of seconds for which the status is considered fresh
+        shared: If False, the status is only stored in process memory
+    """
+    global _worker_status
+
+    _worker_status = (time.monotonic() + ttl, running)
+
+    if not shared:
+        return
+
+    try:
+        cache.set(WORKER_STATUS_CACHE_KEY, (running, time.time()), timeout=ttl)
+    except Exception:
+        # The cache may not be available
+        pass
+
+
+def clear_worker_status():
+    """Clear any cached background worker status."""
+    global _worker_status
+
+    _worker_status = None
+
+    try:
+        cache.delete(WORKER_STATUS_CACHE_KEY)
+    except Exception:
+        # The cache may not be available
+        pass
+
+
+@receiver(post_spawn, dispatch_uid='worker_status_spawn')
+def worker_spawned(sender, proc_name, **kwargs):
+    """Mark the background worker as running, when a worker process is spawned."""
+    set_worker_status(True, ttl=WORKER_HEARTBEAT_TTL)
+
+
+def worker_stopped():
+    """Mark the background worker as stopped, when the worker cluster exits."""
+    logger.info('Background worker stopped')
+    set_worker_status(False, ttl=WORKER_HEARTBEAT_TTL)
+
+
+def probe_worker_running() -> bool:
+    """Determine if the background worker is running, by inspecting the cluster status."""
     clusters = Stat.get_all()
 
     if len(clusters) > 0:
@@ -44,6 +111,42 @@ def is_worker_running(**kwargs):
     return result
 
 
+def is_worker_running(**kwargs):
+    """Return True if the background worker process is operational.
+
+    The result is cached for a short period, so that repeated calls
+    (e.g. when offloading many tasks) do not perform any I/O.
+
+    The cached status is provided by (in order of preference):
+
+    - The process-local status (if fresh)
+    - The global cache (updated by the worker heartbeat, and when the worker starts or stops)
+    - Probing the cluster status (and the heartbeat results)
+
+    A status in the global cache which is older than WORKER_STATUS_TTL is confirmed by probing,
+    so that a worker which has stopped unexpectedly is detected promptly.
+    """
+    status = _worker_status
+
+    if status is not None and status[0] > time.monotonic():
+        return status[1]
+
+    try:
+        running, timestamp = cache.get(WORKER_STATUS_CACHE_KEY)
+        age = time.time() - timestamp
+    except Exception:
+        # The cache may not be available, or the status is missing
+        running, age = None, None
+
+    if running is None or age > WORKER_STATUS_TTL:
+        running = probe_worker_running()
+        set_worker_status(running)
+    else:
+        set_worker_status(running, ttl=WORKER_STATUS_TTL - age, shared=False)
+
+    return running
+
+
 def check_system_health(**kwargs):
     """Check that the InvenTree system is running OK.
 
@@ -1,8 +1,10 @@
 """Functions for tasks and a few general async tasks."""
 
+import hashlib
 import json
 import os
 import re
+import threading
 import warnings
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -158,11 +160,72 @@ def record_task_success(task_name: str):
     set_global_setting(f'_{task_name}_SUCCESS', datetime.now().isoformat(), None)
 
 
+# Maximum age of a task fingerprint before it is ignored for duplicate detection
+TASK_FINGERPRINT_MAX_AGE = timedelta(hours=1)
+
+
+def _canonical_task_arg(value):
+    """Convert a task argument into a stable, JSON-serializable representation.
+
+    Model instances are represented by their model label and primary key,
+    so that two references to the same database object are treated as identical.
+    """
+    from django.db.models import Model
+
+    if isinstance(value, Model):
+        return f'{value._meta.label_lower}:{value.pk}'
+
+    if isinstance(value, dict):
+        return {str(k): _canonical_task_arg(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_canonical_task_arg(v) for v in value]
+
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical_task_arg(v) for v in value), key=repr)
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if callable(value):
+        return f'{value.__module__}.{value.__qualname__}'
+
+    return repr(value)
+
+
+def task_fingerprint(taskname, group: str, *args, **kwargs) -> str:
+    """Return a hashed "fingerprint" which uniquely identifies a task.
+
+    Two tasks with the same function, group, args and kwargs share the same fingerprint.
+
+    Arguments:
+        taskname: The task function (or the name of the task function, in the format 'app.module.function')
+        group: The group that the task belongs to
+        *args: Positional arguments for the task
+        **kwargs: Keyword arguments for the task
+    """
+    data = json.dumps(
+        {
+            'func': _canonical_task_arg(taskname),
+            'group': group,
+            'args': _canonical_task_arg(args),
+            'kwargs': _canonical_task_arg(kwargs),
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
 def check_existing_task(taskname, group: str, *args, **kwargs) -> Optional[str]:
     """Test if an identical task is already registered with the worker.
 
     This will only return true if the task name, group, args and kwargs all match an existing task.
 
+    Rather than inspecting every task in the queue, the task "fingerprint" is looked up in an indexed table.
+    Fingerprints are recorded when a task is offloaded, and removed when the worker runs the task.
+
     Arguments:
         taskname: The name of the task to check for, in the format 'app.module.function'
         group: The group that the task belongs to
@@ -172,33 +235,27 @@ def check_existing_task(taskname, group: str, *args, **kwargs) -> Optional[str]:
     Returns:
         Optional[str]: The ID of the matching task, if found, otherwise None
     """
-    from django_q.models import OrmQ
+    from common.models import TaskFingerprint
 
-    task_id = None
+    fingerprint = task_fingerprint(taskname, group, *args, **kwargs)
 
-    # Iterate through all available tasks, with the most recent first
-    for task in OrmQ.objects.all().order_by('-id'):
-        if task.func() != taskname and task.task['func'] != taskname:
-            # Task does not match
-            continue
-
-        if task.group() != group:
-            # Group does not match
-            continue
+    try:
+        return TaskFingerprint.lookup(fingerprint, TASK_FINGERPRINT_MAX_AGE)
+    except (OperationalError, ProgrammingError):  # pragma: no cover
+        return None
 
-        if task.args() != args:
-            # Task args do not match
-            continue
 
-        if task.kwargs() != kwargs:
-            # Task kwargs do not match
-            continue
+# Thread-local storage for the fingerprint of the task which is being offloaded
+_task_data = threading.local()
 
-        task_id = task.task_id()
 
-        break
+def get_pending_task_fingerprint() -> Optional[str]:
+    """Return the fingerprint of the task which is currently being offloaded (if any).
 
-    return task_id
+    The fingerprint is recorded (against the ID of the task) by the pre_enqueue signal handler,
+    before the task is added to the queue - so that the worker cannot run the task before it is recorded.
+    """
+    return getattr(_task_data, 'fingerprint', None)
 
 
 def offload_task(
@@ -266,7 +323,16 @@ def offload_task(
         try:
             task = AsyncTask(taskname, *args, group=group, **kwargs)
             with tracer.start_as_current_span(f'async worker: {taskname}'):
-                task.run()
+                # Record the task fingerprint (when queued), so that duplicates can be detected
+                if check_duplicates:
+                    _task_data.fingerprint = task_fingerprint(
+                        taskname, group, *args, **kwargs
+                    )
+
+                try:
+                    task.run()
+                finally:
+                    _task_data.fingerprint = None
 
                 # Return the ID of the offloaded task, so that it can be tracked if needed
                 return task.id
@@ -459,6 +525,13 @@ def heartbeat():
         logger.info('Could not perform heartbeat task - App registry not ready')
         return
 
+    from InvenTree.ready import isInWorkerThread
+    from InvenTree.status import WORKER_HEARTBEAT_TTL, set_worker_status
+
+    if isInWorkerThread():
+        # Record that the background worker is running
+        set_worker_status(True, ttl=WORKER_HEARTBEAT_TTL)
+
     threshold = timezone.now() - timedelta(minutes=30)
 
     # Delete heartbeat results more than half an hour old,
@@ -498,6 +571,30 @@ def delete_successful_tasks():
         )
 
 
+@tracer.start_as_current_span('delete_old_task_fingerprints')
+@scheduled_task(ScheduledTask.DAILY)
+def delete_old_task_fingerprints():
+    """Delete task fingerprints which were never cleared by the worker.
+
+    This may happen if a task is removed from the queue (or the queue is flushed) before it is run.
+    """
+    try:
+        from common.models import TaskFingerprint
+
+        threshold = timezone.now() - TASK_FINGERPRINT_MAX_AGE
+
+        results = TaskFingerprint.objects.filter(created__lte=threshold)
+
+        if results.count() > 0:
+            logger.info('Deleting %s stale task fingerprints', results.count())
+            results.delete()
+
+    except AppRegistryNotReady:  # pragma: no cover
+        logger.info(
+            "Could not perform 'delete_old_task_fingerprints' - App registry not ready"
+        )
+
+
 @tracer.start_as_current_span('delete_failed_tasks')
 @scheduled_task(ScheduledTask.DAILY)
 def delete_failed_tasks():
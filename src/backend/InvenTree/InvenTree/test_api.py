@@ -1,14 +1,17 @@
 """Low level tests for the InvenTree API."""
 
+import threading
 from base64 import b64encode
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
+from django.test import override_settings
 from django.urls import reverse
 
 from rest_framework import status
 
-from InvenTree.api import read_license_file
+from InvenTree.api import APISearchView, get_search_executor, read_license_file
 from InvenTree.api_version import INVENTREE_API_VERSION
 from InvenTree.unit_test import InvenTreeAPITestCase, InvenTreeTestCase
 from InvenTree.version import inventreeApiText, parse_version_text
@@ -287,6 +290,8 @@ class BulkDeleteTests(InvenTreeAPITestCase):
         self.assertIn('Items must be provided as a list', str(response.data))
 
 
+# Test data is not visible to the database connections of the search worker threads
+@override_settings(SEARCH_WORKERS=1)
 class SearchTests(InvenTreeAPITestCase):
     """Unit tests for global search endpoint."""
 
@@ -432,6 +437,56 @@ class SearchTests(InvenTreeAPITestCase):
         # No results again
         self.assertEqual(response.data['build']['count'], 0)
 
+    @override_settings(SEARCH_WORKERS=3)
+    def test_concurrent_search(self):
+        """Test that slow search queries do not block other results."""
+        release = threading.Event()
+
+        def slow_search():
+            release.wait(10)
+            return {'count': 2}
+
+        def failed_search():
+            raise ValueError('Invalid search')
+
+        view = APISearchView()
+
+        try:
+            results = view.run_searches(
+                {
+                    'part': lambda: {'count': 1},
+                    'build': slow_search,
+                    'stockitem': failed_search,
+                },
+                timeout=0.5,
+            )
+        finally:
+            release.set()
+
+        self.assertEqual(results['part'], {'count': 1})
+        self.assertTrue(results['build']['timeout'])
+        self.assertEqual(results['stockitem'], {'error': 'Invalid search'})
+
+    @override_settings(SEARCH_WORKERS=4)
+    def test_search_threads(self):
+        """Test that the search endpoint runs each query in a worker thread."""
+
+        def search_model(view, request, *args, **kwargs):
+            return {'count': 0, 'thread': threading.get_ident()}
+
+        with mock.patch.object(APISearchView, 'search_model', side_effect=search_model):
+            response = self.post(
+                reverse('api-search'),
+                {'search': 'x', 'part': {}, 'build': {}},
+                expected_code=200,
+            )
+
+        for key in ['part', 'build']:
+            self.assertNotEqual(response.data[key]['thread'], threading.get_ident())
+
+        # The worker threads are shared between requests
+        self.assertIs(get_search_executor(4), get_search_executor(4))
+
     def test_permissions(self):
         """Test that users with insufficient permissions are handled correctly."""
         # First, remove all roles
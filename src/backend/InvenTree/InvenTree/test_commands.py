@@ -1,10 +1,12 @@
 """Tests for custom InvenTree management commands."""
 
+import json
 from pathlib import Path
 
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.test import TestCase
 
 from opentelemetry.instrumentation.sqlite3 import SQLite3Instrumentor
@@ -212,3 +214,54 @@ class CommandTestCase(TestCase):
         if settings.TRACING_ENABLED:  # pragma: no cover
             print('Re-enabling tracing for backup command test')
             SQLite3Instrumentor().instrument()
+
+    def test_benchmark(self):
+        """Test the benchmark command against a (very small) synthetic dataset."""
+        from part.models import BomItem, Part
+        from stock.models import StockItem
+
+        output_path = get_testfolder_dir().joinpath('benchmark.json').resolve()
+
+        call_command(
+            'benchmark',
+            parts=40,
+            stock=100,
+            orders=2,
+            builds=1,
+            depth=2,
+            repeat=1,
+            only='part_list,stock_list,build_auto_allocate',
+            output=str(output_path),
+            verbosity=0,
+        )
+
+        data = json.loads(output_path.read_text())
+        output_path.unlink()
+
+        self.assertEqual(data['dataset']['Part'], Part.objects.count())
+        self.assertEqual(data['dataset']['StockItem'], 100)
+        self.assertGreater(BomItem.objects.count(), 0)
+
+        self.assertEqual(
+            set(data['results'].keys()),
+            {'part_list', 'stock_list', 'build_auto_allocate'},
+        )
+
+        for result in data['results'].values():
+            self.assertNotIn('error', result)
+            self.assertEqual(result['runs'], 1)
+            self.assertGreater(result['queries'], 0)
+
+        # Benchmark runs are rolled back
+        self.assertEqual(StockItem.objects.count(), 100)
+
+        # No (permanent) user account is created for the benchmarks
+        self.assertFalse(User.objects.exists())
+
+        # An unknown user account is rejected
+        with self.assertRaises(CommandError):
+            call_command('benchmark', skip_generate=True, user='nobody', verbosity=0)
+
+        # The dataset is not generated into a non-empty database
+        with self.assertRaises(CommandError):
+            call_command('benchmark', parts=10, stock=10, verbosity=0)
@@ -304,3 +304,55 @@ class MiddlewareTests(InvenTreeTestCase):
                 'INVE-E7: The visited path `http://testserver` does not match',
                 status_code=500,
             )
+
+    def test_query_stats(self):
+        """Test the query statistics middleware."""
+        from InvenTree.querystats import QueryBudgetExceededError, record_queries
+        from part.models import Part
+        from part.serializers import PartBriefSerializer
+
+        for idx in range(5):
+            Part.objects.create(name=f'Part {idx}', description='A part')
+
+        with record_queries() as stats:
+            for part in Part.objects.all():
+                Part.objects.filter(pk=part.pk).exists()
+
+            PartBriefSerializer(Part.objects.all(), many=True).data
+
+        # Repeated queries are collapsed to a single query shape
+        # (the explicit lookup above, and the per-part pricing lookup in the serializer)
+        self.assertGreaterEqual(stats.queries, 7)
+        duplicates = stats.duplicates(5)
+        self.assertEqual(len(duplicates), 2)
+        self.assertTrue(all(n == 5 for n in duplicates.values()))
+        self.assertEqual(
+            len([sql for sql in duplicates if sql.startswith('SELECT %s AS "a"')]), 1
+        )
+        self.assertGreater(stats.db_time, 0)
+        self.assertGreater(stats.serializer_time, 0)
+
+        url = reverse('api-part-list')
+        self.assignRole('part.view')
+
+        with self.settings(QUERY_STATS=True, QUERY_BUDGETS={'api-part-list': 500}):
+            self.check_path(url)
+
+        # Exceeding the budget is logged as a warning
+        with self.settings(QUERY_STATS=True, QUERY_BUDGETS={'api-part-list': 1}):
+            self.check_path(url)
+
+        # Exceeding the budget raises an error in strict mode
+        with (
+            self.settings(
+                QUERY_STATS=True,
+                QUERY_BUDGETS={'api-part-list': 1},
+                QUERY_BUDGETS_STRICT=True,
+            ),
+            self.assertRaises(QueryBudgetExceededError),
+        ):
+            self.check_path(url)
+
+        # Budget is not checked if query statistics are disabled
+        with self.settings(QUERY_STATS=False, QUERY_BUDGETS={'api-part-list': 1}):
+            self.check_path(url)
@@ -1,7 +1,9 @@
 """Unit tests for task management."""
 
 import os
+import time
 from datetime import timedelta
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth.models import User
@@ -11,6 +13,7 @@ from django.test import TestCase
 from django.utils import timezone
 
 from django_q.models import OrmQ, Schedule, Task
+from django_q.signals import pre_execute
 from error_report.models import Error
 
 import InvenTree.tasks
@@ -92,6 +95,51 @@ class InvenTreeTaskTests(PluginRegistryMixin, TestCase):
         """Test the task heartbeat."""
         InvenTree.tasks.offload_task(InvenTree.tasks.heartbeat)
 
+    def test_worker_status(self):
+        """Test that the background worker status is cached."""
+        import InvenTree.status
+
+        InvenTree.status.clear_worker_status()
+
+        try:
+            with mock.patch(
+                'InvenTree.status.probe_worker_running', return_value=True
+            ) as probe:
+                self.assertTrue(InvenTree.status.is_worker_running())
+                self.assertTrue(InvenTree.status.is_worker_running())
+
+                # The cluster status is only probed once
+                self.assertEqual(probe.call_count, 1)
+
+                # Status pushed by the worker is used without probing
+                InvenTree.status.worker_stopped()
+                self.assertFalse(InvenTree.status.is_worker_running())
+
+                # Status is shared via the global cache
+                InvenTree.status.set_worker_status(True, shared=False)
+                InvenTree.status._worker_status = None
+                self.assertFalse(InvenTree.status.is_worker_running())
+                self.assertEqual(probe.call_count, 1)
+
+                # Missing status is probed again
+                InvenTree.status.clear_worker_status()
+                self.assertTrue(InvenTree.status.is_worker_running())
+                self.assertEqual(probe.call_count, 2)
+
+                # Status pushed by the worker is confirmed by probing once it is stale
+                InvenTree.status.worker_stopped()
+                InvenTree.status._worker_status = None
+
+                with mock.patch(
+                    'InvenTree.status.time.time',
+                    return_value=time.time() + InvenTree.status.WORKER_STATUS_TTL + 1,
+                ):
+                    self.assertTrue(InvenTree.status.is_worker_running())
+
+                self.assertEqual(probe.call_count, 3)
+        finally:
+            InvenTree.status.clear_worker_status()
+
     def test_task_delete_successful_tasks(self):
         """Test the task delete_successful_tasks."""
         from django_q.models import Success
@@ -365,3 +413,86 @@ class InvenTreeTaskTests(PluginRegistryMixin, TestCase):
 
         # 20 more tasks should have been added
         self.assertEqual(OrmQ.objects.count(), 41)
+
+        # Running the task clears the fingerprint, so it can be queued again
+        task_id = InvenTree.tasks.check_existing_task(
+            'dummy_module.dummy_function_x',
+            'inventree',
+            1,
+            2,
+            3,
+            animal='cat',
+            vegetable='carrot',
+        )
+
+        self.assertIsNotNone(task_id)
+
+        pre_execute.send(sender='django_q', func=None, task={'id': task_id})
+
+        self.assertIsNone(
+            InvenTree.tasks.check_existing_task(
+                'dummy_module.dummy_function_x',
+                'inventree',
+                1,
+                2,
+                3,
+                animal='cat',
+                vegetable='carrot',
+            )
+        )
+
+    def test_task_fingerprint(self):
+        """Test that task fingerprints are stable and canonical."""
+        from InvenTree.tasks import task_fingerprint
+
+        fp = task_fingerprint('a.b.c', 'group', 1, 2, x={'b': 1, 'a': 2})
+
+        # Keyword argument order does not matter
+        self.assertEqual(
+            fp, task_fingerprint('a.b.c', 'group', 1, 2, x={'a': 2, 'b': 1})
+        )
+
+        # Function references match the equivalent function name
+        self.assertEqual(
+            task_fingerprint(get_result, 'group'),
+            task_fingerprint('InvenTree.test_tasks.get_result', 'group'),
+        )
+
+        # Different group, args or kwargs produce a different fingerprint
+        self.assertNotEqual(fp, task_fingerprint('a.b.c', 'other', 1, 2, x={}))
+        self.assertNotEqual(fp, task_fingerprint('a.b.c', 'group', 2, 1, x={}))
+        self.assertNotEqual(fp, task_fingerprint('a.b.c', 'group', 1, 2, y={}))
+
+        # Model instances are matched by primary key
+        user = User.objects.create(username='fingerprint')
+        copy = User.objects.get(pk=user.pk)
+
+        self.assertEqual(
+            task_fingerprint('a.b.c', 'group', user),
+            task_fingerprint('a.b.c', 'group', copy),
+        )
+
+    def test_task_fingerprint_signals(self):
+        """Test that registering a task fingerprint does not trigger any table events."""
+        from django.db.models.signals import post_save
+
+        from common.models import TaskFingerprint
+        from plugin.base.event.events import allow_table_event
+
+        self.assertFalse(allow_table_event(TaskFingerprint._meta.db_table))
+
+        saved = []
+
+        def handler(sender, **kwargs):
+            saved.append(sender)
+
+        post_save.connect(handler, sender=TaskFingerprint)
+
+        try:
+            TaskFingerprint.register('abc', 'task-1')
+            TaskFingerprint.register('abc', 'task-2')
+        finally:
+            post_save.disconnect(handler, sender=TaskFingerprint)
+
+        self.assertEqual(saved, [])
+        self.assertEqual(TaskFingerprint.lookup('abc', timedelta(hours=1)), 'task-2')
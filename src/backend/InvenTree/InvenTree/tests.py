@@ -30,12 +30,12 @@ import InvenTree.format
 import InvenTree.helpers
 import InvenTree.helpers_model
 import InvenTree.tasks
-from common.currency import currency_codes
+from common.currency import currency_codes, get_exchange_rates
 from common.models import CustomUnit, InvenTreeSetting
 from common.settings import get_global_setting
 from InvenTree.helpers_mixin import ClassProviderMixin, ClassValidationMixin
 from InvenTree.sanitizer import sanitize_svg
-from InvenTree.unit_test import InvenTreeTestCase, in_env_context
+from InvenTree.unit_test import ExchangeRateMixin, InvenTreeTestCase, in_env_context
 from part.models import Part, PartCategory
 from stock.models import StockItem, StockLocation
 
@@ -1111,7 +1111,7 @@ class TestVersionNumber(TestCase):
         self.assertEqual(d, version.inventreeCommitDate())
 
 
-class CurrencyTests(TestCase):
+class CurrencyTests(ExchangeRateMixin, TestCase):
     """Unit tests for currency / exchange rate functionality."""
 
     def test_rates(self):
@@ -1162,6 +1162,37 @@ class CurrencyTests(TestCase):
         with self.assertRaises(MissingRate):
             convert_money(Money(100, 'GBP'), 'ZWL')
 
+    def test_rate_table(self):
+        """Test the in-memory exchange rate table."""
+        # Without rate information, we cannot convert anything
+        with self.assertRaises(MissingRate):
+            get_exchange_rates().convert(Money(100, 'USD'), 'AUD')
+
+        self.generate_exchange_rates()
+
+        # The table is reloaded when the rates change
+        rates = get_exchange_rates()
+        self.assertEqual(rates.base_currency, 'USD')
+
+        # Conversions match the exchange backend
+        for source, target in [('USD', 'AUD'), ('AUD', 'USD'), ('CAD', 'GBP')]:
+            money = Money(100, source)
+            self.assertEqual(rates.convert(money, target), convert_money(money, target))
+
+        self.assertEqual(rates.convert(Money(5, 'CAD'), 'CAD'), Money(5, 'CAD'))
+
+        with self.assertRaises(MissingRate):
+            rates.convert(Money(100, 'GBP'), 'ZWL')
+
+        # The table is re-used while the rates are unchanged
+        with self.assertNumQueries(1):
+            self.assertIs(get_exchange_rates(), rates)
+
+        Rate.objects.filter(currency='GBP').delete()
+
+        with self.assertRaises(MissingRate):
+            get_exchange_rates().convert(Money(100, 'GBP'), 'USD')
+
 
 class TestStatus(TestCase):
     """Unit tests for status functions."""
@@ -0,0 +1,303 @@
+"""Set-based planner for automatically allocating untracked stock against a build order.
+
+Rather than querying the available stock separately for each BuildLine,
+the planner fetches all candidate stock items (for all lines) in a single annotated query,
+and then solves the allocation in memory.
+
+As multiple lines may draw from the same stock item (e.g. a part which is a substitute for another line),
+the planner tracks the remaining quantity of each stock item as allocations are made, so that:
+
+- A stock item is never allocated beyond its available quantity
+- Direct part matches are allocated (for every line) before variant parts, which are allocated before substitute parts
+- Within each stage, lines with the fewest candidate stock items are allocated first
+"""
+
+from decimal import Decimal
+
+from django.db.models import DecimalField, Q
+from django.db.models.functions import Coalesce
+
+import structlog
+from sql_util.utils import SubquerySum
+
+import part.models
+import stock.models
+from build.filters import annotate_allocated_quantity
+from order.status_codes import SalesOrderStatusGroups
+
+logger = structlog.get_logger('inventree')
+
+
+class AllocationPriority:
+    """Priority of a candidate part for a particular BuildLine (lower values are allocated first)."""
+
+    DIRECT = 1
+    VARIANT = 2
+    SUBSTITUTE = 3
+
+
+class AllocationPlanner:
+    """Plan the allocation of untracked stock items against a build order.
+
+    Attributes:
+        build: The Build instance to allocate stock against
+        location: If provided, only stock items located "below" this location are allocated
+        exclude_location: If provided, stock items located "below" this location are not allocated
+        interchangeable: If True, stock can be taken from multiple stock items for a single line
+        substitutes: If True, substitute parts may be allocated
+        optional_items: If True, optional BOM items are also allocated
+    """
+
+    def __init__(
+        self,
+        build,
+        location=None,
+        exclude_location=None,
+        interchangeable: bool = False,
+        substitutes: bool = True,
+        optional_items: bool = False,
+    ):
+        """Initialize the planner for the provided build order."""
+        self.build = build
+        self.location = location
+        self.exclude_location = exclude_location
+        self.interchangeable = interchangeable
+        self.substitutes = substitutes
+        self.optional_items = optional_items
+
+    def get_lines(self) -> list:
+        """Return the untracked BuildLine objects which require allocation.
+
+        Each returned line is annotated with the 'unallocated' quantity.
+        """
+        lines = self.build.untracked_line_items.filter(
+            bom_item__consumable=False
+        ).select_related('bom_item', 'bom_item__sub_part')
+
+        if not self.optional_items:
+            lines = lines.filter(bom_item__optional=False)
+
+        if self.substitutes:
+            lines = lines.prefetch_related('bom_item__substitutes__part')
+
+        lines = lines.annotate(allocated=annotate_allocated_quantity()).order_by('pk')
+
+        result = []
+
+        for line in lines:
+            line.unallocated = max(line.quantity - line.consumed - line.allocated, 0)
+
+            if line.unallocated > 0:
+                result.append(line)
+
+        return result
+
+    def get_candidate_parts(self, lines: list) -> dict[int, dict[int, int]]:
+        """Determine which parts can be allocated against each line.
+
+        This replicates BomItem.get_valid_parts_for_allocation for all lines at once,
+        using a single query to fetch the variants of all referenced parts.
+
+        Returns:
+            A dict of {line_id: {part_id: priority}}
+        """
+        # Parts which are directly referenced by each line (sub_part and substitutes)
+        referenced = {}
+
+        for line in lines:
+            bom_item = line.bom_item
+            parts = [(bom_item.sub_part, AllocationPriority.DIRECT)]
+
+            if self.substitutes:
+                parts.extend(
+                    (sub.part, AllocationPriority.SUBSTITUTE)
+                    for sub in bom_item.substitutes.all()
+                )
+
+            referenced[line.pk] = parts
+
+        tree_ids = {
+            p.tree_id
+            for line in lines
+            if line.bom_item.allow_variants
+            for p, _priority in referenced[line.pk]
+        }
+
+        # Fetch all parts which may be variants of the referenced parts
+        tree_parts = list(
+            part.models.Part.objects.filter(tree_id__in=tree_ids).only(
+                'pk', 'tree_id', 'lft', 'rght', 'active', 'trackable'
+            )
+        )
+
+        candidates = {}
+
+        for line in lines:
+            bom_item = line.bom_item
+            trackable = bom_item.sub_part.trackable
+            line_parts = {}
+
+            for ref_part, priority in referenced[line.pk]:
+                parts = [(ref_part, priority)]
+
+                if bom_item.allow_variants:
+                    variant_priority = (
+                        AllocationPriority.VARIANT
+                        if priority == AllocationPriority.DIRECT
+                        else priority
+                    )
+
+                    parts.extend(
+                        (p, variant_priority)
+                        for p in tree_parts
+                        if p.tree_id == ref_part.tree_id
+                        and p.lft > ref_part.lft
+                        and p.rght < ref_part.rght
+                    )
+
+                for p, p_priority in parts:
+                    # Trackable status must match the sub_part, and the part must be active
+                    if p.trackable != trackable or not p.active:
+                        continue
+
+                    line_parts[p.pk] = min(
+                        p_priority, line_parts.get(p.pk, AllocationPriority.SUBSTITUTE)
+                    )
+
+            candidates[line.pk] = line_parts
+
+        return candidates
+
+    def get_stock_items(self, part_ids: set[int]) -> list:
+        """Return all stock items which are available for allocation, for the provided parts.
+
+        Each returned item is annotated with the 'allocated' quantity,
+        matching the calculation used by StockItem.unallocated_quantity
+        """
+        items = stock.models.StockItem.objects.filter(
+            stock.models.StockItem.IN_STOCK_FILTER,
+            part__in=part_ids,
+            part__active=True,
+            part__virtual=False,
+        )
+
+        # Serialized stock items cannot be auto-allocated
+        items = items.filter(Q(serial=None) | Q(serial=''))
+
+        if self.location:
+            # Filter only stock items located "below" the specified location
+            items = items.filter(
+                location__tree_id=self.location.tree_id,
+                location__lft__gte=self.location.lft,
+                location__rght__lte=self.location.rght,
+            )
+
+        if self.exclude_location:
+            # Exclude any stock items from the provided location
+            items = items.exclude(
+                location__tree_id=self.exclude_location.tree_id,
+                location__lft__gte=self.exclude_location.lft,
+                location__rght__lte=self.exclude_location.rght,
+            )
+
+        so_filter = Q(
+            line__order__status__in=SalesOrderStatusGroups.OPEN,
+            shipment__shipment_date=None,
+        )
+
+        items = items.annotate(
+            allocated=Coalesce(
+                SubquerySum('allocations__quantity'),
+                Decimal(0),
+                output_field=DecimalField(),
+            )
+            + Coalesce(
+                SubquerySum('sales_order_allocations__quantity', filter=so_filter),
+                Decimal(0),
+                output_field=DecimalField(),
+            )
+        )
+
+        return list(items.order_by('pk'))
+
+    def plan(self) -> list:
+        """Calculate the stock allocations for the build order.
+
+        Returns:
+            A list of (unsaved) BuildItem objects
+        """
+        from build.models import BuildItem
+
+        lines = self.get_lines()
+
+        if not lines:
+            return []
+
+        candidates = self.get_candidate_parts(lines)
+
+        part_ids = set()
+
+        for line_parts in candidates.values():
+            part_ids.update(line_parts.keys())
+
+        stock_items = self.get_stock_items(part_ids)
+
+        # Remaining quantity available for each stock item
+        available = {
+            item.pk: max(item.quantity - item.allocated, 0) for item in stock_items
+        }
+
+        # Candidate stock items for each line, as (priority, item) pairs
+        line_stock = {}
+
+        for line in lines:
+            line_parts = candidates[line.pk]
+
+            line_stock[line.pk] = sorted(
+                (
+                    (line_parts[item.part_id], item)
+                    for item in stock_items
+                    if item.part_id in line_parts and available[item.pk] > 0
+                ),
+                key=lambda x: (x[0], x[1].pk),
+            )
+
+        # Unless stock is interchangeable, only lines with a single candidate can be allocated
+        if not self.interchangeable:
+            lines = [line for line in lines if len(line_stock[line.pk]) == 1]
+
+        # Allocate the most constrained lines first
+        lines.sort(key=lambda line: (len(line_stock[line.pk]), line.pk))
+
+        allocations = []
+
+        for priority in [
+            AllocationPriority.DIRECT,
+            AllocationPriority.VARIANT,
+            AllocationPriority.SUBSTITUTE,
+        ]:
+            for line in lines:
+                for item_priority, item in line_stock[line.pk]:
+                    if line.unallocated <= 0:
+                        break
+
+                    if item_priority != priority:
+                        continue
+
+                    quantity = min(line.unallocated, available[item.pk])
+
+                    if quantity <= 0:
+                        continue
+
+                    available[item.pk] -= quantity
+                    line.unallocated -= quantity
+
+                    allocations.append(
+                        BuildItem(build_line=line, stock_item=item, quantity=quantity)
+                    )
+
+        logger.debug(
+            'Planned %s stock allocations for build %s', len(allocations), self.build.pk
+        )
+
+        return allocations
@@ -767,6 +767,7 @@ class BuildAutoAllocate(BuildOrderContextMixin, CreateAPI):
     - If stock exists in a single location, easy!
     - If user decides that stock items are "fungible", allocate against multiple stock items
     - If the user wants to, allocate substitute parts if the primary parts are not available.
+    - If 'dry_run' is specified, the planned allocations are returned (and not saved)
     """
 
     queryset = Build.objects.none()
@@ -778,26 +779,37 @@ class BuildAutoAllocate(BuildOrderContextMixin, CreateAPI):
 
         As this is offloaded to the background task,
         we return information about the background task which is performing the auto allocation operation.
+
+        For a 'dry run', the allocation is planned immediately, and the planned allocations are returned.
         """
         from build.tasks import auto_allocate_build
         from InvenTree.tasks import offload_task
 
-        build = self.get_build()
+        build_order = self.get_build()
         serializer = self.get_serializer(data=self.request.data)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
 
+        allocation_kwargs = {
+            'location': data.get('location', None),
+            'exclude_location': data.get('exclude_location', None),
+            'interchangeable': data['interchangeable'],
+            'substitutes': data['substitutes'],
+            'optional_items': data['optional_items'],
+            'item_type': data.get('item_type', 'untracked'),
+        }
+
+        if data.get('dry_run', False):
+            items = build_order.auto_allocate_stock(dry_run=True, **allocation_kwargs)
+
+            response = build.serializers.BuildAutoAllocationPlanSerializer(
+                items, many=True
+            ).data
+            return Response(response, status=status.HTTP_200_OK)
+
         # Offload the task to the background worker
         task_id = offload_task(
-            auto_allocate_build,
-            build.pk,
-            location=data.get('location', None),
-            exclude_location=data.get('exclude_location', None),
-            interchangeable=data['interchangeable'],
-            substitutes=data['substitutes'],
-            optional_items=data['optional_items'],
-            item_type=data.get('item_type', 'untracked'),
-            group='build',
+            auto_allocate_build, build_order.pk, group='build', **allocation_kwargs
         )
 
         response = common.serializers.TaskDetailSerializer.from_task(task_id).data
@@ -0,0 +1,396 @@
+"""Stock availability snapshot for the lines of a build order.
+
+Each BuildLine is annotated with availability information for the required part
+(e.g. available stock, stock on order, stock in production).
+Calculating these figures with correlated subqueries requires more than ten subqueries
+to be evaluated for every single line in the build.
+
+Instead, the figures for every line in a build are calculated at once,
+using a fixed number of grouped queries (irrespective of the number of lines).
+If the global cache is enabled, the resulting snapshot is cached against the build,
+and invalidated whenever stock levels, allocations or orders are changed (see stock.coalesce.STOCK_CACHE_VERSION).
+"""
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.db.models import (
+    Case,
+    DecimalField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    Q,
+    QuerySet,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Greatest
+
+import structlog
+
+from build.status_codes import BuildStatusGroups
+from InvenTree.cache import LocalLRUCache
+from order.status_codes import PurchaseOrderStatusGroups, SalesOrderStatusGroups
+
+logger = structlog.get_logger('inventree')
+
+# Availability figures provided for each BuildLine (and the type of each figure)
+AVAILABILITY_FIELDS = {
+    'in_production': DecimalField,
+    'scheduled_to_build': IntegerField,
+    'on_order': DecimalField,
+    'available_stock': DecimalField,
+    'external_stock': DecimalField,
+    'available_substitute_stock': DecimalField,
+    'available_variant_stock': FloatField,
+}
+
+# Process-local cache of availability snapshots, keyed by build
+AVAILABILITY_CACHE = LocalLRUCache(maxsize=128)
+
+
+def get_build_availability(build) -> dict[int, dict]:
+    """Return the stock availability snapshot for the provided build.
+
+    The snapshot is retrieved from the cache if it is still current,
+    otherwise it is calculated (and cached).
+
+    The cached snapshot is only current if the stock cache version has not changed,
+    and the lines of the build (and the parts they require) have not changed.
+
+    The cache is local to each process, and so is only used if the global cache is enabled
+    (otherwise the stock cache version is not shared between processes).
+
+    Arguments:
+        build: The Build instance
+
+    Returns:
+        A dict of {BuildLine ID: {field: value}} for each line in the build
+    """
+    from stock.coalesce import STOCK_CACHE_VERSION
+
+    lines = get_build_lines(build)
+
+    if not settings.GLOBAL_CACHE_ENABLED:
+        return calculate_build_availability(build, lines)
+
+    key = f'build-availability:{build.pk}:{build.take_from_id}'
+
+    try:
+        version = (STOCK_CACHE_VERSION.get(), hash(tuple(lines)))
+    except Exception:  # pragma: no cover
+        logger.warning('Failed to retrieve stock cache version')
+        return calculate_build_availability(build, lines)
+
+    snapshot = AVAILABILITY_CACHE.get(key, version)
+
+    if snapshot is None:
+        snapshot = calculate_build_availability(build, lines)
+        AVAILABILITY_CACHE.set(key, snapshot, version)
+
+    return snapshot
+
+
+def annotate_build_availability(queryset: QuerySet, build) -> QuerySet:
+    """Annotate a BuildLine queryset with the availability snapshot for the provided build.
+
+    The snapshot values are joined against each line (by primary key),
+    so that the annotated fields can still be used for filtering and ordering.
+    Lines which share the same value are grouped into a single condition.
+
+    Arguments:
+        queryset: BuildLine queryset (for lines belonging to the provided build)
+        build: The Build instance
+    """
+    snapshot = get_build_availability(build)
+
+    annotations = {}
+
+    for field, field_type in AVAILABILITY_FIELDS.items():
+        lines = {}
+
+        for line_id, data in snapshot.items():
+            if data[field]:
+                lines.setdefault(data[field], []).append(line_id)
+
+        annotations[field] = Case(
+            *[
+                When(pk__in=line_ids, then=Value(value))
+                for value, line_ids in lines.items()
+            ],
+            default=Value(0),
+            output_field=field_type(),
+        )
+
+    return queryset.annotate(**annotations)
+
+
+def get_build_lines(build) -> list[tuple]:
+    """Return the lines of the provided build, and the part required by each line.
+
+    Returns:
+        A list of (line ID, BomItem ID, part ID, part tree_id, part lft, part rght) tuples
+    """
+    from build.models import BuildLine
+
+    return list(
+        BuildLine.objects
+        .filter(build=build)
+        .order_by('pk')
+        .values_list(
+            'pk',
+            'bom_item',
+            'bom_item__sub_part',
+            'bom_item__sub_part__tree_id',
+            'bom_item__sub_part__lft',
+            'bom_item__sub_part__rght',
+        )
+    )
+
+
+def calculate_build_availability(build, lines: list | None = None) -> dict[int, dict]:
+    """Calculate the stock availability snapshot for the provided build.
+
+    The figures match those calculated by BuildLineSerializer.annotate_queryset:
+
+    - in_production: Quantity of incomplete build outputs for the required part
+    - scheduled_to_build: Quantity of the required part scheduled to be built (by active builds)
+    - on_order: Quantity of the required part on order (against open purchase orders)
+    - available_stock: Unallocated stock of the required part (from the build source location)
+    - external_stock: Stock of the required part in external locations
+    - available_substitute_stock: Unallocated stock of any substitute parts
+    - available_variant_stock: Unallocated stock of any variants of the required part
+
+    Arguments:
+        build: The Build instance
+        lines: Lines of the build (if already fetched - see get_build_lines)
+
+    Returns:
+        A dict of {BuildLine ID: {field: value}} for each line in the build
+    """
+    from build.models import Build, BuildItem
+    from order.models import PurchaseOrderLineItem, SalesOrderAllocation
+    from part.models import BomItemSubstitute
+    from stock.models import StockItem
+
+    if lines is None:
+        lines = get_build_lines(build)
+
+    if not lines:
+        return {}
+
+    sub_parts = {line[2] for line in lines}
+    trees = {line[3] for line in lines}
+
+    substitutes = {}
+
+    for bom_item, sub_part in BomItemSubstitute.objects.filter(
+        bom_item__in={line[1] for line in lines}
+    ).values_list('bom_item', 'part'):
+        substitutes.setdefault(bom_item, set()).add(sub_part)
+
+    # Parts for which direct stock and allocation figures are required
+    parts = sub_parts.union(*substitutes.values())
+
+    location = build.take_from
+
+    # Filter for stock items which are available to this build
+    stock_filter = StockItem.IN_STOCK_FILTER
+
+    if location is not None:
+        stock_filter &= Q(
+            location__tree_id=location.tree_id,
+            location__lft__gte=location.lft,
+            location__rght__lte=location.rght,
+            location__level__gte=location.level,
+        )
+
+    stock_items = StockItem.objects.filter(stock_filter)
+
+    # Stock items for the required parts, substitutes, and any variant parts
+    # (variants are rolled up against each required part below)
+    stock_rows = (
+        stock_items
+        .filter(Q(part__in=parts) | Q(part__tree_id__in=trees))
+        .order_by()
+        .values('part', 'part__tree_id', 'part__lft')
+        .annotate(
+            total=Sum('quantity'),
+            external=Sum('quantity', filter=Q(location__external=True)),
+        )
+    )
+
+    stock = {}
+    tree_rows = {}
+
+    for row in stock_rows:
+        stock[row['part']] = row
+        tree_rows.setdefault(row['part__tree_id'], []).append(row)
+
+    variant_items = stock_items.filter(part__tree_id__in=trees)
+
+    # Any allocations against variant stock items are subtracted from the variant stock
+    variant_allocations = {}
+
+    for queryset, reference in [
+        (SalesOrderAllocation.objects.filter(item__in=variant_items), 'item__part'),
+        (BuildItem.objects.filter(stock_item__in=variant_items), 'stock_item__part'),
+    ]:
+        for row in (
+            queryset
+            .order_by()
+            .values(f'{reference}__tree_id', f'{reference}__lft')
+            .annotate(total=Sum('quantity'))
+        ):
+            tree_id = row[f'{reference}__tree_id']
+            lft = row[f'{reference}__lft']
+
+            variant_allocations.setdefault(tree_id, []).append((lft, row['total']))
+
+    if location is not None:
+        so_location = Q(
+            item__location__tree_id=location.tree_id,
+            item__location__lft__gte=location.lft,
+            item__location__rght__lte=location.rght,
+            item__location__level__gte=location.level,
+        )
+        bo_location = Q(
+            stock_item__location__tree_id=location.tree_id,
+            stock_item__location__lft__gte=location.lft,
+            stock_item__location__rght__lte=location.rght,
+            stock_item__location__level__gte=location.level,
+        )
+    else:
+        so_location = bo_location = Q()
+
+    # Sales order allocations (for open orders and incomplete shipments)
+    so_allocations = {
+        row['item__part']: row
+        for row in SalesOrderAllocation.objects
+        .filter(
+            line__order__status__in=SalesOrderStatusGroups.OPEN,
+            shipment__shipment_date=None,
+            item__part__in=parts,
+        )
+        .order_by()
+        .values('item__part')
+        .annotate(total=Sum('quantity'), located=Sum('quantity', filter=so_location))
+    }
+
+    # Build order allocations (for active builds)
+    bo_allocations = {
+        row['stock_item__part']: row
+        for row in BuildItem.objects
+        .filter(
+            build_line__build__status__in=BuildStatusGroups.ACTIVE_CODES,
+            stock_item__part__in=parts,
+        )
+        .order_by()
+        .values('stock_item__part')
+        .annotate(total=Sum('quantity'), located=Sum('quantity', filter=bo_location))
+    }
+
+    in_production = dict(
+        StockItem.objects
+        .filter(
+            is_building=True,
+            build__status__in=BuildStatusGroups.ACTIVE_CODES,
+            part__in=sub_parts,
+        )
+        .order_by()
+        .values('part')
+        .annotate(total=Sum('quantity'))
+        .values_list('part', 'total')
+    )
+
+    scheduled = dict(
+        Build.objects
+        .filter(status__in=BuildStatusGroups.ACTIVE_CODES, part__in=sub_parts)
+        .order_by()
+        .values('part')
+        .annotate(
+            total=Sum(
+                Greatest(
+                    ExpressionWrapper(
+                        Cast(F('quantity'), output_field=IntegerField())
+                        - Cast(F('completed'), output_field=IntegerField()),
+                        output_field=IntegerField(),
+                    ),
+                    0,
+                )
+            )
+        )
+        .values_list('part', 'total')
+    )
+
+    on_order = {
+        row['part__part']: max(
+            (row['quantity'] or 0) - (row['received'] or 0), Decimal(0)
+        )
+        for row in PurchaseOrderLineItem.objects
+        .filter(
+            order__status__in=PurchaseOrderStatusGroups.OPEN,
+            quantity__gt=F('received'),
+            part__part__in=sub_parts,
+        )
+        .order_by()
+        .values('part__part')
+        .annotate(
+            quantity=Sum(
+                F('quantity') * F('part__pack_quantity_native'),
+                output_field=DecimalField(),
+            ),
+            received=Sum(
+                F('received') * F('part__pack_quantity_native'),
+                output_field=DecimalField(),
+            ),
+        )
+    }
+
+    def value(data: dict, part_id: int, field: str):
+        """Return the value of the given field for a part (or zero if not present)."""
+        return (data.get(part_id) or {}).get(field) or Decimal(0)
+
+    snapshot = {}
+
+    for line_id, bom_item, sub_part, tree_id, lft, rght in lines:
+        available = (
+            value(stock, sub_part, 'total')
+            - value(so_allocations, sub_part, 'located')
+            - value(bo_allocations, sub_part, 'located')
+        )
+
+        substitute = Decimal(0)
+
+        for part_id in substitutes.get(bom_item, []):
+            substitute += (
+                value(stock, part_id, 'total')
+                - value(so_allocations, part_id, 'total')
+                - value(bo_allocations, part_id, 'total')
+            )
+
+        # Variant parts are all parts strictly below the required part in the part tree
+        variant = sum(
+            float(row['total'] or 0)
+            for row in tree_rows.get(tree_id, [])
+            if lft < row['part__lft'] < rght
+        ) - sum(
+            float(quantity or 0)
+            for item_lft, quantity in variant_allocations.get(tree_id, [])
+            if lft < item_lft < rght
+        )
+
+        snapshot[line_id] = {
+            'in_production': in_production.get(sub_part) or Decimal(0),
+            'scheduled_to_build': scheduled.get(sub_part) or 0,
+            'on_order': on_order.get(sub_part, Decimal(0)),
+            'available_stock': max(available, Decimal(0)),
+            'external_stock': value(stock, sub_part, 'external'),
+            'available_substitute_stock': max(substitute, Decimal(0)),
+            'available_variant_stock': max(variant, 0.0),
+        }
+
+    return snapshot
@@ -9,14 +9,13 @@ from django.core.validators import MinValueValidator
 from django.db import models, transaction
 from django.db.models import F, Q, QuerySet, Sum
 from django.db.models.functions import Coalesce
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch.dispatcher import receiver
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 import structlog
 from mptt.models import TreeForeignKey
-from rest_framework import serializers
 
 import generic.states
 import InvenTree.fields
@@ -971,6 +970,7 @@ class Build(
 
             # Generate stock allocations
             BuildItem.objects.bulk_create(allocations)
+            queue_allocation_updates(allocations)
 
         else:
             """Create a single build output of the given quantity."""
@@ -1064,6 +1064,7 @@ class Build(
 
         # Save the updated BuildItem objects
         BuildItem.objects.bulk_update(items_to_save, ['quantity'])
+        queue_allocation_updates(items_to_save)
 
         # Delete the remaining BuildItem objects
         BuildItem.objects.filter(pk__in=[item.pk for item in items_to_delete]).delete()
@@ -1081,9 +1082,10 @@ class Build(
             build_line__bom_item__sub_part__trackable=False
         )
 
-        # Remove stock
-        for item in items:
-            item.complete_allocation(user=user)
+        # Remove stock (rebuilding each affected stock item tree once)
+        with InvenTree.models.defer_tree_updates():
+            for item in items:
+                item.complete_allocation(user=user)
 
         # Delete allocation
         items.all().delete()
@@ -1263,18 +1265,30 @@ class Build(
 
     @transaction.atomic
     def auto_allocate_stock(
-        self, item_type: str = BuildItemTypes.UNTRACKED, **kwargs
-    ) -> None:
+        self, item_type: str = BuildItemTypes.UNTRACKED, dry_run: bool = False, **kwargs
+    ) -> list:
         """Automatically allocate stock items against this build order.
 
         Arguments:
             item_type: The type of BuildItem to allocate (default = untracked)
+            dry_run: If True, return the planned allocations without saving them to the database
+
+        Returns:
+            A list of the new BuildItem objects
         """
+        new_items = []
+
         if item_type in [self.BuildItemTypes.UNTRACKED, self.BuildItemTypes.ALL]:
-            self.auto_allocate_untracked_stock(**kwargs)
+            new_items.extend(
+                self.auto_allocate_untracked_stock(dry_run=dry_run, **kwargs)
+            )
 
         if item_type in [self.BuildItemTypes.TRACKED, self.BuildItemTypes.ALL]:
-            self.auto_allocate_tracked_stock(**kwargs)
+            new_items.extend(
+                self.auto_allocate_tracked_stock(dry_run=dry_run, **kwargs)
+            )
+
+        return new_items
 
     def auto_allocate_tracked_output(self, output, **kwargs):
         """Auto-allocate tracked stock items against a particular build output.
@@ -1364,7 +1378,7 @@ class Build(
 
         return allocations
 
-    def auto_allocate_tracked_stock(self, **kwargs):
+    def auto_allocate_tracked_stock(self, dry_run: bool = False, **kwargs) -> list:
         """Automatically allocate tracked stock items against serialized build outputs.
 
         This function allocates tracked stock items automatically against serialized build outputs,
@@ -1373,6 +1387,12 @@ class Build(
         - Only "tracked" BOM items are considered (untracked BOM items must be allocated separately)
         - Only build outputs with serial numbers are considered
         - Unallocated tracked components are allocated against build outputs with matching serial numbers
+
+        Arguments:
+            dry_run: If True, return the planned allocations without saving them to the database
+
+        Returns:
+            A list of the new BuildItem objects
         """
         new_items = []
 
@@ -1380,10 +1400,14 @@ class Build(
         for output in self.incomplete_outputs.all():
             new_items.extend(self.auto_allocate_tracked_output(output, **kwargs))
 
-        # Bulk-create the new BuildItem objects
-        BuildItem.objects.bulk_create(new_items)
+        if not dry_run:
+            # Bulk-create the new BuildItem objects
+            BuildItem.objects.bulk_create(new_items)
+            queue_allocation_updates(new_items)
 
-    def auto_allocate_untracked_stock(self, **kwargs):
+        return new_items
+
+    def auto_allocate_untracked_stock(self, dry_run: bool = False, **kwargs) -> list:
         """Automatically allocate untracked stock items against this build order.
 
         This function allocates untracked stock items automatically against a BuildOrder,
@@ -1397,132 +1421,34 @@ class Build(
         - If a single stock item is found, we can allocate that and move on!
         - If multiple stock items are found, we *may* be able to allocate:
             - If the calling function has specified that items are interchangeable
-        """
-        location = kwargs.get('location')
-        exclude_location = kwargs.get('exclude_location')
-        interchangeable = kwargs.get('interchangeable', False)
-        substitutes = kwargs.get('substitutes', True)
-        optional_items = kwargs.get('optional_items', False)
-
-        def stock_sort(item, bom_item, variant_parts):
-            if item.part == bom_item.sub_part:
-                return 1
-            elif item.part in variant_parts:
-                return 2
-            return 3
-
-        new_items = []
-
-        # Select only "untracked" line items
-        for line_item in self.untracked_line_items.all():
-            # Find the referenced BomItem
-            bom_item = line_item.bom_item
-
-            if bom_item.consumable:
-                # Do not auto-allocate stock to consumable BOM items
-                continue
-
-            if bom_item.optional and not optional_items:
-                # User has specified that optional_items are to be ignored
-                continue
-
-            variant_parts = bom_item.sub_part.get_descendants(include_self=False)
-
-            unallocated_quantity = line_item.unallocated_quantity()
-
-            if unallocated_quantity <= 0:
-                # This BomItem is fully allocated, we can continue
-                continue
 
-            # Check which parts we can "use" (may include variants and substitutes)
-            available_parts = bom_item.get_valid_parts_for_allocation(
-                allow_variants=True, allow_inactive=False, allow_substitutes=substitutes
-            )
+        The allocation is calculated for all lines at once (refer to build.allocation.AllocationPlanner)
 
-            # Look for available stock items
-            available_stock = stock.models.StockItem.objects.filter(
-                stock.models.StockItem.IN_STOCK_FILTER
-            )
-
-            # Filter by list of available parts
-            available_stock = available_stock.filter(part__in=list(available_parts))
-
-            # Ensure part is active and not virtual
-            available_stock = available_stock.filter(
-                part__active=True, part__virtual=False
-            )
-
-            # Filter out "serialized" stock items, these cannot be auto-allocated
-            available_stock = available_stock.filter(
-                Q(serial=None) | Q(serial='')
-            ).distinct()
-
-            if location:
-                # Filter only stock items located "below" the specified location
-                sublocations = location.get_descendants(include_self=True)
-                available_stock = available_stock.filter(
-                    location__in=list(sublocations)
-                )
-
-            if exclude_location:
-                # Exclude any stock items from the provided location
-                sublocations = exclude_location.get_descendants(include_self=True)
-                available_stock = available_stock.exclude(
-                    location__in=list(sublocations)
-                )
-
-            """
-            Next, we sort the available stock items with the following priority:
-            1. Direct part matches (+1)
-            2. Variant part matches (+2)
-            3. Substitute part matches (+3)
-
-            This ensures that allocation priority is first given to "direct" parts
-            """
-            available_stock = sorted(
-                available_stock,
-                key=lambda item, b=bom_item, v=variant_parts: stock_sort(item, b, v),
-            )
+        Arguments:
+            dry_run: If True, return the planned allocations without saving them to the database
 
-            if len(available_stock) == 1 or interchangeable:
-                # Either there is only a single stock item available,
-                # or all items are "interchangeable" and we don't care where we take stock from
+        Returns:
+            A list of the new BuildItem objects
+        """
+        from build.allocation import AllocationPlanner
 
-                for stock_item in available_stock:
-                    # Skip inactive parts
-                    if not stock_item.part.active:
-                        continue
+        planner = AllocationPlanner(
+            self,
+            location=kwargs.get('location'),
+            exclude_location=kwargs.get('exclude_location'),
+            interchangeable=kwargs.get('interchangeable', False),
+            substitutes=kwargs.get('substitutes', True),
+            optional_items=kwargs.get('optional_items', False),
+        )
 
-                    # How much of the stock item is "available" for allocation?
-                    quantity = min(
-                        unallocated_quantity, stock_item.unallocated_quantity()
-                    )
+        new_items = planner.plan()
 
-                    if quantity > 0:
-                        try:
-                            new_items.append(
-                                BuildItem(
-                                    build_line=line_item,
-                                    stock_item=stock_item,
-                                    quantity=quantity,
-                                )
-                            )
-
-                            # Subtract the required quantity
-                            unallocated_quantity -= quantity
-
-                        except (ValidationError, serializers.ValidationError) as exc:
-                            # Re-raise with a Django-compatible validation payload
-                            raise ValidationError(
-                                serializers.as_serializer_error(exc)
-                            ) from exc
-
-                    if unallocated_quantity <= 0:
-                        # We have now fully-allocated this BomItem - no need to continue!
-                        break
+        if not dry_run:
+            # Bulk-create the new BuildItem objects
+            BuildItem.objects.bulk_create(new_items)
+            queue_allocation_updates(new_items)
 
-        # Bulk-create the new BuildItem objects
-        BuildItem.objects.bulk_create(new_items)
+        return new_items
 
     def unallocated_lines(self, tracked: Optional[bool] = None) -> QuerySet:
         """Returns a list of BuildLine objects which have not been fully allocated."""
@@ -2113,3 +2039,89 @@ class BuildItem(InvenTree.models.InvenTreeMetadataModel):
         help_text=_('Destination stock item'),
         limit_choices_to={'is_building': True},
     )
+
+
+def queue_allocation_updates(items) -> None:
+    """Refresh the stock totals for the parts allocated by the provided BuildItem objects.
+
+    This is required after bulk operations (e.g. bulk_create or bulk_update),
+    which do not send the post_save signal for each BuildItem.
+    The cached stock availability data is also invalidated.
+
+    Arguments:
+        items: Iterable of BuildItem objects which have been created or modified
+    """
+    from stock.coalesce import queue_stock_cache_invalidation, queue_stock_totals_update
+
+    if InvenTree.ready.isImportingData():
+        return
+
+    stock_ids = {item.stock_item_id for item in items}
+
+    if not stock_ids:
+        return
+
+    queue_stock_cache_invalidation()
+
+    if not part.models.PartStockTotal.enabled():
+        return
+
+    queue_stock_totals_update(
+        stock.models.StockItem.objects
+        .filter(pk__in=stock_ids)
+        .values_list('part', flat=True)
+        .distinct()
+    )
+
+
+@receiver(post_save, sender=BuildItem, dispatch_uid='build_item_stock_totals')
+@receiver(post_delete, sender=BuildItem, dispatch_uid='build_item_delete_stock_totals')
+def update_stock_totals_on_allocation_change(sender, instance: BuildItem, **kwargs):
+    """Refresh the stock totals for the part allocated by a BuildItem."""
+    from stock.coalesce import queue_stock_cache_invalidation, queue_stock_totals_update
+
+    if InvenTree.ready.isImportingData():
+        return
+
+    queue_stock_cache_invalidation()
+
+    if not part.models.PartStockTotal.enabled():
+        return
+
+    queue_stock_totals_update(
+        stock.models.StockItem.objects.filter(pk=instance.stock_item_id).values_list(
+            'part', flat=True
+        )
+    )
+
+
+@receiver(post_save, sender=Build, dispatch_uid='build_stock_totals')
+def update_stock_totals_on_build_change(sender, instance: Build, created, **kwargs):
+    """Refresh the stock totals for all parts referenced by a Build.
+
+    A change to the build status affects the quantity which is 'building'
+    (for the assembly) or 'allocated' (for each allocated part).
+
+    A new build also changes the quantity 'scheduled to build' for the assembly,
+    which is included in the cached availability for other builds.
+    """
+    from stock.coalesce import queue_stock_cache_invalidation, queue_stock_totals_update
+
+    if InvenTree.ready.isImportingData():
+        return
+
+    queue_stock_cache_invalidation()
+
+    if created or not part.models.PartStockTotal.enabled():
+        return
+
+    part_ids = set(
+        BuildItem.objects
+        .filter(build_line__build=instance)
+        .values_list('stock_item__part', flat=True)
+        .distinct()
+    )
+
+    part_ids.add(instance.part_id)
+
+    queue_stock_totals_update(part_ids)
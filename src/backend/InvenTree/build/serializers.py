@@ -47,6 +47,7 @@ from stock.serializers import (
 from stock.status_codes import StockStatus
 from users.serializers import OwnerSerializer, UserSerializer
 
+from .availability import annotate_build_availability
 from .models import Build, BuildItem, BuildLine
 from .status_codes import BuildStatus
 
@@ -1082,6 +1083,7 @@ class BuildAutoAllocationSerializer(serializers.Serializer):
             'interchangeable',
             'substitutes',
             'optional_items',
+            'dry_run',
         ]
 
     location = serializers.PrimaryKeyRelatedField(
@@ -1133,6 +1135,35 @@ class BuildAutoAllocationSerializer(serializers.Serializer):
         help_text=_('Select item type to auto-allocate'),
     )
 
+    dry_run = serializers.BooleanField(
+        default=False,
+        label=_('Dry Run'),
+        help_text=_(
+            'Return the planned allocations without allocating stock to the build order'
+        ),
+    )
+
+
+class BuildAutoAllocationPlanSerializer(serializers.Serializer):
+    """DRF serializer for a planned (unsaved) auto-allocation against a build order."""
+
+    class Meta:
+        """Serializer metaclass."""
+
+        fields = ['build_line', 'stock_item', 'part', 'install_into', 'quantity']
+
+    build_line = serializers.IntegerField(source='build_line_id', read_only=True)
+
+    stock_item = serializers.IntegerField(source='stock_item_id', read_only=True)
+
+    part = serializers.IntegerField(source='stock_item.part_id', read_only=True)
+
+    install_into = serializers.IntegerField(
+        source='install_into_id', read_only=True, allow_null=True
+    )
+
+    quantity = InvenTreeDecimalField(read_only=True)
+
 
 class BuildItemSerializer(
     FilterableSerializerMixin, DataImportExportSerializerMixin, InvenTreeModelSerializer
@@ -1554,8 +1585,10 @@ class BuildLineSerializer(
             queryset: The queryset to annotate
             build: The build order to filter against (optional)
 
-        Note: If the 'build' is provided, we can use it to filter available stock, depending on the specified location for the build
-
+        Note: If the 'build' is provided, the queryset must only contain lines for that build.
+        In this case, the stock availability figures are read from a (cached) snapshot for the entire build,
+        rather than being calculated (using a large number of subqueries) for each individual line.
+        Available stock is filtered depending on the specified location for the build.
         """
         queryset = queryset.select_related(
             'build',
@@ -1587,6 +1620,9 @@ class BuildLineSerializer(
             )
         )
 
+        if build is not None:
+            return annotate_build_availability(queryset, build)
+
         ref = 'bom_item__sub_part__'
 
         stock_filter = None
@@ -3,11 +3,12 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
+from django.test import override_settings
 from django.urls import reverse
 
 from rest_framework import status
 
-from build.models import Build, BuildItem, BuildLine
+from build.models import Build, BuildItem, BuildLine, queue_allocation_updates
 from build.status_codes import BuildStatus
 from InvenTree.unit_test import InvenTreeAPITestCase
 from part.models import BomItem, Part
@@ -974,6 +975,17 @@ class BuildAllocationTest(BuildAPITest):
 
         self.assertEqual(N, BuildItem.objects.count())
 
+        # A 'dry run' returns the planned allocation, without creating it
+        response = self.post(
+            url, data={'item_type': 'tracked', 'dry_run': True}, expected_code=200
+        )
+
+        self.assertEqual(N, BuildItem.objects.count())
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['stock_item'], c.pk)
+        self.assertEqual(response.data[0]['part'], component.pk)
+        self.assertEqual(response.data[0]['install_into'], output['pk'])
+
         # Allocate 'tracked' items - this should allocate our tracked item
         self.post(url, data={'item_type': 'tracked'}, expected_code=200)
 
@@ -1666,6 +1678,91 @@ class BuildLineTests(BuildAPITest):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]['pk'], lines[0].pk)
 
+    def test_availability_snapshot(self):
+        """Test that the availability snapshot matches the per-line annotations."""
+        from build.availability import (
+            AVAILABILITY_CACHE,
+            AVAILABILITY_FIELDS,
+            get_build_availability,
+        )
+        from build.serializers import BuildLineSerializer
+
+        for build in Build.objects.filter(take_from=None):
+            lines = BuildLineSerializer.annotate_queryset(
+                BuildLine.objects.filter(build=build)
+            )
+
+            snapshot = get_build_availability(build)
+            self.assertEqual(len(snapshot), lines.count())
+
+            for line in lines:
+                for field in AVAILABILITY_FIELDS:
+                    self.assertAlmostEqual(
+                        float(snapshot[line.pk][field]), float(getattr(line, field))
+                    )
+
+            # The annotated (snapshot) values are returned via the API
+            response = self.get(
+                reverse('api-build-line-list'), {'build': build.pk}, expected_code=200
+            )
+
+            for row in response.data:
+                self.assertAlmostEqual(
+                    row['available_stock'],
+                    float(snapshot[row['pk']]['available_stock']),
+                )
+
+        line = BuildLine.objects.filter(build__take_from=None).first()
+        build = line.build
+        sub_part = line.bom_item.sub_part
+
+        # The snapshot is not cached without a global cache
+        self.assertIsNot(get_build_availability(build), get_build_availability(build))
+
+        AVAILABILITY_CACHE.clear()
+
+        with override_settings(GLOBAL_CACHE_ENABLED=True):
+            # The snapshot is cached until stock is changed
+            snapshot = get_build_availability(build)
+
+            with self.assertNumQueriesLessThan(2):
+                self.assertIs(get_build_availability(build), snapshot)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                StockItem.objects.create(part=sub_part, quantity=1000)
+
+            updated = get_build_availability(build)
+
+            self.assertGreater(
+                updated[line.pk]['available_stock'],
+                snapshot[line.pk]['available_stock'],
+            )
+
+            # ... or a new build is created
+            with self.captureOnCommitCallbacks(execute=True):
+                Build.objects.create(
+                    reference='BO-12350',
+                    title='New build',
+                    part=build.part,
+                    quantity=10,
+                )
+
+            updated = get_build_availability(build)
+            self.assertIs(get_build_availability(build), updated)
+
+            # ... or stock is allocated in bulk (without sending post_save signals)
+            item = StockItem.objects.filter(part=sub_part).last()
+            allocations = BuildItem.objects.bulk_create([
+                BuildItem(build_line=line, stock_item=item, quantity=1)
+            ])
+
+            with self.captureOnCommitCallbacks(execute=True):
+                queue_allocation_updates(allocations)
+
+            self.assertIsNot(get_build_availability(build), updated)
+
+        AVAILABILITY_CACHE.clear()
+
 
 class BuildConsumeTest(BuildAPITest):
     """Test consuming allocated stock."""
@@ -842,6 +842,28 @@ class AutoAllocationTests(BuildTestBase):
         self.assertTrue(self.line_1.is_fully_allocated())
         self.assertFalse(self.line_2.is_fully_allocated())
 
+    @override_settings(PART_STOCK_TOTALS=True)
+    def test_stock_totals(self):
+        """Bulk allocations refresh the pre-calculated stock totals."""
+        from part.models import PartStockTotal
+
+        PartStockTotal.rebuild()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.build.auto_allocate_stock(
+                interchangeable=True, substitutes=False, optional_items=True
+            )
+
+        for sub_part in [self.sub_part_1, self.sub_part_2]:
+            totals = PartStockTotal.objects.filter(part=sub_part).aggregate(
+                allocated=Sum('allocated_build')
+            )
+
+            self.assertGreater(totals['allocated'], 0)
+            self.assertEqual(
+                totals['allocated'], sub_part.build_order_allocation_count()
+            )
+
     def test_fully_auto(self):
         """We should be able to auto-allocate against a build in a single go."""
         self.build.auto_allocate_stock(
@@ -853,6 +875,71 @@ class AutoAllocationTests(BuildTestBase):
         self.assertEqual(self.line_1.unallocated_quantity(), 0)
         self.assertEqual(self.line_2.unallocated_quantity(), 0)
 
+    def test_dry_run(self):
+        """A 'dry run' returns the planned allocations, without saving them."""
+        N = BuildItem.objects.count()
+
+        items = self.build.auto_allocate_stock(
+            interchangeable=True, substitutes=True, optional_items=True, dry_run=True
+        )
+
+        self.assertEqual(BuildItem.objects.count(), N)
+        self.assertEqual(self.line_1.unallocated_quantity(), 50)
+        self.assertEqual(self.line_2.unallocated_quantity(), 30)
+
+        for item in items:
+            self.assertIsNone(item.pk)
+
+        self.assertEqual(
+            sum(item.quantity for item in items if item.build_line == self.line_1), 50
+        )
+        self.assertEqual(
+            sum(item.quantity for item in items if item.build_line == self.line_2), 30
+        )
+
+        # Allocating "for real" creates the same allocations
+        allocated = self.build.auto_allocate_stock(
+            interchangeable=True, substitutes=True, optional_items=True
+        )
+
+        self.assertEqual(BuildItem.objects.count(), N + len(items))
+
+        self.assertEqual(
+            [(x.build_line.pk, x.stock_item.pk, x.quantity) for x in items],
+            [(x.build_line.pk, x.stock_item.pk, x.quantity) for x in allocated],
+        )
+
+        self.assertTrue(self.build.is_fully_allocated(tracked=False))
+
+    def test_allocate_contention(self):
+        """Test auto-allocation where multiple lines compete for the same stock item."""
+        # sub_part_1 is also a substitute for bom_item_2
+        BomItemSubstitute.objects.create(bom_item=self.bom_item_2, part=self.sub_part_1)
+
+        # Remove all other stock for the second line
+        StockItem.objects.filter(part=self.sub_part_2).delete()
+
+        for sub in self.bom_item_2.substitutes.exclude(part=self.sub_part_1):
+            StockItem.objects.filter(part=sub.part).delete()
+
+        # 103 items of sub_part_1 are available, but 50 + 30 are required
+        self.stock_1_2.quantity = 60
+        self.stock_1_2.save()
+
+        self.build.auto_allocate_stock(
+            interchangeable=True, substitutes=True, optional_items=True
+        )
+
+        # The direct part match takes priority over the substitute
+        self.assertEqual(self.line_1.allocated_quantity(), 50)
+        self.assertEqual(self.line_2.allocated_quantity(), 13)
+
+        # Stock items are not over-allocated
+        for item in [self.stock_1_1, self.stock_1_2]:
+            item.refresh_from_db()
+            self.assertEqual(item.unallocated_quantity(), 0)
+            self.assertEqual(item.allocation_count(), item.quantity)
+
     def test_allocate_consumed(self):
         """Test for auto-allocation against a build which has been fully consumed.
 
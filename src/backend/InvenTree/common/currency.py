@@ -144,6 +144,136 @@ def validate_currency_codes(value):
     return list(valid_currencies)
 
 
+class ExchangeRates:
+    """In-memory table of currency exchange rates.
+
+    The rates for the exchange backend are loaded from the database in a single query,
+    so that many conversions can be performed without further database hits.
+
+    Conversions follow the same rules as djmoney.contrib.exchange.models.get_rate:
+    rates between two non-base currencies are calculated via the base currency.
+
+    Attributes:
+        base_currency: The base currency of the exchange backend (None if no rates are available)
+        rates: Dict of {currency: rate} relative to the base currency
+        stamp: Database state the rates were loaded from (see exchange_rate_stamp)
+    """
+
+    def __init__(self, base_currency: Optional[str], rates: dict, stamp=None):
+        """Initialize the exchange rate table."""
+        self.base_currency = base_currency
+        self.rates = rates
+        self.stamp = stamp
+
+    @classmethod
+    def load(cls, stamp=None) -> 'ExchangeRates':
+        """Load the exchange rates for the default exchange backend.
+
+        Arguments:
+            stamp: The current database stamp (if already known)
+        """
+        from djmoney.contrib.exchange.models import Rate, get_default_backend_name
+
+        if stamp is None:
+            stamp = exchange_rate_stamp()
+
+        if stamp is None:
+            # The exchange backend does not exist (yet)
+            return cls(None, {}, stamp)
+
+        rates = Rate.objects.filter(backend=get_default_backend_name()).values_list(
+            'currency', 'value'
+        )
+
+        return cls(stamp[1], dict(rates), stamp)
+
+    def get_rate(self, source, target) -> decimal.Decimal:
+        """Return the exchange rate between the source and target currencies.
+
+        Raises:
+            MissingRate: If either currency does not have an exchange rate
+        """
+        from djmoney.contrib.exchange.exceptions import MissingRate
+
+        source, target = str(source), str(target)
+
+        if source == target:
+            return decimal.Decimal(1)
+
+        rates = []
+
+        for currency in [source, target]:
+            if currency in self.rates:
+                rates.append(self.rates[currency])
+            elif currency == self.base_currency:
+                rates.append(decimal.Decimal(1))
+            else:
+                raise MissingRate(f'Rate {source} -> {target} does not exist')
+
+        return rates[1] / rates[0]
+
+    def convert(self, value, currency):
+        """Convert the provided Money value to the specified currency.
+
+        Raises:
+            MissingRate: If the exchange rate is not available
+        """
+        amount = value.amount * self.get_rate(value.currency, currency)
+        return value.__class__(amount, currency)
+
+
+# Most recently loaded exchange rates (shared between requests)
+_exchange_rates: Optional[ExchangeRates] = None
+
+
+def exchange_rate_stamp() -> Optional[tuple]:
+    """Return a stamp which identifies the current exchange rate data in the database.
+
+    The stamp includes the last-update time of the exchange backend, which is updated whenever the rates are refreshed,
+    as well as the number (and latest ID) of stored rates, in case rates are modified directly.
+
+    Returns:
+        A tuple of (last_update, base_currency, count, latest_id), or None if there is no exchange backend
+    """
+    from django.db.models import Count, Max
+
+    from djmoney.contrib.exchange.models import (
+        ExchangeBackend,
+        get_default_backend_name,
+    )
+
+    return (
+        ExchangeBackend.objects
+        .filter(name=get_default_backend_name())
+        .annotate(count=Count('rates'), latest=Max('rates__pk'))
+        .values_list('last_update', 'base_currency', 'count', 'latest')
+        .first()
+    )
+
+
+def get_exchange_rates() -> ExchangeRates:
+    """Return the current exchange rate table.
+
+    - Within a request, the table is only loaded (or validated) once
+    - Otherwise, the table is re-used until the exchange rate data changes in the database
+    """
+    global _exchange_rates
+
+    from InvenTree.cache import get_session_cache, set_session_cache
+
+    if rates := get_session_cache('exchange_rates'):
+        return rates
+
+    stamp = exchange_rate_stamp()
+
+    if _exchange_rates is None or _exchange_rates.stamp != stamp:
+        _exchange_rates = ExchangeRates.load(stamp)
+
+    set_session_cache('exchange_rates', _exchange_rates)
+
+    return _exchange_rates
+
+
 def currency_exchange_plugins() -> Optional[list]:
     """Return a list of plugin choices which can be used for currency exchange."""
     try:
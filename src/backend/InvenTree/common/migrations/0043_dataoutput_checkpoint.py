@@ -0,0 +1,18 @@
+# Generated by Django 5.2.13 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0042_taskfingerprint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataoutput",
+            name="checkpoint",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
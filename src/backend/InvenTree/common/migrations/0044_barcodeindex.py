@@ -0,0 +1,54 @@
+# Generated by Django 5.2.13 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0043_dataoutput_checkpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BarcodeIndex",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "barcode_hash",
+                    models.CharField(
+                        db_index=True,
+                        help_text="Unique hash of barcode data",
+                        max_length=128,
+                        verbose_name="Barcode Hash",
+                    ),
+                ),
+                (
+                    "model_type",
+                    models.CharField(
+                        help_text="Model type of the barcode target",
+                        max_length=100,
+                        verbose_name="Model type",
+                    ),
+                ),
+                (
+                    "model_id",
+                    models.PositiveIntegerField(
+                        help_text="ID of the barcode target", verbose_name="Model ID"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Barcode Index",
+                "unique_together": {("model_type", "model_id")},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.13 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0044_barcodeindex"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="parametertemplate",
+            name="checkpoint",
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
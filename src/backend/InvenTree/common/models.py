@@ -42,7 +42,7 @@ from django.utils.translation import gettext_lazy as _
 
 import structlog
 from anymail.signals import inbound, tracking
-from django_q.signals import post_spawn
+from django_q.signals import post_spawn, pre_enqueue, pre_execute
 from djmoney.contrib.exchange.exceptions import MissingRate
 from djmoney.contrib.exchange.models import convert_money
 from opentelemetry import trace
@@ -64,13 +64,28 @@ from common.settings import get_global_setting, global_setting_overrides
 from generic.enums import StringEnum
 from generic.states import ColorEnum
 from generic.states.custom import state_color_mappings
-from InvenTree.cache import get_session_cache, set_session_cache
+from InvenTree.cache import (
+    CacheVersion,
+    LocalLRUCache,
+    cache_setting,
+    get_session_cache,
+    set_session_cache,
+)
 from InvenTree.sanitizer import sanitize_svg
 from InvenTree.tracing import TRACE_PROC, TRACE_PROV
 from InvenTree.version import inventree_identifier
 
 logger = structlog.get_logger('inventree')
 
+# Process-local cache tier for settings objects (in front of the global cache)
+# Each lookup returns a new instance, as settings objects must not be shared between threads
+SETTINGS_LOCAL_CACHE = LocalLRUCache(
+    maxsize=cache_setting('settings_size', 1024, typecast=int), serialize=True
+)
+
+# Shared version stamps (one for each settings class), used to invalidate the local cache tier across all processes
+SETTINGS_CACHE_VERSIONS: dict[str, CacheVersion] = {}
+
 
 class RenderMeta(enums.ChoicesType):
     """Metaclass for rendering choices."""
@@ -230,6 +245,9 @@ class BaseInvenTreeSetting(models.Model):
         # Remove the setting from the request cache
         set_session_cache(self.cache_key, None)
 
+        # Invalidate the local cache tier (on all processes)
+        self.invalidate_local_cache()
+
         # Execute after_save action
         self._call_settings_function('after_save', args, kwargs)
 
@@ -275,6 +293,56 @@ class BaseInvenTreeSetting(models.Model):
         if callable(settings_fnc):
             settings_fnc(self)
 
+    def delete(self, *args, **kwargs):
+        """Remove the setting from the cache when it is deleted."""
+        key = self.cache_key
+
+        result = super().delete(*args, **kwargs)
+
+        try:
+            cache.delete(key)
+        except Exception:  # pragma: no cover
+            pass
+
+        set_session_cache(key, None)
+        self.invalidate_local_cache()
+
+        return result
+
+    @classmethod
+    def get_cache_version(cls) -> CacheVersion:
+        """Return the shared version stamp for the local cache tier of this settings class."""
+        if (version := SETTINGS_CACHE_VERSIONS.get(cls.__name__)) is None:
+            version = CacheVersion(f'settings:{cls.__name__}')
+            SETTINGS_CACHE_VERSIONS[cls.__name__] = version
+
+        return version
+
+    @staticmethod
+    def use_local_cache(key: str) -> bool:
+        """Return True if the setting with the provided key can be stored in the process-local cache tier.
+
+        Internal settings (with keys starting with '_') are updated frequently (e.g. task timestamps),
+        and are not stored in the local cache tier.
+        """
+        return django_settings.GLOBAL_CACHE_ENABLED and not str(key).startswith('_')
+
+    def invalidate_local_cache(self):
+        """Evict this setting from the process-local cache tier.
+
+        The shared version stamp (for this settings class) is also incremented,
+        so that the setting is evicted from the local cache of all other processes.
+        """
+        SETTINGS_LOCAL_CACHE.delete(self.cache_key)
+
+        if not self.use_local_cache(self.key):
+            return
+
+        try:
+            self.get_cache_version().bump()
+        except Exception:  # pragma: no cover
+            logger.warning('Failed to update settings cache version')
+
     @property
     def cache_key(self):
         """Generate a unique cache key for this settings object."""
@@ -552,8 +620,9 @@ class BaseInvenTreeSetting(models.Model):
         As settings are accessed frequently, this function will attempt to access the cache first:
 
         1. Check the ephemeral request cache
-        2. Check the global cache
-        3. Query the database
+        2. Check the process-local cache (only if the global cache is enabled)
+        3. Check the global cache
+        4. Query the database
         """
         key = str(key).strip().upper()
 
@@ -580,15 +649,33 @@ class BaseInvenTreeSetting(models.Model):
         if setting := get_session_cache(cache_key):
             return setting
 
+        # The process-local cache tier can only be invalidated via the global cache
+        access_local_cache = access_global_cache and cls.use_local_cache(key)
+        cache_version = None
+
         if access_global_cache:
             try:
-                # First attempt to find the setting object in the cache
+                if access_local_cache:
+                    # Next, attempt to find the setting object in the process-local cache
+                    cache_version = cls.get_cache_version().get()
+                    cached_setting = SETTINGS_LOCAL_CACHE.get(cache_key, cache_version)
+
+                    if cached_setting is not None:
+                        set_session_cache(cache_key, cached_setting)
+                        return cached_setting
+
+                # Then attempt to find the setting object in the global cache
                 cached_setting = cache.get(cache_key)
 
                 if cached_setting is not None:
                     # Store the cached setting into the session cache
-
                     set_session_cache(cache_key, cached_setting)
+
+                    if access_local_cache:
+                        SETTINGS_LOCAL_CACHE.set(
+                            cache_key, cached_setting, cache_version
+                        )
+
                     return cached_setting
 
             except Exception:
@@ -644,6 +731,9 @@ class BaseInvenTreeSetting(models.Model):
                 # Cache this setting object to the global cache
                 setting.save_to_cache()
 
+                if access_local_cache and setting.pk is not None:
+                    SETTINGS_LOCAL_CACHE.set(cache_key, setting, cache_version)
+
         return setting
 
     @classmethod
@@ -1658,6 +1748,80 @@ class NotificationEntry(MetaMixin):
         entry.save()
 
 
+class TaskFingerprint(models.Model):
+    """A TaskFingerprint records a background task which is waiting in the task queue.
+
+    It is used to quickly detect duplicate tasks, without inspecting every queued task.
+
+    The entry is removed when the worker runs the task. Entries for tasks which are removed
+    from the queue without being run are ignored once they expire, and purged by a daily task.
+
+    Attributes:
+    - fingerprint: Hash of the task function, group, args and kwargs
+    - task_id: The ID of the queued task
+    - created: The time at which the task was queued
+    """
+
+    fingerprint = models.CharField(max_length=64, unique=True)
+
+    task_id = models.CharField(max_length=64, db_index=True)
+
+    created = models.DateTimeField(default=now)
+
+    @classmethod
+    def lookup(cls, fingerprint: str, max_age: timedelta) -> Optional[str]:
+        """Return the ID of a queued task with the provided fingerprint (if any).
+
+        Arguments:
+            fingerprint: The task fingerprint to look up
+            max_age: Ignore any entries which are older than this
+        """
+        return (
+            cls.objects
+            .filter(fingerprint=fingerprint, created__gte=now() - max_age)
+            .values_list('task_id', flat=True)
+            .first()
+        )
+
+    @classmethod
+    def register(cls, fingerprint: str, task_id: str):
+        """Record that a task with the provided fingerprint has been queued.
+
+        Note: Entries are written with queryset methods, so no model signals are sent
+        (otherwise the generic table events would themselves offload further tasks).
+        """
+        if not cls.objects.filter(fingerprint=fingerprint).update(
+            task_id=task_id, created=now()
+        ):
+            cls.objects.bulk_create(
+                [cls(fingerprint=fingerprint, task_id=task_id, created=now())],
+                ignore_conflicts=True,
+            )
+
+
+@receiver(pre_enqueue, dispatch_uid='register_task_fingerprint')
+def register_task_fingerprint(sender, task, **kwargs):
+    """Record the fingerprint of a task which is about to be added to the task queue."""
+    fingerprint = InvenTree.tasks.get_pending_task_fingerprint()
+
+    if not fingerprint or task.get('sync', False):
+        return
+
+    try:
+        TaskFingerprint.register(fingerprint, task['id'])
+    except (IntegrityError, OperationalError, ProgrammingError):  # pragma: no cover
+        pass
+
+
+@receiver(pre_execute, dispatch_uid='clear_task_fingerprint')
+def clear_task_fingerprint(sender, task, **kwargs):
+    """Remove the fingerprint for a task when the background worker runs it."""
+    try:
+        TaskFingerprint.objects.filter(task_id=task.get('id')).delete()
+    except (OperationalError, ProgrammingError):  # pragma: no cover
+        pass
+
+
 class NotificationMessage(models.Model):
     """A NotificationMessage is a message sent to a particular user, notifying them of some important information.
 
@@ -2431,6 +2595,7 @@ class ParameterTemplate(
         choices: Comma-separated list of choices (if applicable)
         selectionlist: Optional link to a SelectionList for this template
         enabled: Is this template enabled?
+        checkpoint: JSON field for storing the state of a (resumable) parameter rebuild process
     """
 
     IMPORT_ID_FIELDS = ['name']
@@ -2594,6 +2759,8 @@ class ParameterTemplate(
         help_text=_('Is this parameter template enabled?'),
     )
 
+    checkpoint = models.JSONField(blank=True, null=True)
+
 
 @receiver(
     post_save, sender=ParameterTemplate, dispatch_uid='post_save_parameter_template'
@@ -2721,26 +2888,39 @@ class Parameter(
         - If a 'units' field is provided, then the data will be converted to the base SI unit.
         - Otherwise, we'll try to do a simple float cast
         """
-        if self.template.units:
+        self.data_numeric = self.convert_numeric_value(self.data, self.template.units)
+
+    @staticmethod
+    def convert_numeric_value(data: str, units: str) -> Optional[float]:
+        """Convert the provided parameter data to a numeric value.
+
+        Arguments:
+            data: The parameter data (string)
+            units: The units of the parameter template (if any)
+
+        Returns:
+            The numeric value (in base units), or None if the data cannot be converted
+        """
+        if units:
             try:
-                self.data_numeric = InvenTree.conversion.convert_physical_value(
-                    self.data, self.template.units
-                )
+                value = InvenTree.conversion.convert_physical_value(data, units)
             except (ValidationError, ValueError):
-                self.data_numeric = None
+                value = None
 
         # No units provided, so try to cast to a float
         else:
             try:
-                self.data_numeric = float(self.data)
+                value = float(data)
             except ValueError:
-                self.data_numeric = None
+                value = None
 
-        if self.data_numeric is not None and type(self.data_numeric) is float:
+        if value is not None and type(value) is float:
             # Prevent out of range numbers, etc
             # Ref: https://github.com/inventree/InvenTree/issues/7593
-            if math.isnan(self.data_numeric) or math.isinf(self.data_numeric):
-                self.data_numeric = None
+            if math.isnan(value) or math.isinf(value):
+                value = None
+
+        return value
 
     def check_permission(self, permission, user):
         """Check if the user has the required permission for this parameter."""
@@ -2895,6 +3075,45 @@ class BarcodeScanResult(InvenTree.models.InvenTreeModel):
     )
 
 
+class BarcodeIndex(models.Model):
+    """Index of the third-party barcodes which are assigned to database objects.
+
+    Maps the hash of each assigned barcode to the model instance it is assigned to,
+    so that a scanned barcode can be resolved without querying each barcode model in turn.
+
+    Entries are maintained when a barcode is assigned or unassigned (see InvenTreeBarcodeMixin).
+    Entries are verified against the model instance when read, so a stale entry is never matched.
+
+    Attributes:
+        barcode_hash: Hash of the assigned barcode data
+        model_type: The barcode model type (e.g. 'stockitem')
+        model_id: The ID of the model instance
+    """
+
+    class Meta:
+        """Model meta options."""
+
+        verbose_name = _('Barcode Index')
+        unique_together = [('model_type', 'model_id')]
+
+    barcode_hash = models.CharField(
+        max_length=128,
+        db_index=True,
+        verbose_name=_('Barcode Hash'),
+        help_text=_('Unique hash of barcode data'),
+    )
+
+    model_type = models.CharField(
+        max_length=100,
+        verbose_name=_('Model type'),
+        help_text=_('Model type of the barcode target'),
+    )
+
+    model_id = models.PositiveIntegerField(
+        verbose_name=_('Model ID'), help_text=_('ID of the barcode target')
+    )
+
+
 class DataOutput(models.Model):
     """Model for storing generated data output from various processes.
 
@@ -2912,6 +3131,7 @@ class DataOutput(models.Model):
         plugin: Key for the plugin which generated the data output (if applicable)
         output: File field for storing the generated file
         errors: JSON field for storing any errors generated during the data output generation process
+        checkpoint: JSON field for storing the state of a (resumable) data output generation process
     """
 
     class DataOutputTypes(StringEnum):
@@ -2943,6 +3163,8 @@ class DataOutput(models.Model):
 
     errors = models.JSONField(blank=True, null=True)
 
+    checkpoint = models.JSONField(blank=True, null=True)
+
     def mark_complete(self, progress: int = 100, output: Optional[ContentFile] = None):
         """Mark the data output generation process as complete.
 
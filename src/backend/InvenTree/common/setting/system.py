@@ -60,6 +60,13 @@ def validate_part_name_format(value):
     return True
 
 
+def reset_serial_number_counters(setting):
+    """Remove all serial number counters (these are re-seeded when next required)."""
+    from stock.models import SerialNumberCounter
+
+    SerialNumberCounter.objects.all().delete()
+
+
 def update_instance_name(setting):
     """Update the first site objects name to instance name."""
     if not django_settings.SITE_MULTI:
@@ -709,6 +716,7 @@ SYSTEM_SETTINGS: dict[str, InvenTreeSettingsKeyType] = {
         'description': _('Serial numbers for stock items must be globally unique'),
         'default': False,
         'validator': bool,
+        'after_save': reset_serial_number_counters,
     },
     'STOCK_DELETE_DEPLETED_DEFAULT': {
         'name': _('Delete Depleted Stock'),
@@ -22,6 +22,9 @@ from InvenTree.tasks import ScheduledTask, scheduled_task
 tracer = trace.get_tracer(__name__)
 logger = structlog.get_logger('inventree')
 
+# Number of parameters to process (and commit) at once when rebuilding parameters
+REBUILD_PARAMETERS_BATCH_SIZE = 2000
+
 
 @tracer.start_as_current_span('cleanup_old_data_outputs')
 @scheduled_task(ScheduledTask.DAILY)
@@ -175,12 +178,28 @@ def delete_old_notes_images():
 
 
 @tracer.start_as_current_span('rebuild_parameters')
-def rebuild_parameters(template_id):
+def rebuild_parameters(template_id, batch_size: int = REBUILD_PARAMETERS_BATCH_SIZE):
     """Rebuild all parameters for a given template.
 
     This function is called when a base template is changed,
     which may cause the base unit to be adjusted.
+
+    Arguments:
+        template_id: ID of the ParameterTemplate to rebuild
+        batch_size: Number of parameters to process in each batch
+
+    Parameters are processed in batches (ordered by primary key):
+
+    - Each distinct data value is converted only once
+    - Only parameters whose numeric value has changed are updated (using bulk_update)
+    - The updates for each batch are committed before the next batch is processed
+
+    If the process is interrupted (e.g. the worker is restarted), a subsequent call
+    (for the same template units) continues from the last processed parameter,
+    which is recorded in the 'checkpoint' field of the template.
     """
+    from django.db import transaction
+
     from common.models import Parameter, ParameterTemplate
 
     try:
@@ -190,17 +209,68 @@ def rebuild_parameters(template_id):
 
     parameters = Parameter.objects.filter(template=template)
 
+    # Checkpoint is only valid for the same template units
+    checkpoint = template.checkpoint or {}
+
+    if checkpoint.get('units') == template.units:
+        last_id = checkpoint.get('last_id', 0)
+        logger.info(
+            "Resuming parameter rebuild for template '%s' after parameter %s",
+            template.name,
+            last_id,
+        )
+    else:
+        last_id = 0
+
+    total = parameters.filter(pk__gt=last_id).count()
+
+    # Map of {data: numeric value} for each distinct data value
+    values = {}
+
     n = 0
+    processed = 0
+
+    while True:
+        batch = list(
+            parameters
+            .filter(pk__gt=last_id)
+            .order_by('pk')
+            .values_list('pk', 'data', 'data_numeric')[:batch_size]
+        )
+
+        if not batch:
+            break
+
+        updates = []
+
+        for pk, data, value_old in batch:
+            if data not in values:
+                values[data] = Parameter.convert_numeric_value(data, template.units)
+
+            # Update the parameter if the numeric value has changed
+            if value_old != values[data]:
+                updates.append(Parameter(pk=pk, data_numeric=values[data]))
+
+        last_id = batch[-1][0]
+        processed += len(batch)
 
-    for parameter in parameters:
-        # Update the parameter if the numeric value has changed
-        value_old = parameter.data_numeric
-        parameter.calculate_numeric_value()
+        # Note: update() is used to avoid triggering the post_save signal for the template
+        with transaction.atomic():
+            Parameter.objects.bulk_update(updates, ['data_numeric'])
+            ParameterTemplate.objects.filter(pk=template.pk).update(
+                checkpoint={'units': template.units, 'last_id': last_id}
+            )
+
+        n += len(updates)
+
+        logger.info(
+            "Rebuilding parameters for template '%s': %s / %s processed",
+            template.name,
+            processed,
+            total,
+        )
 
-        if value_old != parameter.data_numeric:
-            parameter.full_clean()
-            parameter.save()
-            n += 1
+    ParameterTemplate.objects.filter(pk=template.pk).update(checkpoint=None)
 
     if n > 0:
         logger.info("Rebuilt %s parameters for template '%s'", n, template.name)
@@ -24,6 +24,7 @@ from PIL import Image
 import common.validators
 from common.notifications import trigger_notification
 from common.settings import get_global_setting, set_global_setting
+from InvenTree.cache import LocalLRUCache
 from InvenTree.helpers import str2bool
 from InvenTree.unit_test import (
     AdminTestCase,
@@ -37,6 +38,7 @@ from plugin import registry
 
 from .api import WebhookView
 from .models import (
+    SETTINGS_LOCAL_CACHE,
     Attachment,
     CustomUnit,
     InvenTreeCustomUserStateModel,
@@ -528,6 +530,104 @@ class SettingsTest(InvenTreeTestCase):
             value = InvenTreeUserSetting.get_setting(key, user=user)
             self.assertEqual(value, user.pk)
 
+    def test_local_cache(self):
+        """Test the bounded process-local cache."""
+        lru = LocalLRUCache(maxsize=2)
+
+        lru.set('a', 1, version=1)
+        lru.set('b', 2, version=1)
+        self.assertEqual(lru.get('a', version=1), 1)
+
+        # Adding a third entry evicts the least recently used entry
+        lru.set('c', 3, version=1)
+        self.assertEqual(len(lru), 2)
+        self.assertIsNone(lru.get('b', version=1))
+        self.assertEqual(lru.get('c', version=1), 3)
+
+        # A version mismatch evicts the entry
+        self.assertIsNone(lru.get('a', version=2))
+        self.assertEqual(len(lru), 1)
+
+        stats = lru.stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['hit_ratio'], 0.5)
+
+        lru.clear()
+        self.assertEqual(len(lru), 0)
+        self.assertEqual(lru.stats()['hits'], 0)
+
+    @override_settings(GLOBAL_CACHE_ENABLED=True)
+    def test_local_setting_caching(self):
+        """Test the process-local cache tier for settings objects."""
+        key = 'PART_NAME_FORMAT'
+        cache_key = InvenTreeSetting.create_cache_key(key)
+
+        cache.clear()
+        SETTINGS_LOCAL_CACHE.clear()
+
+        version = InvenTreeSetting.get_cache_version()
+
+        # Always re-read the shared version stamp
+        with mock.patch.object(version, 'interval', 0):
+            InvenTreeSetting.set_setting(key, 'A', None)
+
+            # First lookup populates the local cache
+            misses = SETTINGS_LOCAL_CACHE.misses
+            self.assertEqual(InvenTreeSetting.get_setting(key), 'A')
+            self.assertEqual(SETTINGS_LOCAL_CACHE.misses, misses + 1)
+            self.assertIn(cache_key, SETTINGS_LOCAL_CACHE._data)
+
+            # Second lookup is served from the local cache
+            hits = SETTINGS_LOCAL_CACHE.hits
+
+            with mock.patch.object(cache, 'get', wraps=cache.get) as cache_get:
+                self.assertEqual(InvenTreeSetting.get_setting(key), 'A')
+                self.assertNotIn(mock.call(cache_key), cache_get.call_args_list)
+
+            self.assertEqual(SETTINGS_LOCAL_CACHE.hits, hits + 1)
+
+            # Each lookup returns a separate instance
+            self.assertIsNot(
+                SETTINGS_LOCAL_CACHE.get(cache_key, version.get()),
+                SETTINGS_LOCAL_CACHE.get(cache_key, version.get()),
+            )
+
+            # Simulate an update from another process
+            # - the database and global cache are updated
+            # - the shared version stamp is incremented
+            setting = InvenTreeSetting.objects.get(key=key)
+            InvenTreeSetting.objects.filter(pk=setting.pk).update(value='B')
+            setting.value = 'B'
+            cache.set(cache_key, setting)
+
+            self.assertEqual(InvenTreeSetting.get_setting(key), 'A')
+            version.bump()
+            self.assertEqual(InvenTreeSetting.get_setting(key), 'B')
+
+            # Saving user settings or internal settings does not invalidate global settings
+            stamp = version.get()
+            InvenTreeUserSetting.set_setting(
+                'SEARCH_PREVIEW_RESULTS', 5, None, user=self.user
+            )
+            InvenTreeSetting.set_setting('_INTERNAL_TIMESTAMP', 'X', None)
+            self.assertEqual(version.get(), stamp)
+            self.assertIn(cache_key, SETTINGS_LOCAL_CACHE._data)
+
+            # Internal settings are never stored in the local cache
+            self.assertEqual(InvenTreeSetting.get_setting('_INTERNAL_TIMESTAMP'), 'X')
+            self.assertNotIn(
+                InvenTreeSetting.create_cache_key('_INTERNAL_TIMESTAMP'),
+                SETTINGS_LOCAL_CACHE._data,
+            )
+
+            # Saving a setting evicts it from the local cache
+            InvenTreeSetting.set_setting(key, 'C', None)
+            self.assertNotIn(cache_key, SETTINGS_LOCAL_CACHE._data)
+            self.assertEqual(InvenTreeSetting.get_setting(key), 'C')
+
+        SETTINGS_LOCAL_CACHE.clear()
+
     def test_set_global_warning(self):
         """Test set_global_warning function."""
         from common.setting.system import SystemSetId
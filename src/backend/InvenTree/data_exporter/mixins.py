@@ -1,10 +1,12 @@
 """Mixin classes for the exporter app."""
 
+import itertools
 from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 
 from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -15,6 +17,7 @@ from taggit.serializers import TagListSerializerField
 
 import data_exporter.serializers
 import data_exporter.tasks
+import data_exporter.writers
 import InvenTree.exceptions
 from common.models import DataOutput
 from InvenTree.helpers import str2bool
@@ -209,6 +212,43 @@ class DataExportSerializerMixin:
 
         return dataset.export(file_format)
 
+    def export_to_stream(
+        self, data: Iterable[dict], headers: OrderedDict, file_format, filename: str
+    ) -> File:
+        """Export the provided rows to a file, without holding the entire dataset in memory.
+
+        Rows are written to a temporary file as they are consumed from the provided iterable.
+        If streaming is not supported for the specified file format, the data is exported via export_to_file.
+
+        Arguments:
+            data: Iterable of serialized rows to export
+            headers: The headers to use for the exported data {field: label}
+            file_format: The file format to export to
+            filename: The filename for the exported file
+
+        Returns:
+            File object containing the exported data
+        """
+        field_names = list(headers.keys())
+
+        writer = data_exporter.writers.get_export_writer(
+            file_format, list(headers.values())
+        )
+
+        if writer is None:
+            return ContentFile(
+                self.export_to_file(data, headers, file_format), filename
+            )
+
+        try:
+            for row in data:
+                writer.write_row([self.get_nested_value(row, f) for f in field_names])
+        except Exception:
+            writer.close()
+            raise
+
+        return writer.to_file(filename)
+
 
 class DataExportViewMixin:
     """An API view mixin for directly exporting selected data.
@@ -349,7 +389,6 @@ class DataExportViewMixin:
             context.update(**query_params)
             context['request'] = request
 
-        data = None
         serializer = serializer_class(context=context, exporting=True)
         serializer.initial_data = queryset
 
@@ -371,17 +410,22 @@ class DataExportViewMixin:
             raise ValidationError(export_error)
 
         # The provided plugin is responsible for exporting the data
-        # The returned data *must* be a list of dict objects
+        # The data is provided in chunks - each chunk *must* be a list of dict objects
         try:
-            data = export_plugin.export_data(
-                queryset,
-                serializer_class,
-                headers,
-                export_context,
-                output,
-                serializer_context=context,
+            chunks = iter(
+                export_plugin.export_data_stream(
+                    queryset,
+                    serializer_class,
+                    headers,
+                    export_context,
+                    output,
+                    serializer_context=context,
+                )
             )
 
+            # Note: The headers may depend on the first chunk of data
+            first_chunk = next(chunks, [])
+
         except Exception as e:
             InvenTree.exceptions.log_error('export_data', plugin=export_plugin.slug)
 
@@ -390,7 +434,7 @@ class DataExportViewMixin:
 
             raise ValidationError(export_error)
 
-        if not isinstance(data, list):
+        if not isinstance(first_chunk, list):
             raise ValidationError(
                 _('Data export plugin returned incorrect data format')
             )
@@ -408,16 +452,38 @@ class DataExportViewMixin:
 
                 raise ValidationError(export_error)
 
+        def export_rows():
+            """Iterate through each row of exported data, one chunk at a time.
+
+            Yields:
+                dict: The exported data for each row
+
+            Raises:
+                ValidationError: If the export plugin returns data in an incorrect format
+            """
+            for chunk in itertools.chain([first_chunk], chunks):
+                if not isinstance(chunk, list):
+                    raise ValidationError(
+                        _('Data export plugin returned incorrect data format')
+                    )
+
+                yield from chunk
+
         # Now, export the data to file
         try:
-            datafile = serializer.export_to_file(data, headers, export_format)
+            datafile = serializer.export_to_stream(
+                export_rows(), headers, export_format, filename
+            )
         except Exception as e:
             InvenTree.exceptions.log_error('export_to_file', plugin=export_plugin.slug)
             output.mark_failure(error=str(e))
             raise ValidationError(_('Error occurred during data export'))
 
         # Update the output object with the exported data
-        output.mark_complete(output=ContentFile(datafile, filename))
+        try:
+            output.mark_complete(output=datafile)
+        finally:
+            datafile.close()
 
     def get(self, request, *args, **kwargs):
         """Override the GET method to determine export options."""
@@ -0,0 +1,154 @@
+"""File writers for streaming exported data to disk.
+
+Rather than building the entire exported dataset in memory,
+these writers append rows to a temporary file as they are generated.
+"""
+
+import csv
+import datetime
+import io
+import tempfile
+from decimal import Decimal
+from typing import Any, Optional
+
+from django.core.files import File
+
+# Cell types which can be written directly to an Excel worksheet
+XLSX_CELL_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    Decimal,
+    datetime.date,
+    datetime.datetime,
+    datetime.time,
+    datetime.timedelta,
+)
+
+
+class ExportWriter:
+    """Base class for writing exported data to a temporary file.
+
+    Attributes:
+        headers: List of column labels, written as the first row of the file
+    """
+
+    def __init__(self, headers: list):
+        """Initialize the writer, and open a temporary file."""
+        self.headers = headers
+        self.file = tempfile.TemporaryFile()  # noqa: SIM115
+        self.write_headers()
+
+    def write_headers(self):
+        """Write the header row to the file."""
+        raise NotImplementedError
+
+    def write_row(self, row: list):
+        """Write a single row of data to the file."""
+        raise NotImplementedError
+
+    def finish(self):
+        """Flush any pending data to the file."""
+
+    def close(self):
+        """Close the underlying temporary file (discarding the data)."""
+        self.file.close()
+
+    def to_file(self, filename: str) -> File:
+        """Finalize the output, and return a file object for storage."""
+        self.finish()
+        self.file.seek(0)
+
+        return File(self.file, name=filename)
+
+
+class CsvExportWriter(ExportWriter):
+    """Write exported data to a delimited text file (CSV / TSV)."""
+
+    def __init__(self, headers: list, delimiter: str = ','):
+        """Initialize the writer with the specified column delimiter."""
+        self.delimiter = delimiter
+        super().__init__(headers)
+
+    def write_headers(self):
+        """Write the header row to the file."""
+        self.stream = io.TextIOWrapper(self.file, encoding='utf-8', newline='')
+        self.writer = csv.writer(self.stream, delimiter=self.delimiter)
+        self.writer.writerow(self.headers)
+
+    def write_row(self, row: list):
+        """Write a single row of data to the file."""
+        self.writer.writerow(row)
+
+    def finish(self):
+        """Flush any buffered text to the underlying file."""
+        self.stream.flush()
+
+        # Detach the text wrapper, so that it does not close the underlying file
+        self.stream.detach()
+
+
+class XlsxExportWriter(ExportWriter):
+    """Write exported data to an Excel workbook.
+
+    Uses the 'write only' mode of openpyxl, which streams rows to disk.
+    """
+
+    def write_headers(self):
+        """Create the workbook, and write the header row."""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
+        self.workbook = Workbook(write_only=True)
+        self.worksheet = self.workbook.create_sheet('Tablib Dataset')
+        self.worksheet.freeze_panes = 'A2'
+
+        bold = Font(bold=True)
+        header_cells = []
+
+        for header in self.headers:
+            cell = WriteOnlyCell(self.worksheet, value=header)
+            cell.font = bold
+            header_cells.append(cell)
+
+        self.worksheet.append(header_cells)
+
+    def write_row(self, row: list):
+        """Write a single row of data to the worksheet."""
+        self.worksheet.append([self.cell_value(value) for value in row])
+
+    @staticmethod
+    def cell_value(value: Any) -> Any:
+        """Convert a value to a type which is supported by openpyxl."""
+        if value is None or isinstance(value, XLSX_CELL_TYPES):
+            return value
+
+        return str(value)
+
+    def finish(self):
+        """Write the completed workbook to the file."""
+        self.workbook.save(self.file)
+
+
+def get_export_writer(file_format: str, headers: list) -> Optional[ExportWriter]:
+    """Return a streaming writer for the specified file format.
+
+    Arguments:
+        file_format: The file format to export to
+        headers: List of column labels
+
+    Returns:
+        An ExportWriter instance, or None if streaming is not supported for this format
+    """
+    file_format = str(file_format).lower()
+
+    if file_format == 'csv':
+        return CsvExportWriter(headers, delimiter=',')
+    elif file_format == 'tsv':
+        return CsvExportWriter(headers, delimiter='\t')
+    elif file_format == 'xlsx':
+        return XlsxExportWriter(headers)
+
+    return None
@@ -1,14 +1,15 @@
 """Model definitions for the 'importer' app."""
 
 import json
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.validators import FileExtensionValidator
-from django.db import models
+from django.db import DatabaseError, models, transaction
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -43,6 +44,9 @@ class DataImportSession(models.Model):
 
     ID_FIELD_LABEL = 'id'
 
+    # Number of rows to process (and write to the database) in a single batch
+    IMPORT_CHUNK_SIZE: int = 500
+
     class ModelChoices(RenderChoices):
         """Model choices for data import sessions."""
 
@@ -299,7 +303,11 @@ class DataImportSession(models.Model):
         offload_task(importer.tasks.import_data, self.pk, group='importer')
 
     def import_data(self) -> None:
-        """Perform the data import process for this session."""
+        """Perform the data import process for this session.
+
+        - Related field values are resolved for the entire file up-front
+        - Rows are extracted, validated and written to the database in chunks
+        """
         # Clear any existing data rows
         self.rows.all().delete()
 
@@ -312,37 +320,175 @@ class DataImportSession(models.Model):
 
         headers = df.headers
 
-        imported_rows = []
-
         field_mapping = self.field_mapping
         available_fields = self.available_fields()
 
-        # Iterate through each "row" in the data file, and create a new DataImportRow object
-        for idx, row in enumerate(df):
-            row_data = dict(zip(headers, row, strict=False))
+        self.resolve_related_values(df, field_mapping, available_fields)
 
-            # Skip completely empty rows
-            if not any(row_data.values()):
-                continue
+        def data_rows():
+            """Iterate through each non-empty row in the data file.
 
-            row = DataImportRow(session=self, row_data=row_data, row_index=idx)
+            Yields:
+                tuple: The (index, data) for each row, where data is a dict of {header: value}
+            """
+            for idx, row in enumerate(df):
+                row_data = dict(zip(headers, row, strict=False))
 
-            row.extract_data(
-                field_mapping=field_mapping,
-                available_fields=available_fields,
-                commit=False,
-            )
+                # Skip completely empty rows
+                if any(row_data.values()):
+                    yield idx, row_data
+
+        with transaction.atomic():
+            for chunk in InvenTree.helpers.chunked(data_rows(), self.IMPORT_CHUNK_SIZE):
+                imported_rows = []
+
+                # Create a new DataImportRow object for each row in the chunk
+                for idx, row_data in chunk:
+                    row = DataImportRow(session=self, row_data=row_data, row_index=idx)
 
-            row.valid = row.validate(commit=False)
-            imported_rows.append(row)
+                    row.extract_data(
+                        field_mapping=field_mapping,
+                        available_fields=available_fields,
+                        commit=False,
+                    )
 
-        # Perform database writes as a single operation
-        DataImportRow.objects.bulk_create(imported_rows)
+                    row.valid = row.validate(commit=False)
+                    imported_rows.append(row)
+
+                DataImportRow.objects.bulk_create(imported_rows)
+
+        self._related_values = {}
 
         # Mark the import task as "PROCESSING"
         self.status = DataImportStatusCode.PROCESSING.value
         self.save()
 
+    def resolve_related_values(
+        self, dataset, field_mapping: dict, available_fields: dict
+    ) -> None:
+        """Resolve the related field values for each mapped column in the dataset.
+
+        The resolved values are cached against this session,
+        and are used by DataImportRow.lookup_related_field.
+
+        Arguments:
+            dataset: The tablib dataset being imported
+            field_mapping: A dict of field -> column mappings
+            available_fields: A dict of available serializer fields
+        """
+        self._related_values = {}
+
+        field_overrides = self.field_overrides or {}
+
+        for field, col in field_mapping.items():
+            if field in field_overrides or not col or col not in dataset.headers:
+                continue
+
+            if available_fields.get(field, {}).get('type', None) != 'related field':
+                continue
+
+            if not (model := self.get_related_model(field)):
+                continue
+
+            values = {value for value in dataset[col] if value not in [None, '']}
+
+            self._related_values[field] = self.lookup_related_values(
+                field, model, values
+            )
+
+    def lookup_related_values(
+        self, field_name: str, model, values: Iterable
+    ) -> dict[Any, int]:
+        """Match a set of values against the allowable import fields of a related model.
+
+        This performs the same matching as DataImportRow.lookup_related_field,
+        but requires (at most) one query for each ID field, rather than one for each value.
+
+        Arguments:
+            field_name: The name of the field to perform the lookup against
+            model: The related model class
+            values: The distinct values to look up
+
+        Returns:
+            A dict of value -> primary key, for each value which matches exactly one record
+        """
+        base_filters = (self.field_filters or {}).get(field_name, {})
+
+        # First priority is the PK (primary key) field
+        id_fields = ['pk', *(getattr(model, 'IMPORT_ID_FIELDS', None) or [])]
+
+        matches = defaultdict(set)
+
+        for id_field in id_fields:
+            if id_field == 'pk':
+                model_field = model._meta.pk
+            else:
+                try:
+                    model_field = model._meta.get_field(id_field)
+                except models.FieldDoesNotExist:
+                    continue
+
+            # Map each database value back to the original value(s) in the file
+            keys = defaultdict(list)
+
+            for value in values:
+                try:
+                    keys[model_field.to_python(value)].append(value)
+                except (DjangoValidationError, TypeError, ValueError):
+                    continue
+
+            results = defaultdict(list)
+
+            for chunk in InvenTree.helpers.chunked(keys.keys(), self.IMPORT_CHUNK_SIZE):
+                queryset = model.objects.filter(
+                    **{f'{id_field}__in': chunk}, **base_filters
+                )
+
+                for key, pk in queryset.values_list(id_field, 'pk'):
+                    results[key].append(pk)
+
+            for key, pks in results.items():
+                # We have a single match against this field
+                if len(pks) == 1:
+                    for value in keys.get(key, []):
+                        matches[value].add(pks[0])
+
+        return {value: pks.pop() for value, pks in matches.items() if len(pks) == 1}
+
+    def get_related_value(self, field_name: str, value: Any) -> Optional[int]:
+        """Return the cached primary key for a related field value (if available)."""
+        return getattr(self, '_related_values', {}).get(field_name, {}).get(value)
+
+    def commit_rows(self, rows: Iterable, request=None) -> None:
+        """Commit the provided rows to the database.
+
+        Rows are committed in chunks, each within a single database transaction.
+        Each row is committed within a savepoint, so that a database error
+        only rolls back that row (and is recorded against it).
+
+        Arguments:
+            rows: The DataImportRow objects to commit
+            request: The request object (if available) for extracting user information
+        """
+        for chunk in InvenTree.helpers.chunked(rows, self.IMPORT_CHUNK_SIZE):
+            with transaction.atomic():
+                for row in chunk:
+                    row.session = self
+
+                    try:
+                        with transaction.atomic():
+                            row.validate(commit=True, request=request, save_row=False)
+                    except DatabaseError as e:
+                        row.errors = {'non_field_errors': str(e)}
+                        row.valid = False
+                        row.complete = False
+
+                DataImportRow.objects.bulk_update(
+                    chunk, ['errors', 'valid', 'complete']
+                )
+
+        self.check_complete()
+
     def check_complete(self) -> bool:
         """Check if the import session is complete."""
         if self.completed_row_count < self.row_count:
@@ -745,6 +891,10 @@ class DataImportRow(models.Model):
         if field_name is None or field_name == '':
             return value
 
+        # Check for a value which was resolved when the data file was loaded
+        if (pk := self.session.get_related_value(field_name, value)) is not None:
+            return pk
+
         if field_name in self.related_field_map:
             model = self.related_field_map[field_name]
         else:
@@ -820,12 +970,13 @@ class DataImportRow(models.Model):
                 context={'request': request},
             )
 
-    def validate(self, commit=False, request=None) -> bool:
+    def validate(self, commit=False, request=None, save_row=True) -> bool:
         """Validate the data in this row against the linked serializer.
 
         Arguments:
             commit: If True, the data is saved to the database (if validation passes)
             request: The request object (if available) for extracting user information
+            save_row: If True, the row (and session status) is updated after commit
 
         Returns:
             True if the data is valid, False otherwise
@@ -894,7 +1045,8 @@ class DataImportRow(models.Model):
                     self.errors = {'non_field_errors': str(e)}
                     result = False
 
-                self.save()
-                self.session.check_complete()
+                if save_row:
+                    self.save()
+                    self.session.check_complete()
 
         return result
@@ -191,7 +191,7 @@ class DataImportAcceptRowSerializer(serializers.Serializer):
             raise ValidationError(_('No rows provided'))
 
         for row in rows:
-            if row.session != session:
+            if session is None or row.session_id != session.pk:
                 raise ValidationError(_('Row does not belong to this session'))
 
             if not row.valid:
@@ -208,10 +208,7 @@ class DataImportAcceptRowSerializer(serializers.Serializer):
 
         request = self.context.get('request', None)
 
-        for row in rows:
-            row.validate(commit=True, request=request)
-
         if session := self.context.get('session', None):
-            session.check_complete()
+            session.commit_rows(rows, request=request)
 
         return rows
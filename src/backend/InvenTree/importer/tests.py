@@ -1,8 +1,10 @@
 """Unit tests for the 'importer' app."""
 
 import os
+from unittest import mock
 
 from django.core.files.base import ContentFile
+from django.db import IntegrityError
 from django.urls import reverse
 
 from importer.models import DataImportRow, DataImportSession
@@ -70,6 +72,87 @@ class ImporterTest(ImporterMixin, InvenTreeTestCase):
         # Check that the new companies have been created
         self.assertEqual(n + 12, Company.objects.count())
 
+    def test_related_field_lookup(self):
+        """Test that related field values are resolved in bulk."""
+        from part.models import PartCategory
+
+        electronics = PartCategory.objects.create(name='Electronics')
+        mechanical = PartCategory.objects.create(name='Mechanical')
+        PartCategory.objects.create(name='Duplicate', parent=electronics)
+        PartCategory.objects.create(name='Duplicate', parent=mechanical)
+
+        lines = ['Name,Description,Parent Category']
+
+        for idx in range(50):
+            parent = [electronics.pk, 'Mechanical', 'Electronics/Duplicate'][idx % 3]
+            lines.append(f'Sub {idx},Subcategory {idx},{parent}')
+
+        lines.append('Orphan,Ambiguous parent,Duplicate')
+
+        session = DataImportSession.objects.create(
+            data_file=ContentFile('\n'.join(lines), 'categories.csv'),
+            model_type='partcategory',
+        )
+
+        self.assertEqual(session.field_mapping['parent'], 'Parent Category')
+
+        values = session.lookup_related_values(
+            'parent',
+            PartCategory,
+            [str(electronics.pk), 'Mechanical', 'Duplicate', 'Missing'],
+        )
+
+        # Ambiguous and missing values are not resolved
+        self.assertEqual(
+            values, {str(electronics.pk): electronics.pk, 'Mechanical': mechanical.pk}
+        )
+
+        session.import_data()
+        self.assertEqual(session.rows.count(), 51)
+
+        duplicate = PartCategory.objects.get(name='Duplicate', parent=electronics)
+
+        for row in session.rows.all():
+            if row.row_data['Name'] == 'Orphan':
+                self.assertEqual(row.data['parent'], 'Duplicate')
+                self.assertFalse(row.valid)
+                continue
+
+            self.assertIn(
+                row.data['parent'], [electronics.pk, mechanical.pk, duplicate.pk]
+            )
+            self.assertTrue(row.valid)
+
+        # Accept all valid rows (one row fails with a database error)
+        rows = session.rows.filter(valid=True)
+
+        validate = DataImportRow.validate
+
+        def validate_row(row, *args, **kwargs):
+            if row.row_data['Name'] == 'Sub 0':
+                PartCategory.objects.create(name='Partial')
+                raise IntegrityError('Duplicate key')
+
+            return validate(row, *args, **kwargs)
+
+        with mock.patch.object(
+            DataImportRow, 'validate', autospec=True, side_effect=validate_row
+        ):
+            session.commit_rows(rows)
+
+        # Only the failed row is rolled back
+        self.assertEqual(session.completed_row_count, 49)
+        self.assertEqual(
+            PartCategory.objects.filter(name__startswith='Sub ').count(), 49
+        )
+        self.assertFalse(PartCategory.objects.filter(name='Partial').exists())
+        # 17 imported rows, plus the 'Duplicate' category created above
+        self.assertEqual(mechanical.children.count(), 18)
+
+        row = session.rows.get(row_data__Name='Sub 0')
+        self.assertFalse(row.complete)
+        self.assertIn('Duplicate key', str(row.errors))
+
     def test_field_defaults(self):
         """Test default field values."""
 
@@ -48,6 +48,7 @@ from InvenTree.mixins import (
     RetrieveUpdateDestroyAPI,
     SerializerContextMixin,
 )
+from InvenTree.pagination import InvenTreePagination
 from order import models, serializers
 from order.status_codes import (
     PurchaseOrderStatus,
@@ -399,6 +400,7 @@ class PurchaseOrderList(
     filterset_class = PurchaseOrderFilter
     filter_backends = SEARCH_ORDER_FILTER
     output_options = PurchaseOrderOutputOptions
+    pagination_class = InvenTreePagination
 
     ordering_field_aliases = {
         'reference': ['reference_int', 'reference'],
@@ -870,6 +872,7 @@ class SalesOrderList(
     filterset_class = SalesOrderFilter
     filter_backends = SEARCH_ORDER_FILTER
     output_options = SalesOrderOutputOptions
+    pagination_class = InvenTreePagination
 
     ordering_field_aliases = {
         'reference': ['reference_int', 'reference'],
@@ -1569,6 +1572,7 @@ class ReturnOrderList(
     filter_backends = SEARCH_ORDER_FILTER
 
     output_options = ReturnOrderOutputOptions
+    pagination_class = InvenTreePagination
 
     ordering_field_aliases = {
         'reference': ['reference_int', 'reference'],
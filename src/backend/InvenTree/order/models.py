@@ -16,7 +16,6 @@ from django.utils.translation import gettext_lazy as _
 
 import structlog
 from djmoney.contrib.exchange.exceptions import MissingRate
-from djmoney.contrib.exchange.models import convert_money
 from djmoney.money import Money
 from mptt.models import TreeForeignKey
 
@@ -31,7 +30,7 @@ import report.mixins
 import stock.models
 import users.models as UserModels
 from build.status_codes import BuildStatus
-from common.currency import currency_code_default
+from common.currency import currency_code_default, get_exchange_rates
 from common.notifications import InvenTreeNotificationBodies
 from common.settings import get_global_setting
 from company.models import Address, Company, Contact, SupplierPart
@@ -56,6 +55,7 @@ from order.status_codes import (
     SalesOrderStatusGroups,
 )
 from part import models as PartModels
+from plugin.base.barcodes.helper import index_barcodes
 from plugin.events import trigger_event
 from stock.status_codes import StockHistoryCode, StockStatus
 
@@ -72,16 +72,10 @@ class TotalPriceMixin(models.Model):
 
     def save(self, *args, **kwargs):
         """Update the total_price field when saved."""
-        # Recalculate total_price for this order
+        # Recalculate total_price for this order (once per save)
         self.update_total_price(commit=False)
 
-        if hasattr(self, '_SAVING_TOTAL_PRICE') and self._SAVING_TOTAL_PRICE:
-            # Avoid recursion on save
-            return super().save(*args, **kwargs)
-        self._SAVING_TOTAL_PRICE = True
-
-        # Save the object as we can not access foreign/m2m fields before saving
-        self.update_total_price(commit=True)
+        super().save(*args, **kwargs)
 
     total_price = InvenTreeModelMoneyField(
         null=True,
@@ -143,35 +137,33 @@ class TotalPriceMixin(models.Model):
         if self.pk is None:
             return total
 
-        # order items
-        for line in self.lines.all():
-            if not line.price:
-                continue
+        rates = get_exchange_rates()
 
-            try:
-                total += line.quantity * convert_money(line.price, target_currency)
-            except MissingRate:
-                log_error('order.calculate_total_price')
-                logger.exception("Missing exchange rate for '%s'", target_currency)
+        # Order items, then extra items
+        for lines in [self.lines, self.extra_lines]:
+            price_field = lines.model.PRICE_FIELD
 
-                # Return None to indicate the calculated price is invalid
-                return None
+            # Sum the line totals in each currency (in a single query),
+            # so that only one conversion is required for each currency
+            subtotals: dict[str, Decimal] = {}
 
-        # extra items
-        for line in self.extra_lines.all():
-            if not line.price:
-                continue
+            for quantity, price, currency in lines.filter(**{
+                f'{price_field}__isnull': False
+            }).values_list('quantity', price_field, f'{price_field}_currency'):
+                if not price:
+                    continue
 
-            try:
-                total += line.quantity * convert_money(line.price, target_currency)
-            except MissingRate:
-                # Record the error, try to press on
+                subtotals[currency] = subtotals.get(currency, 0) + quantity * price
 
-                log_error('order.calculate_total_price')
-                logger.exception("Missing exchange rate for '%s'", target_currency)
+            for currency, subtotal in subtotals.items():
+                try:
+                    total += rates.convert(Money(subtotal, currency), target_currency)
+                except MissingRate:
+                    log_error('order.calculate_total_price')
+                    logger.exception("Missing exchange rate for '%s'", target_currency)
 
-                # Return None to indicate the calculated price is invalid
-                return None
+                    # Return None to indicate the calculated price is invalid
+                    return None
 
         # set decimal-places
         total.decimal_places = 4
@@ -980,14 +972,14 @@ class PurchaseOrder(TotalPriceMixin, Order):
             serials: Optional list of serial numbers (optional)
             note: Optional notes for the item (optional)
         """
+        from stock.coalesce import queue_part_updates
+        from stock.events import StockEvents
+
         if self.status != PurchaseOrderStatus.PLACED:
             raise ValidationError(
                 "Lines can only be received against an order marked as 'PLACED'"
             )
 
-        # List of stock items which have been created
-        stock_items: list[stock.models.StockItem] = []
-
         # List of stock items to bulk create
         bulk_create_items: list[stock.models.StockItem] = []
 
@@ -997,9 +989,23 @@ class PurchaseOrder(TotalPriceMixin, Order):
         # List of line items to update
         line_items_to_update: list[PurchaseOrderLineItem] = []
 
+        # Serial numbers to create, grouped by serial number counter (part tree)
+        serial_groups: dict[int, tuple[PartModels.Part, list[str]]] = {}
+
+        # Validation plugins are loaded once (rather than once per serial number)
+        from plugin import PluginMixinEnum, registry
+
+        validation_plugins = registry.with_mixin(PluginMixinEnum.VALIDATION)
+
+        # The default value for the 'delete_on_deplete' field (rather than a setting lookup per item)
+        delete_on_deplete = stock.models.default_delete_on_deplete()
+
         convert_purchase_price = get_global_setting('PURCHASEORDER_CONVERT_CURRENCY')
         default_currency = currency_code_default()
 
+        # Exchange rates are loaded once (rather than once per line)
+        exchange_rates = get_exchange_rates()
+
         # Prefetch line item objects for DB efficiency
         line_items_ids = [item['line_item'].pk for item in items]
 
@@ -1023,6 +1029,9 @@ class PurchaseOrder(TotalPriceMixin, Order):
             if not line_item.part or not line_item.part.part:
                 raise ValidationError({_('Line item is missing a linked part')})
 
+        # Each new stock item is a top-level node, with its own tree_id
+        tree_id = stock.models.StockItem.getNextTreeID()
+
         for item in items:
             # Extract required information
             line_item_id = item['line_item'].pk
@@ -1077,14 +1086,17 @@ class PurchaseOrder(TotalPriceMixin, Order):
             stock_location = item.get('location', location) or line.get_destination()
 
             # Calculate the received quantity in base part units
+            pack_quantity = supplier_part.base_quantity(1)
             stock_quantity = supplier_part.base_quantity(quantity)
 
             # Calculate unit purchase price (in base units)
             if line.purchase_price:
-                purchase_price = line.purchase_price / supplier_part.base_quantity(1)
+                purchase_price = line.purchase_price / pack_quantity
 
                 if convert_purchase_price:
-                    purchase_price = convert_money(purchase_price, default_currency)
+                    purchase_price = exchange_rates.convert(
+                        purchase_price, default_currency
+                    )
             else:
                 purchase_price = None
 
@@ -1100,6 +1112,7 @@ class PurchaseOrder(TotalPriceMixin, Order):
                 'expiry_date': item.get('expiry_date', None),
                 'notes': item.get('note', '') or item.get('notes', ''),
                 'packaging': item.get('packaging') or supplier_part.packaging,
+                'delete_on_deplete': delete_on_deplete,
             }
 
             # Extract the "status" field
@@ -1143,46 +1156,90 @@ class PurchaseOrder(TotalPriceMixin, Order):
                         "Cannot receive items against a build order in state '{build_order.status}'"
                     )
 
-            # Now, create the new stock items
             if serialize:
-                new_items = stock.models.StockItem._create_serial_numbers(
-                    serials=serials, **stock_data
-                )
-
-                for item in new_items:
-                    item.set_status(status, custom_values=custom_stock_status_values)
-                    stock_items.append(item)
+                counter_id = stock.models.SerialNumberCounter.get_tree_id(base_part)
+                serial_groups.setdefault(counter_id, (base_part, []))[1].extend(serials)
 
-            else:
+            # Construct the new stock items (these are created in bulk below)
+            for serial in serials:
                 new_item = stock.models.StockItem(
                     **stock_data,
-                    serial='',
-                    tree_id=stock.models.StockItem.getNextTreeID(),
+                    serial=serial or '',
+                    serial_int=(
+                        stock.models.StockItem.convert_serial_to_int(
+                            serial, plugins=validation_plugins
+                        )
+                        or 0
+                    )
+                    if serial
+                    else 0,
+                    tree_id=tree_id,
                     parent=None,
                     level=0,
                     lft=1,
                     rght=2,
                 )
 
+                tree_id += 1
+
                 new_item.set_status(status, custom_values=custom_stock_status_values)
 
-                if barcode:
+                if barcode and not serialize:
                     new_item.assign_barcode(barcode_data=barcode, save=False)
 
                 bulk_create_items.append(new_item)
 
-        # Bulk create new stock items
+        # Validate all serial numbers against the database, with a single query per part tree.
+        # The serial number counter for each tree is locked (in a consistent order),
+        # so that concurrent requests cannot create duplicate serial numbers
+        serial_counters = []
+
+        for counter_id in sorted(serial_groups.keys()):
+            part, serials = serial_groups[counter_id]
+
+            counter = stock.models.SerialNumberCounter.lock(part)
+            serial_counters.append((counter, serials))
+
+            if len(set(serials)) != len(serials):
+                raise ValidationError({
+                    'serial_numbers': _('Duplicate serial numbers provided')
+                })
+
+            duplicates = stock.models.StockItem.objects.filter(serial__in=serials)
+
+            if counter_id:
+                duplicates = duplicates.filter(part__tree_id=part.tree_id)
+
+            if duplicates.exists():
+                raise ValidationError({
+                    'serial_numbers': _(
+                        'Stock item with this serial number already exists'
+                    )
+                })
+
+        # List of stock items which have been created
+        stock_items: list[stock.models.StockItem] = []
+
+        # Bulk create all new stock items (serialized and non-serialized)
         if len(bulk_create_items) > 0:
             stock.models.StockItem.objects.bulk_create(bulk_create_items)
 
             # Fetch them back again
-            tree_ids = [item.tree_id for item in bulk_create_items]
+            stock_items = list(
+                stock.models.StockItem.objects.filter(
+                    tree_id__in=[item.tree_id for item in bulk_create_items],
+                    level=0,
+                    lft=1,
+                    rght=2,
+                    purchase_order=self,
+                ).select_related('part')
+            )
 
-            created_items = stock.models.StockItem.objects.filter(
-                tree_id__in=tree_ids, level=0, lft=1, rght=2, purchase_order=self
-            ).prefetch_related('location')
+        for counter, serials in serial_counters:
+            counter.update_latest(serials, plugins=validation_plugins)
 
-            stock_items.extend(created_items)
+        # Add any assigned barcodes to the barcode index
+        index_barcodes([item for item in stock_items if item.barcode_hash])
 
         # Generate a new tracking entry for each stock item
         for item in stock_items:
@@ -1191,7 +1248,7 @@ class PurchaseOrder(TotalPriceMixin, Order):
                     StockHistoryCode.RECEIVED_AGAINST_PURCHASE_ORDER,
                     user,
                     deltas={
-                        'location': item.location.pk if item.location else None,
+                        'location': item.location_id,
                         'purchaseorder': self.pk,
                         'quantity': float(item.quantity),
                     },
@@ -1205,6 +1262,13 @@ class PurchaseOrder(TotalPriceMixin, Order):
         # Update received quantity for each line item
         PurchaseOrderLineItem.objects.bulk_update(line_items_to_update, ['received'])
 
+        # Trigger a single 'created' event for all new serialized items
+        if serial_groups:
+            trigger_event(
+                StockEvents.ITEMS_CREATED,
+                ids=[item.pk for item in stock_items if item.serial],
+            )
+
         # Trigger an event for any interested plugins
         trigger_event(
             PurchaseOrderEvents.ITEM_RECEIVED,
@@ -1212,6 +1276,9 @@ class PurchaseOrder(TotalPriceMixin, Order):
             item_ids=[item.pk for item in stock_items],
         )
 
+        # Schedule a single (aggregated) batch of low-stock, pricing and stock totals updates
+        queue_part_updates(line.part.part for line in line_items_to_update)
+
         # Check to auto-complete the PurchaseOrder
         if (
             get_global_setting('PURCHASEORDER_AUTO_COMPLETE', True)
@@ -1757,6 +1824,9 @@ class OrderLineItem(InvenTree.models.InvenTreeMetadataModel):
         target_date: An (optional) date for expected shipment of this line item.
     """
 
+    # Name of the (unit) price field for this line item
+    PRICE_FIELD = 'price'
+
     class Meta:
         """Metaclass options. Abstract ensures no database table is created."""
 
@@ -1904,6 +1974,8 @@ class PurchaseOrderLineItem(OrderLineItem):
         destination: Destination for received items
     """
 
+    PRICE_FIELD = 'purchase_price'
+
     class Meta:
         """Model meta options."""
 
@@ -2110,6 +2182,8 @@ class SalesOrderLineItem(OrderLineItem):
         shipped: The number of items which have actually shipped against this line item
     """
 
+    PRICE_FIELD = 'sale_price'
+
     class Meta:
         """Model meta options."""
 
@@ -3162,3 +3236,74 @@ def _touch_order_updated_at(instance):
 def update_order_on_lineitem_change(sender, instance, **kwargs):
     """Update parent order updated_at when any line item is saved or deleted."""
     _touch_order_updated_at(instance)
+
+
+@receiver(
+    post_save, sender=PurchaseOrderLineItem, dispatch_uid='po_lineitem_stock_totals'
+)
+@receiver(
+    post_delete,
+    sender=PurchaseOrderLineItem,
+    dispatch_uid='po_lineitem_delete_stock_totals',
+)
+@receiver(
+    post_save, sender=SalesOrderAllocation, dispatch_uid='so_allocation_stock_totals'
+)
+@receiver(
+    post_delete,
+    sender=SalesOrderAllocation,
+    dispatch_uid='so_allocation_delete_stock_totals',
+)
+def update_stock_totals_on_line_change(sender, instance, **kwargs):
+    """Refresh the stock totals for the part referenced by a line item or allocation."""
+    from stock.coalesce import queue_stock_cache_invalidation, queue_stock_totals_update
+
+    if InvenTree.ready.isImportingData():
+        return
+
+    queue_stock_cache_invalidation()
+
+    if not PartModels.PartStockTotal.enabled():
+        return
+
+    if isinstance(instance, SalesOrderAllocation):
+        part_ids = stock.models.StockItem.objects.filter(
+            pk=instance.item_id
+        ).values_list('part', flat=True)
+    else:
+        part_ids = SupplierPart.objects.filter(pk=instance.part_id).values_list(
+            'part', flat=True
+        )
+
+    queue_stock_totals_update(part_ids)
+
+
+@receiver(post_save, sender=PurchaseOrder, dispatch_uid='po_stock_totals')
+@receiver(post_save, sender=SalesOrder, dispatch_uid='so_stock_totals')
+@receiver(post_save, sender=SalesOrderShipment, dispatch_uid='so_shipment_stock_totals')
+def update_stock_totals_on_order_change(sender, instance, created, **kwargs):
+    """Refresh the stock totals for all parts referenced by an order (or shipment).
+
+    A change to the order status (or shipment date) affects the quantity
+    which is 'on order' or 'allocated' for each part against the order.
+    """
+    from stock.coalesce import queue_stock_cache_invalidation, queue_stock_totals_update
+
+    if created or InvenTree.ready.isImportingData():
+        return
+
+    queue_stock_cache_invalidation()
+
+    if not PartModels.PartStockTotal.enabled():
+        return
+
+    if isinstance(instance, PurchaseOrder):
+        part_ids = instance.lines.values_list('part__part', flat=True)
+    elif isinstance(instance, SalesOrder):
+        part_ids = SalesOrderAllocation.objects.filter(
+            line__order=instance
+        ).values_list('item__part', flat=True)
+    else:
+        part_ids = instance.allocations.values_list('item__part', flat=True)
+
+    queue_stock_totals_update(part_ids.distinct())
@@ -950,14 +950,8 @@ class PurchaseOrderLineItemReceiveSerializer(serializers.Serializer):
             except DjangoValidationError as e:
                 raise ValidationError({'serial_numbers': e.messages})
 
-            invalid_serials = []
-
-            # Check the serial numbers are valid
-            for serial in data['serials']:
-                try:
-                    base_part.validate_serial_number(serial, raise_error=True)
-                except (ValidationError, DjangoValidationError):
-                    invalid_serials.append(serial)
+            # Check the serial numbers are valid (with a single database query)
+            invalid_serials = base_part.find_conflicting_serial_numbers(data['serials'])
 
             if len(invalid_serials) > 0:
                 msg = _('The following serial numbers already exist or are invalid')
@@ -6,7 +6,9 @@ from decimal import Decimal
 import django.core.exceptions as django_exceptions
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from djmoney.money import Money
 
@@ -479,6 +481,88 @@ class OrderTest(ExchangeRateMixin, PluginRegistryMixin, TestCase):
         self.assertEqual(item.purchase_price_currency, 'CAD')
         self.assertAlmostEqual(item.purchase_price.amount, Decimal(1.25), 3)
 
+    def test_receive_serials(self):
+        """Test receiving serialized items against multiple line items at once."""
+        prt = Part.objects.create(
+            name='Serialized Widget',
+            description='A trackable part',
+            trackable=True,
+            purchaseable=True,
+        )
+
+        sup = Company.objects.get(pk=1)
+        sp = SupplierPart.objects.create(part=prt, supplier=sup, SKU='SERIAL-SKU')
+
+        po = PurchaseOrder.objects.create(
+            supplier=sup, reference='PO-99999', description='Serialized PO'
+        )
+
+        lines = [
+            PurchaseOrderLineItem.objects.create(order=po, part=sp, quantity=100)
+            for _idx in range(3)
+        ]
+
+        po.place_order()
+
+        loc = StockLocation.objects.get(id=1)
+
+        def receive(line, serials):
+            return {'line_item': line, 'quantity': len(serials), 'serials': serials}
+
+        # Duplicated serial numbers across line items are rejected
+        with self.assertRaises(django_exceptions.ValidationError):
+            po.receive_line_items(
+                loc, [receive(lines[0], ['1', '2']), receive(lines[1], ['2'])], None
+            )
+
+        self.assertEqual(StockItem.objects.filter(part=prt).count(), 0)
+
+        items = po.receive_line_items(
+            loc, [receive(lines[0], ['1', '2']), receive(lines[1], ['3'])], None
+        )
+
+        self.assertEqual(items.count(), 3)
+        self.assertEqual(sorted(items.values_list('serial_int', flat=True)), [1, 2, 3])
+
+        for item in items:
+            self.assertEqual(item.quantity, 1)
+            self.assertEqual(item.location, loc)
+            self.assertEqual(item.tracking_info.count(), 1)
+
+        # Serial numbers which already exist in the database are rejected
+        with self.assertRaises(django_exceptions.ValidationError):
+            po.receive_line_items(loc, [receive(lines[2], ['3', '4'])], None)
+
+        # The number of queries does not depend on the number of serial numbers
+        # (except for bulk inserts, which may be split into batches by the database backend)
+        def count_queries(context):
+            return len([
+                query
+                for query in context.captured_queries
+                if not query['sql'].startswith('INSERT INTO "stock_stockitem" ')
+            ])
+
+        with CaptureQueriesContext(connection) as small:
+            po.receive_line_items(
+                loc, [receive(lines[0], ['10', '11']), receive(lines[1], ['12'])], None
+            )
+
+        with CaptureQueriesContext(connection) as large:
+            po.receive_line_items(
+                loc,
+                [
+                    receive(lines[0], [str(x) for x in range(100, 150)]),
+                    receive(lines[1], [str(x) for x in range(200, 250)]),
+                ],
+                None,
+            )
+
+        self.assertEqual(count_queries(small), count_queries(large))
+        self.assertEqual(StockItem.objects.filter(part=prt).count(), 106)
+
+        lines[0].refresh_from_db()
+        self.assertEqual(lines[0].received, 54)
+
     def test_overdue_notification(self):
         """Test overdue purchase order notification.
 
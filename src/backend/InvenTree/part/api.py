@@ -44,6 +44,7 @@ from InvenTree.mixins import (
     SerializerContextMixin,
     UpdateAPI,
 )
+from InvenTree.pagination import InvenTreePagination
 from InvenTree.tasks import offload_task
 from stock.models import StockLocation
 
@@ -1051,6 +1052,7 @@ class PartList(
 
     output_options = PartOutputOptions
     filterset_class = PartFilter
+    pagination_class = InvenTreePagination
     is_create = True
 
     filter_backends = SEARCH_ORDER_FILTER
@@ -309,6 +309,44 @@ def annotate_variant_quantity(subquery: Q, reference: str = 'quantity') -> Query
     )
 
 
+def annotate_stock_total(
+    field: str = 'quantity', reference: str = '', filter: Optional[Q] = None
+) -> QuerySet:
+    """Annotate a pre-calculated stock total against a queryset.
+
+    - Reads the total from the PartStockTotal table (rather than calculating it)
+    - Sums the provided field across all locations for each part
+
+    Arguments:
+        field: The PartStockTotal field to sum (e.g. 'quantity', 'ordering')
+        reference: The relationship reference of the part from the current model
+        filter: Q object which defines how to filter the PartStockTotal entries
+    """
+    return Coalesce(
+        SubquerySum(
+            f'{reference}stock_totals__{field}',
+            filter=filter if filter is not None else Q(),
+        ),
+        Decimal(0),
+        output_field=models.DecimalField(),
+    )
+
+
+def variant_stock_total_query(reference: str = '') -> QuerySet:
+    """Create a queryset to retrieve the pre-calculated stock totals for variant parts.
+
+    - Use with 'annotate_variant_quantity' to sum the totals for all variants of a part
+
+    Arguments:
+        reference: The relationship reference of the part from the current model
+    """
+    return part.models.PartStockTotal.objects.filter(
+        part__tree_id=OuterRef(f'{reference}tree_id'),
+        part__lft__gt=OuterRef(f'{reference}lft'),
+        part__rght__lt=OuterRef(f'{reference}rght'),
+    )
+
+
 def annotate_category_parts() -> QuerySet:
     """Construct a queryset annotation which returns the number of parts in a particular category.
 
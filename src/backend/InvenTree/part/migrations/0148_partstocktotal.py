@@ -0,0 +1,119 @@
+# Generated by Django 5.2.13 on 2026-10-18 12:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("part", "0147_remove_part_default_supplier"),
+        ("stock", "0120_serialnumbercounter"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PartStockTotal",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "quantity",
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        max_digits=19,
+                        verbose_name="Quantity",
+                    ),
+                ),
+                (
+                    "allocated_build",
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        max_digits=19,
+                        verbose_name="Allocated to Builds",
+                    ),
+                ),
+                (
+                    "allocated_sales",
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        max_digits=19,
+                        verbose_name="Allocated to Sales",
+                    ),
+                ),
+                (
+                    "building",
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        max_digits=19,
+                        verbose_name="Building",
+                    ),
+                ),
+                (
+                    "ordering",
+                    models.DecimalField(
+                        decimal_places=5,
+                        default=0,
+                        max_digits=19,
+                        verbose_name="On Order",
+                    ),
+                ),
+                (
+                    "updated",
+                    models.DateTimeField(auto_now=True, verbose_name="Updated"),
+                ),
+                (
+                    "location",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="part_stock_totals",
+                        to="stock.stocklocation",
+                        verbose_name="Location",
+                    ),
+                ),
+                (
+                    "part",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_totals",
+                        to="part.part",
+                        verbose_name="Part",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Part Stock Total",
+                "indexes": [
+                    models.Index(
+                        fields=["part", "location"],
+                        name="part_partst_part_id_8889e1_idx",
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("location__isnull", False)),
+                        fields=("part", "location"),
+                        name="unique_part_stock_total_location",
+                    ),
+                    models.UniqueConstraint(
+                        condition=models.Q(("location__isnull", True)),
+                        fields=("part",),
+                        name="unique_part_stock_total_no_location",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -24,6 +24,7 @@ from django.db.models.signals import post_delete, post_save
 from django.db.utils import IntegrityError
 from django.dispatch import receiver
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -944,6 +945,37 @@ class Part(
 
         return conflicts
 
+    def get_plugin_serial_number(self) -> str | None:
+        """Return the 'latest' serial number for this Part, as provided by a plugin.
+
+        Returns:
+            The latest serial number returned by the first plugin which provides one, or None
+        """
+        from plugin import PluginMixinEnum, registry
+
+        for plugin in registry.with_mixin(PluginMixinEnum.VALIDATION):
+            try:
+                result = plugin.get_latest_serial_number(self)
+                if result is not None:
+                    return str(result)
+            except Exception:
+                log_error('get_latest_serial_number', plugin=plugin.slug)
+
+        return None
+
+    @classmethod
+    def tree_changed(cls, tree_ids=None):
+        """Reset the serial number counters for any part trees which have changed.
+
+        The counters are re-seeded from the existing stock items when they are next used.
+        """
+        counters = StockModels.SerialNumberCounter.objects.exclude(tree_id=0)
+
+        if tree_ids is not None:
+            counters = counters.filter(tree_id__in=tree_ids)
+
+        counters.delete()
+
     def get_latest_serial_number(self, allow_plugins=True):
         """Find the 'latest' serial number for this Part.
 
@@ -957,18 +989,11 @@ class Part(
         Returns:
             The latest serial number specified for this part, or None
         """
-        from plugin import PluginMixinEnum, registry
-
         if allow_plugins:
             # Check with plugin system
             # If any plugin returns a non-null result, that takes priority
-            for plugin in registry.with_mixin(PluginMixinEnum.VALIDATION):
-                try:
-                    result = plugin.get_latest_serial_number(self)
-                    if result is not None:
-                        return str(result)
-                except Exception:
-                    log_error('get_latest_serial_number', plugin=plugin.slug)
+            if (result := self.get_plugin_serial_number()) is not None:
+                return result
 
         # No plugin returned a result, so we will run the default query
         stock = (
@@ -2905,24 +2930,24 @@ class PartPricing(common.models.MetaMixin):
 
         # Update parent assemblies and templates
         if pricing_changed and cascade:
-            self.update_assemblies(counter)
-            self.update_templates(counter)
+            self.update_dependents(counter)
 
-    def update_assemblies(self, counter: int = 0):
-        """Schedule updates for any assemblies which use this part."""
-        # If the linked Part is used in any assemblies, schedule a pricing update for those assemblies
+    def update_dependents(self, counter: int = 0):
+        """Schedule a pricing update for any parts which depend on this part.
 
-        used_in_parts = self.part.get_used_in()
+        Rather than scheduling a separate task for each assembly and template part,
+        the changed parts are collected (see part.pricing) and all dependent parts
+        are recalculated together (in BOM order) by a single task.
 
-        for p in used_in_parts:
-            p.pricing.schedule_for_update(counter=counter + 1)
+        Arguments:
+            counter: Recursion counter (used to limit the depth of the calculation)
+        """
+        from part.pricing import queue_pricing_dependents
 
-    def update_templates(self, counter: int = 0):
-        """Schedule updates for any template parts above this part."""
-        templates = self.part.get_ancestors(include_self=False)
+        if counter >= self.MAX_PRICING_DEPTH:
+            return
 
-        for p in templates:
-            p.pricing.schedule_for_update(counter + 1)
+        queue_pricing_dependents(self.part, counter=counter)
 
     def save(self, *args, **kwargs):
         """Whenever pricing model is saved, automatically update overall prices."""
@@ -2941,7 +2966,21 @@ class PartPricing(common.models.MetaMixin):
             # This error may be thrown if there is already duplicate pricing data
             pass
 
-    def update_bom_cost(self, save=True):
+    def get_part_pricing(self, part, pricing_cache: dict | None = None):
+        """Return the PartPricing instance for another part.
+
+        Arguments:
+            part: The Part instance for which pricing is required
+            pricing_cache: Optional dict of {part_id: PartPricing} to check before querying the database
+        """
+        if pricing_cache is not None and part.pk in pricing_cache:
+            return pricing_cache[part.pk]
+
+        return part.pricing
+
+    def update_bom_cost(
+        self, save=True, pricing_cache: dict | None = None, bom_items=None
+    ):
         """Recalculate BOM cost for the referenced Part instance.
 
         Iterate through the Bill of Materials, and calculate cumulative pricing:
@@ -2950,6 +2989,11 @@ class PartPricing(common.models.MetaMixin):
         cumulative_max: The sum of maximum costs for each line in the BOM
 
         Note: The cumulative costs are calculated based on the specified default currency
+
+        Arguments:
+            save: If True, save the PartPricing instance after calculation
+            pricing_cache: Optional dict of {part_id: PartPricing} used to look up component pricing
+            bom_items: Optional list of (BomItem, valid parts) tuples (fetched from the database if not provided)
         """
         if not self.part.assembly:
             # Not an assembly - no BOM pricing
@@ -2970,19 +3014,25 @@ class PartPricing(common.models.MetaMixin):
         any_min_elements = False
         any_max_elements = False
 
-        for bom_item in self.part.get_bom_items():
+        if bom_items is None:
+            bom_items = [
+                (bom_item, bom_item.get_valid_parts_for_allocation())
+                for bom_item in self.part.get_bom_items()
+            ]
+
+        for bom_item, valid_parts in bom_items:
             # Loop through each BOM item which is used to assemble this part
 
             bom_item_min = None
             bom_item_max = None
 
-            for sub_part in bom_item.get_valid_parts_for_allocation():
+            for sub_part in valid_parts:
                 # Check each part which *could* be used
 
                 if sub_part != bom_item.sub_part and not sub_part.active:
                     continue
 
-                sub_part_pricing = sub_part.pricing
+                sub_part_pricing = self.get_part_pricing(sub_part, pricing_cache)
 
                 sub_part_min = self.convert(sub_part_pricing.overall_min)
                 sub_part_max = self.convert(sub_part_pricing.overall_max)
@@ -3148,10 +3198,17 @@ class PartPricing(common.models.MetaMixin):
         if save:
             self.save()
 
-    def update_variant_cost(self, save=True):
+    def update_variant_cost(
+        self, save=True, pricing_cache: dict | None = None, variants=None
+    ):
         """Update variant cost values.
 
         Here we track the min/max costs of any variant parts.
+
+        Arguments:
+            save: If True, save the PartPricing instance after calculation
+            pricing_cache: Optional dict of {part_id: PartPricing} used to look up variant pricing
+            variants: Optional list of variant Part instances (fetched from the database if not provided)
         """
         variant_min = None
         variant_max = None
@@ -3159,15 +3216,18 @@ class PartPricing(common.models.MetaMixin):
         active_only = get_global_setting('PRICING_ACTIVE_VARIANTS', False)
 
         if self.part.is_template:
-            variants = self.part.get_descendants(include_self=False)
+            if variants is None:
+                variants = self.part.get_descendants(include_self=False)
 
             for v in variants:
                 if active_only and not v.active:
                     # Ignore inactive variant parts
                     continue
 
-                v_min = self.convert(v.pricing.overall_min)
-                v_max = self.convert(v.pricing.overall_max)
+                v_pricing = self.get_part_pricing(v, pricing_cache)
+
+                v_min = self.convert(v_pricing.overall_min)
+                v_max = self.convert(v_pricing.overall_max)
 
                 if v_min is not None:
                     if variant_min is None or v_min < variant_min:
@@ -3502,6 +3562,257 @@ class PartStocktake(models.Model):
     )
 
 
+class PartStockTotal(models.Model):
+    """Pre-calculated stock totals for a particular Part, at a particular StockLocation.
+
+    Calculating the stock totals for a list of parts requires a number of
+    correlated subqueries against the StockItem, BuildItem, SalesOrderAllocation
+    and PurchaseOrderLineItem tables. This table holds the same totals (grouped by location),
+    so that they can be read back with a single (cheap) aggregation.
+
+    The totals for a part are recalculated whenever any related stock item,
+    allocation or order line is changed (see stock.coalesce.queue_stock_totals_update).
+    The entire table can be recalculated with the 'rebuild_stock_totals' management command.
+
+    Note that this table is only maintained if the PART_STOCK_TOTALS setting is enabled.
+
+    Attributes:
+        part: The Part these totals relate to
+        location: The StockLocation these totals relate to (null for items without a location)
+        quantity: Total quantity of 'in stock' items
+        allocated_build: Quantity allocated to active build orders
+        allocated_sales: Quantity allocated to open sales orders
+        building: Quantity of incomplete build outputs
+        ordering: Quantity on order (against open purchase orders)
+        updated: Date and time that these totals were calculated
+    """
+
+    # Summary fields which are calculated for each part / location
+    TOTAL_FIELDS = [
+        'quantity',
+        'allocated_build',
+        'allocated_sales',
+        'building',
+        'ordering',
+    ]
+
+    class Meta:
+        """Metaclass options."""
+
+        verbose_name = _('Part Stock Total')
+        indexes = [models.Index(fields=['part', 'location'])]
+
+        # A null location is treated as a distinct location
+        constraints = [
+            UniqueConstraint(
+                fields=['part', 'location'],
+                condition=Q(location__isnull=False),
+                name='unique_part_stock_total_location',
+            ),
+            UniqueConstraint(
+                fields=['part'],
+                condition=Q(location__isnull=True),
+                name='unique_part_stock_total_no_location',
+            ),
+        ]
+
+    part = models.ForeignKey(
+        Part,
+        on_delete=models.CASCADE,
+        related_name='stock_totals',
+        verbose_name=_('Part'),
+    )
+
+    location = models.ForeignKey(
+        'stock.StockLocation',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='part_stock_totals',
+        verbose_name=_('Location'),
+    )
+
+    quantity = models.DecimalField(
+        max_digits=19, decimal_places=5, default=0, verbose_name=_('Quantity')
+    )
+
+    allocated_build = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Allocated to Builds'),
+    )
+
+    allocated_sales = models.DecimalField(
+        max_digits=19, decimal_places=5, default=0, verbose_name=_('Allocated to Sales')
+    )
+
+    building = models.DecimalField(
+        max_digits=19, decimal_places=5, default=0, verbose_name=_('Building')
+    )
+
+    ordering = models.DecimalField(
+        max_digits=19, decimal_places=5, default=0, verbose_name=_('On Order')
+    )
+
+    updated = models.DateTimeField(auto_now=True, verbose_name=_('Updated'))
+
+    @staticmethod
+    def enabled() -> bool:
+        """Return True if the stock totals table is maintained."""
+        return bool(getattr(settings, 'PART_STOCK_TOTALS', False))
+
+    @classmethod
+    def calculate(cls, part_ids) -> dict:
+        """Calculate the stock totals for the specified parts.
+
+        The totals are calculated using the same rules as the annotations in part.filters,
+        but with a single grouped query for each total (rather than a subquery per part).
+
+        Arguments:
+            part_ids: List of Part IDs to calculate totals for
+
+        Returns:
+            A dict of {(part_id, location_id): {field: value}}
+        """
+        StockItem = StockModels.StockItem
+
+        part_ids = list(part_ids)
+
+        queries = {
+            'quantity': StockItem.objects
+            .filter(StockItem.IN_STOCK_FILTER)
+            .filter(part__in=part_ids)
+            .values_list('part', 'location')
+            .annotate(total=Sum('quantity')),
+            'building': StockItem.objects
+            .filter(
+                part__in=part_ids,
+                is_building=True,
+                build__status__in=BuildStatusGroups.ACTIVE_CODES,
+            )
+            .values_list('part', 'location')
+            .annotate(total=Sum('quantity')),
+            'allocated_build': BuildModels.BuildItem.objects
+            .filter(
+                stock_item__part__in=part_ids,
+                build_line__build__status__in=BuildStatusGroups.ACTIVE_CODES,
+            )
+            .values_list('stock_item__part', 'stock_item__location')
+            .annotate(total=Sum('quantity')),
+            'allocated_sales': OrderModels.SalesOrderAllocation.objects
+            .filter(
+                item__part__in=part_ids,
+                line__order__status__in=SalesOrderStatusGroups.OPEN,
+                shipment__shipment_date=None,
+            )
+            .values_list('item__part', 'item__location')
+            .annotate(total=Sum('quantity')),
+            'ordering': OrderModels.PurchaseOrderLineItem.objects
+            .filter(
+                part__part__in=part_ids,
+                order__status__in=PurchaseOrderStatusGroups.OPEN,
+                quantity__gt=F('received'),
+            )
+            .values_list('part__part', 'destination')
+            .annotate(
+                total=Sum(
+                    (F('quantity') - F('received')) * F('part__pack_quantity_native'),
+                    output_field=models.DecimalField(),
+                )
+            ),
+        }
+
+        totals = {}
+
+        for field, query in queries.items():
+            for part_id, location_id, total in query.order_by():
+                if not total:
+                    continue
+
+                entry = totals.setdefault(
+                    (part_id, location_id), dict.fromkeys(cls.TOTAL_FIELDS, 0)
+                )
+                entry[field] += total
+
+        return totals
+
+    @classmethod
+    def refresh(cls, part_ids):
+        """Recalculate the stock totals for the specified parts.
+
+        The Part rows are locked while the totals are recalculated,
+        so that concurrent refreshes of the same part are applied one at a time.
+        Only those totals which have changed are written back to the database.
+
+        Arguments:
+            part_ids: List of Part IDs to recalculate
+        """
+        part_ids = sorted(set(part_ids))
+
+        if not part_ids:
+            return
+
+        with transaction.atomic():
+            list(
+                Part.objects
+                .select_for_update()
+                .filter(pk__in=part_ids)
+                .order_by('pk')
+                .values_list('pk', flat=True)
+            )
+
+            totals = cls.calculate(part_ids)
+
+            existing = {
+                (entry.part_id, entry.location_id): entry
+                for entry in cls.objects.filter(part__in=part_ids)
+            }
+
+            updated = []
+            created = []
+
+            for key, values in totals.items():
+                entry = existing.pop(key, None)
+
+                if entry is None:
+                    created.append(cls(part_id=key[0], location_id=key[1], **values))
+                elif any(getattr(entry, f) != v for f, v in values.items()):
+                    for field, value in values.items():
+                        setattr(entry, field, value)
+
+                    entry.updated = timezone.now()
+                    updated.append(entry)
+
+            # Remove any totals which no longer apply
+            if existing:
+                cls.objects.filter(
+                    pk__in=[entry.pk for entry in existing.values()]
+                ).delete()
+
+            cls.objects.bulk_update(
+                updated, [*cls.TOTAL_FIELDS, 'updated'], batch_size=500
+            )
+            cls.objects.bulk_create(created, batch_size=500)
+
+    @classmethod
+    def rebuild(cls, batch_size: int = 500) -> int:
+        """Recalculate the stock totals for all parts.
+
+        Arguments:
+            batch_size: The number of parts to recalculate at once
+
+        Returns:
+            The number of parts which were recalculated
+        """
+        part_ids = list(Part.objects.order_by('pk').values_list('pk', flat=True))
+
+        for idx in range(0, len(part_ids), batch_size):
+            cls.refresh(part_ids[idx : idx + batch_size])
+
+        return len(part_ids)
+
+
 class PartSellPriceBreak(common.models.PriceBreak):
     """Represents a price break for selling this part."""
 
@@ -4397,6 +4708,22 @@ class BomItemSubstitute(InvenTree.models.InvenTreeMetadataModel):
     )
 
 
+@receiver(
+    post_save, sender=BomItemSubstitute, dispatch_uid='bom_substitute_stock_cache'
+)
+@receiver(
+    post_delete,
+    sender=BomItemSubstitute,
+    dispatch_uid='bom_substitute_delete_stock_cache',
+)
+def invalidate_stock_cache_on_substitute_change(sender, instance, **kwargs):
+    """Invalidate cached stock availability data (e.g. for build orders) when a substitute part is changed."""
+    from stock.coalesce import queue_stock_cache_invalidation
+
+    if not InvenTree.ready.isImportingData():
+        queue_stock_cache_invalidation()
+
+
 class PartRelated(InvenTree.models.InvenTreeMetadataModel):
     """Store and handle related parts (eg. mating connector, crimps, etc.)."""
 
@@ -0,0 +1,649 @@
+"""Batched recalculation of cached part pricing data.
+
+A change to the pricing of a single component can affect the pricing of many
+assemblies (and template parts) further up the BOM and variant trees.
+
+Rather than scheduling a separate background task for each affected part,
+the functions provided here:
+
+- Collect the full set of parts which depend on the "dirty" parts
+- Order these parts topologically (components before the assemblies which use them)
+- Recalculate each PartPricing entry exactly once, and write the results in bulk
+
+Within a "deferred" scope (see defer_pricing_dependents), the parts for which pricing
+has changed are collected, and the parts which depend on them are recalculated
+by a single background task when the scope exits.
+"""
+
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+import structlog
+
+import InvenTree.ready
+import InvenTree.tasks
+from common.currency import currency_code_default
+from InvenTree.helpers import chunked
+
+logger = structlog.get_logger('inventree')
+
+# Maximum number of parts to include in a single tree-range query
+QUERY_CHUNK_SIZE = 250
+
+# Thread-local storage for the active (deferred) dependent pricing buffer
+_thread_data = threading.local()
+
+# Database fields which are written back after pricing is recalculated
+PRICING_FIELDS = [
+    'currency',
+    'scheduled_for_update',
+    'updated',
+    'bom_cost_min',
+    'bom_cost_max',
+    'purchase_cost_min',
+    'purchase_cost_max',
+    'internal_cost_min',
+    'internal_cost_max',
+    'supplier_price_min',
+    'supplier_price_max',
+    'variant_cost_min',
+    'variant_cost_max',
+    'overall_min',
+    'overall_max',
+    'sale_price_min',
+    'sale_price_max',
+    'sale_history_min',
+    'sale_history_max',
+]
+
+
+@dataclass
+class PricingUpdateResult:
+    """Summary information for a batched pricing update.
+
+    Attributes:
+        recomputed: Number of PartPricing entries which were recalculated
+        changed: Number of PartPricing entries for which the overall price range changed
+        duration: Time taken (in seconds) to perform the update
+    """
+
+    recomputed: int = 0
+    changed: int = 0
+    duration: float = 0.0
+
+
+def offload_dependent_pricing(dependents: dict[int, int]):
+    """Offload a single task to recalculate the pricing of any parts which depend on the provided parts.
+
+    Arguments:
+        dependents: Dict of {part_id: counter} for parts whose pricing has changed
+    """
+    from part import tasks as part_tasks
+    from part.models import PartPricing
+
+    if not dependents:
+        return
+
+    # Limit the depth of the calculation for the "deepest" part in the batch
+    counter = min(dependents.values())
+
+    InvenTree.tasks.offload_task(
+        part_tasks.update_pricing_batch,
+        sorted(dependents.keys()),
+        recalculate=False,
+        max_depth=PartPricing.MAX_PRICING_DEPTH - counter,
+        force_async=not settings.TESTING or not settings.TESTING_PRICING,
+        group='pricing',
+    )
+
+
+@contextmanager
+def defer_pricing_dependents():
+    """Context manager which collects dependent pricing updates into a single task.
+
+    Scopes may be nested - the task is only offloaded when the outermost scope exits.
+    The task is offloaded once the current transaction is committed
+    (and is discarded if the transaction is rolled back).
+
+    Example:
+        with defer_pricing_dependents():
+            for pricing in pricings:
+                pricing.update_pricing()
+    """
+    if getattr(_thread_data, 'dependents', None) is not None:
+        # Already inside a deferred scope
+        yield
+        return
+
+    dependents: dict[int, int] = {}
+    _thread_data.dependents = dependents
+
+    try:
+        yield
+    finally:
+        _thread_data.dependents = None
+
+        if dependents:
+            transaction.on_commit(lambda: offload_dependent_pricing(dependents))
+
+
+def queue_pricing_dependents(part, counter: int = 0):
+    """Schedule a pricing update for any parts which depend on the provided part.
+
+    If a deferred scope is active, the part is collected and the dependent parts
+    are recalculated (along with those of any other collected parts) when the scope exits.
+    Otherwise, the dependent parts are recalculated immediately.
+
+    Arguments:
+        part: The Part instance for which pricing has changed
+        counter: Recursion counter (used to limit the depth of the calculation)
+    """
+    if part is None or part.pk is None:
+        return
+
+    dependents = getattr(_thread_data, 'dependents', None)
+
+    if dependents is None:
+        offload_dependent_pricing({part.pk: counter})
+    else:
+        dependents[part.pk] = min(counter, dependents.get(part.pk, counter))
+
+
+def _currency_fields() -> list[str]:
+    """Return the names of the currency fields associated with the PartPricing money fields."""
+    from part.models import PartPricing
+
+    names = {field.name for field in PartPricing._meta.concrete_fields}
+
+    return [
+        f'{name}_currency' for name in PRICING_FIELDS if f'{name}_currency' in names
+    ]
+
+
+def _tree_filter(nodes: Iterable[dict], ancestors: bool) -> Q:
+    """Construct a query filter which matches the ancestors (or descendants) of the provided nodes.
+
+    Arguments:
+        nodes: Iterable of dicts containing the 'tree_id', 'lft' and 'rght' MPTT values
+        ancestors: If True, match ancestors of the nodes, otherwise match descendants
+    """
+    query = Q()
+
+    for node in nodes:
+        if ancestors:
+            query |= Q(
+                tree_id=node['tree_id'], lft__lt=node['lft'], rght__gt=node['rght']
+            )
+        else:
+            query |= Q(
+                tree_id=node['tree_id'], lft__gt=node['lft'], rght__lt=node['rght']
+            )
+
+    return query
+
+
+def _find_related(nodes: list[dict], ancestors: bool) -> dict[int, set[int]]:
+    """Find the ancestors (or descendants) of each provided part, using a minimal number of queries.
+
+    Arguments:
+        nodes: List of dicts containing the 'pk', 'tree_id', 'lft' and 'rght' values for each part
+        ancestors: If True, find ancestors, otherwise find descendants
+
+    Returns:
+        A dict mapping each part ID to the set of related part IDs
+    """
+    from part.models import Part
+
+    related = defaultdict(set)
+
+    by_tree = defaultdict(list)
+
+    for node in nodes:
+        by_tree[node['tree_id']].append(node)
+
+    for chunk in chunked(nodes, QUERY_CHUNK_SIZE):
+        query = _tree_filter(chunk, ancestors)
+
+        if not query:
+            continue
+
+        for row in Part.objects.filter(query).values('pk', 'tree_id', 'lft', 'rght'):
+            for node in by_tree[row['tree_id']]:
+                if ancestors:
+                    match = row['lft'] < node['lft'] and row['rght'] > node['rght']
+                else:
+                    match = row['lft'] > node['lft'] and row['rght'] < node['rght']
+
+                if match:
+                    related[node['pk']].add(row['pk'])
+
+    return related
+
+
+def get_bom_items(assembly_ids: Iterable[int]) -> dict[int, list[tuple]]:
+    """Return the BOM items (and the valid parts for each item) for the provided assemblies.
+
+    This is a bulk version of Part.get_bom_items() combined with BomItem.get_valid_parts_for_allocation(),
+    including any BOM items inherited from template parts, and any variants of the referenced parts.
+
+    Arguments:
+        assembly_ids: The IDs of the assemblies to check
+
+    Returns:
+        A dict mapping each assembly ID to a list of (BomItem, valid parts) tuples
+    """
+    from part.models import BomItem, Part
+
+    assembly_ids = set(assembly_ids)
+    result = defaultdict(list)
+
+    if not assembly_ids:
+        return result
+
+    nodes = list(
+        Part.objects.filter(pk__in=assembly_ids).values('pk', 'tree_id', 'lft', 'rght')
+    )
+
+    # Template parts which may define inherited BOM items
+    ancestors = _find_related(nodes, ancestors=True)
+    template_ids = set().union(*ancestors.values())
+
+    bom_items = list(
+        BomItem.objects
+        .filter(Q(part__in=assembly_ids) | Q(part__in=template_ids, inherited=True))
+        .select_related('sub_part')
+        .prefetch_related('substitutes__part')
+    )
+
+    # Find the variants of any parts referenced by a BOM item which allows variants
+    referenced = {}
+
+    for bom_item in bom_items:
+        if bom_item.allow_variants:
+            referenced[bom_item.sub_part.pk] = bom_item.sub_part
+
+            for sub in bom_item.substitutes.all():
+                referenced[sub.part.pk] = sub.part
+
+    variants_of = _find_related(
+        [
+            {'pk': prt.pk, 'tree_id': prt.tree_id, 'lft': prt.lft, 'rght': prt.rght}
+            for prt in referenced.values()
+        ],
+        ancestors=False,
+    )
+
+    variant_parts = {
+        prt.pk: prt
+        for prt in Part.objects.filter(pk__in=set().union(*variants_of.values()))
+    }
+
+    items_for = defaultdict(list)
+
+    for bom_item in bom_items:
+        parts = {bom_item.sub_part.pk: bom_item.sub_part}
+
+        for sub in bom_item.substitutes.all():
+            parts[sub.part.pk] = sub.part
+
+        if bom_item.allow_variants:
+            for pk in list(parts.keys()):
+                for variant in variants_of.get(pk, set()):
+                    parts[variant] = variant_parts[variant]
+
+        # Trackable status must be the same as the sub_part
+        valid_parts = [
+            prt
+            for prt in parts.values()
+            if prt.trackable == bom_item.sub_part.trackable
+        ]
+
+        items_for[bom_item.part_id].append((bom_item, valid_parts))
+
+    for pk in assembly_ids:
+        result[pk].extend(items_for.get(pk, []))
+
+        for template in ancestors.get(pk, set()):
+            result[pk].extend(
+                item for item in items_for.get(template, []) if item[0].inherited
+            )
+
+    return result
+
+
+def get_dependent_parts(part_ids: Iterable[int]) -> dict[int, set[int]]:
+    """Return the parts whose pricing directly depends on the provided parts.
+
+    This is a bulk version of Part.get_used_in(), combined with template part lookup.
+
+    A part "depends" on another part if:
+    - It is an assembly which uses the part in its BOM (directly, as a variant, or as a substitute)
+    - It is a variant of an assembly which defines such an inherited BOM item
+    - It is a template part (i.e. ancestor in the variant tree) of the part
+
+    Arguments:
+        part_ids: The IDs of the parts to check
+
+    Returns:
+        A dict mapping each provided part ID to the set of dependent part IDs
+    """
+    from part.models import BomItem, BomItemSubstitute, Part
+
+    part_ids = set(part_ids)
+    dependents = defaultdict(set)
+
+    if not part_ids:
+        return dependents
+
+    nodes = list(
+        Part.objects.filter(pk__in=part_ids).values('pk', 'tree_id', 'lft', 'rght')
+    )
+
+    # Template parts depend on the pricing of all their variants
+    ancestors = _find_related(nodes, ancestors=True)
+
+    # Reverse map of template part -> variants which we are interested in
+    variants_of = defaultdict(set)
+
+    for pk, parents in ancestors.items():
+        dependents[pk].update(parents)
+
+        for parent in parents:
+            variants_of[parent].add(pk)
+
+    # Map of assembly ID -> set of "dirty" parts which are used in its BOM
+    used_in = defaultdict(set)
+
+    # Map of assembly ID -> set of "dirty" parts which are used in its inherited BOM items
+    inherited = defaultdict(set)
+
+    # Case A: Part is directly specified in a BomItem
+    # Case B: Part is a variant of a part specified in a BomItem which allows variants
+    bom_items = BomItem.objects.filter(
+        Q(sub_part__in=part_ids)
+        | Q(allow_variants=True, sub_part__in=list(variants_of.keys()))
+    ).values('part', 'sub_part', 'allow_variants', 'inherited')
+
+    for row in bom_items:
+        children = set()
+
+        if row['sub_part'] in part_ids:
+            children.add(row['sub_part'])
+
+        if row['allow_variants']:
+            children.update(variants_of.get(row['sub_part'], set()))
+
+        used_in[row['part']].update(children)
+
+        if row['inherited']:
+            inherited[row['part']].update(children)
+
+    # Case C: Part is a substitute for a part specified in a BomItem
+    substitutes = BomItemSubstitute.objects.filter(part__in=part_ids).values(
+        'part', 'bom_item__part', 'bom_item__inherited'
+    )
+
+    for row in substitutes:
+        used_in[row['bom_item__part']].add(row['part'])
+
+        if row['bom_item__inherited']:
+            inherited[row['bom_item__part']].add(row['part'])
+
+    # Variants of an assembly with an inherited BOM also depend on the BOM items
+    if inherited:
+        assemblies = list(
+            Part.objects.filter(pk__in=list(inherited.keys())).values(
+                'pk', 'tree_id', 'lft', 'rght'
+            )
+        )
+
+        for assembly, variants in _find_related(assemblies, ancestors=False).items():
+            for variant in variants:
+                used_in[variant].update(inherited[assembly])
+
+    for assembly, children in used_in.items():
+        for child in children:
+            dependents[child].add(assembly)
+
+    return dependents
+
+
+def topological_order(nodes: Iterable[int], depends_on: dict[int, set[int]]) -> list:
+    """Order the provided nodes such that each node appears after all of its dependencies.
+
+    Arguments:
+        nodes: The nodes to order
+        depends_on: A dict mapping each node to the set of nodes which it depends on
+
+    Returns:
+        A list of nodes, in dependency order.
+        Any nodes which form part of a cycle are appended at the end of the list.
+    """
+    nodes = set(nodes)
+
+    # Count of unresolved dependencies for each node
+    pending = {node: len(depends_on.get(node, set()) & nodes) for node in nodes}
+
+    required_by = defaultdict(set)
+
+    for node in nodes:
+        for dependency in depends_on.get(node, set()) & nodes:
+            required_by[dependency].add(node)
+
+    queue = deque(sorted(node for node, count in pending.items() if count == 0))
+    ordered = []
+
+    while queue:
+        node = queue.popleft()
+        ordered.append(node)
+
+        for dependent in sorted(required_by[node]):
+            pending[dependent] -= 1
+
+            if pending[dependent] == 0:
+                queue.append(dependent)
+
+    if len(ordered) < len(nodes):
+        # A cycle exists in the dependency graph (should not happen with a valid BOM)
+        remaining = sorted(nodes - set(ordered))
+        logger.warning(
+            'Circular pricing dependency detected for parts: %s', remaining[:10]
+        )
+        ordered.extend(remaining)
+
+    return ordered
+
+
+def recalculate_pricing(
+    part_ids: Iterable[int], recalculate: bool = True, max_depth: int | None = None
+) -> PricingUpdateResult:
+    """Recalculate pricing for the provided parts, and all parts which depend on them.
+
+    Arguments:
+        part_ids: The IDs of the "dirty" parts which have changed
+        recalculate: If True, fully recalculate the pricing of the provided parts.
+            If False, the pricing of the provided parts is assumed to be up to date,
+            and only the parts which depend on them are recalculated.
+        max_depth: Maximum depth of dependent parts to traverse (defaults to PartPricing.MAX_PRICING_DEPTH)
+
+    Returns:
+        PricingUpdateResult: Summary of the pricing update
+    """
+    from part.models import Part, PartPricing
+
+    t_start = time.perf_counter()
+    result = PricingUpdateResult()
+
+    # If importing data, or running migrations, skip pricing update
+    if InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations():
+        return result
+
+    if max_depth is None:
+        max_depth = PartPricing.MAX_PRICING_DEPTH
+
+    seeds = set(Part.objects.filter(pk__in=set(part_ids)).values_list('pk', flat=True))
+
+    # Parts which each affected part depends on (within the affected set)
+    depends_on = defaultdict(set)
+    affected = set(seeds)
+    frontier = set(seeds)
+    depth = 0
+
+    # Walk "up" the BOM and variant trees, one level at a time
+    while frontier and depth < max_depth:
+        next_frontier = set()
+
+        for child, parents in get_dependent_parts(frontier).items():
+            for parent in parents:
+                if parent == child:
+                    continue
+
+                depends_on[parent].add(child)
+
+                if parent not in affected:
+                    next_frontier.add(parent)
+
+        # Skip any parts which are already scheduled for a full pricing update
+        # (the scheduled update also cascades to the parts which depend on them)
+        next_frontier -= set(
+            PartPricing.objects.filter(
+                part__in=next_frontier, scheduled_for_update=True
+            ).values_list('part', flat=True)
+        )
+
+        affected.update(next_frontier)
+        frontier = next_frontier
+        depth += 1
+
+    order = topological_order(affected, depends_on)
+
+    # Load (or construct) the PartPricing instances for all affected parts
+    pricing_map = {
+        pricing.part_id: pricing
+        for pricing in PartPricing.objects.filter(part__in=affected).select_related(
+            'part'
+        )
+    }
+
+    for prt in Part.objects.filter(pk__in=affected - set(pricing_map.keys())):
+        pricing_map[prt.pk] = PartPricing(part=prt)
+
+    # Pre-load the BOM items (and pricing for the components) of each affected assembly
+    pricing_cache = dict(pricing_map)
+
+    bom_items = get_bom_items(
+        pk for pk, pricing in pricing_map.items() if pricing.part.assembly
+    )
+
+    component_ids = {
+        prt.pk
+        for items in bom_items.values()
+        for _bom_item, valid_parts in items
+        for prt in valid_parts
+    }
+    component_ids -= set(pricing_cache.keys())
+
+    for pricing in PartPricing.objects.filter(part__in=component_ids):
+        pricing_cache[pricing.part_id] = pricing
+
+    # Pre-load the variants (and their pricing) for each affected template part
+    templates = Part.objects.filter(pk__in=affected, is_template=True).values(
+        'pk', 'tree_id', 'lft', 'rght'
+    )
+
+    variants_of = _find_related(list(templates), ancestors=False)
+    variant_ids = set().union(*variants_of.values())
+
+    variant_parts = {prt.pk: prt for prt in Part.objects.filter(pk__in=variant_ids)}
+
+    for pricing in PartPricing.objects.filter(
+        part__in=variant_ids - set(pricing_cache.keys())
+    ):
+        pricing_cache[pricing.part_id] = pricing
+
+    for pk, prt in variant_parts.items():
+        if pk not in pricing_cache:
+            pricing_cache[pk] = PartPricing(part=prt)
+
+    changed = set()
+    to_create = []
+    to_update = []
+    now = timezone.now()
+    currency = currency_code_default()
+
+    for pk in order:
+        pricing = pricing_map[pk]
+
+        if pk in seeds:
+            # The provided parts are always treated as "changed"
+            changed.add(pk)
+
+            if not recalculate:
+                # Pricing for this part is already up to date
+                continue
+        elif not depends_on[pk] & changed:
+            # None of the parts this part depends on have changed
+            continue
+
+        previous = (pricing.overall_min, pricing.overall_max)
+
+        if pk in seeds:
+            pricing.update_purchase_cost(save=False)
+            pricing.update_internal_cost(save=False)
+            pricing.update_supplier_cost(save=False)
+            pricing.update_sale_cost(save=False)
+
+        pricing.update_bom_cost(
+            save=False, pricing_cache=pricing_cache, bom_items=bom_items.get(pk, [])
+        )
+        pricing.update_variant_cost(
+            save=False,
+            pricing_cache=pricing_cache,
+            variants=[variant_parts[v] for v in variants_of.get(pk, [])],
+        )
+
+        pricing.currency = currency
+        pricing.update_overall_cost()
+        pricing.scheduled_for_update = False
+        pricing.updated = now
+
+        result.recomputed += 1
+
+        if pricing.pk is None or previous != (pricing.overall_min, pricing.overall_max):
+            changed.add(pk)
+            result.changed += 1
+
+        if pricing.pk:
+            to_update.append(pricing)
+        else:
+            to_create.append(pricing)
+
+    if to_update:
+        PartPricing.objects.bulk_update(
+            to_update, PRICING_FIELDS + _currency_fields(), batch_size=500
+        )
+
+    if to_create:
+        PartPricing.objects.bulk_create(
+            to_create, batch_size=500, ignore_conflicts=True
+        )
+
+    result.duration = time.perf_counter() - t_start
+
+    logger.info(
+        'Recalculated pricing for %s parts (%s changed) in %.3fs',
+        result.recomputed,
+        result.changed,
+        result.duration,
+    )
+
+    return result
@@ -50,6 +50,7 @@ from .models import (
     PartSellPriceBreak,
     PartStar,
     PartStocktake,
+    PartStockTotal,
     PartTestTemplate,
 )
 
@@ -695,31 +696,16 @@ class PartSerializer(
         # Annotate with the total number of stock items
         queryset = queryset.annotate(stock_item_count=SubqueryCount('stock_items'))
 
-        # Annotate with the total variant stock quantity
-        variant_query = part_filters.variant_stock_query()
-
-        queryset = queryset.annotate(
-            variant_stock=part_filters.annotate_variant_quantity(
-                variant_query, reference='quantity'
-            )
-        )
-
-        # Annotate with the total 'building' quantity
-        queryset = queryset.annotate(
-            building=part_filters.annotate_in_production_quantity()
-        )
+        if PartStockTotal.enabled():
+            # Read the stock totals from the pre-calculated table
+            queryset = PartSerializer.annotate_stock_totals(queryset)
+        else:
+            queryset = PartSerializer.annotate_stock_quantities(queryset)
 
         queryset = queryset.annotate(
             scheduled_to_build=part_filters.annotate_scheduled_to_build_quantity()
         )
 
-        queryset = queryset.annotate(
-            ordering=part_filters.annotate_on_order_quantity(),
-            in_stock=part_filters.annotate_total_stock(),
-            allocated_to_sales_orders=part_filters.annotate_sales_order_allocations(),
-            allocated_to_build_orders=part_filters.annotate_build_order_allocations(),
-        )
-
         # Annotate the queryset with the 'total_in_stock' quantity
         # This is the 'in_stock' quantity summed with the 'variant_stock' quantity
         queryset = queryset.annotate(
@@ -728,12 +714,6 @@ class PartSerializer(
             )
         )
 
-        queryset = queryset.annotate(
-            external_stock=part_filters.annotate_total_stock(
-                filter=Q(location__external=True)
-            )
-        )
-
         # Annotate with the total 'available stock' quantity
         # This is the current stock, minus any allocations
         queryset = queryset.annotate(
@@ -763,6 +743,52 @@ class PartSerializer(
 
         return queryset
 
+    @staticmethod
+    def annotate_stock_quantities(queryset):
+        """Annotate the stock quantities for each part, calculated from the source tables."""
+        variant_query = part_filters.variant_stock_query()
+
+        return queryset.annotate(
+            variant_stock=part_filters.annotate_variant_quantity(
+                variant_query, reference='quantity'
+            ),
+            building=part_filters.annotate_in_production_quantity(),
+            ordering=part_filters.annotate_on_order_quantity(),
+            in_stock=part_filters.annotate_total_stock(),
+            allocated_to_sales_orders=part_filters.annotate_sales_order_allocations(),
+            allocated_to_build_orders=part_filters.annotate_build_order_allocations(),
+            external_stock=part_filters.annotate_total_stock(
+                filter=Q(location__external=True)
+            ),
+        )
+
+    @staticmethod
+    def annotate_stock_totals(queryset):
+        """Annotate the stock quantities for each part, read from the PartStockTotal table.
+
+        This avoids the (expensive) correlated subqueries against the stock item,
+        allocation and order tables, at the cost of maintaining the PartStockTotal table.
+        """
+        variant_query = part_filters.variant_stock_total_query()
+
+        return queryset.annotate(
+            variant_stock=part_filters.annotate_variant_quantity(
+                variant_query, reference='quantity'
+            ),
+            building=part_filters.annotate_stock_total('building'),
+            ordering=part_filters.annotate_stock_total('ordering'),
+            in_stock=part_filters.annotate_stock_total('quantity'),
+            allocated_to_sales_orders=part_filters.annotate_stock_total(
+                'allocated_sales'
+            ),
+            allocated_to_build_orders=part_filters.annotate_stock_total(
+                'allocated_build'
+            ),
+            external_stock=part_filters.annotate_stock_total(
+                'quantity', filter=Q(location__external=True)
+            ),
+        )
+
     def get_starred(self, part) -> bool:
         """Return "true" if the part is starred by the current user."""
         if not self.request or not self.request.user:
@@ -1,12 +1,15 @@
 """Stock history functionality."""
 
+from decimal import Decimal
 from typing import Optional
 
 from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Q, Sum
 
 import structlog
 import tablib
-from djmoney.contrib.exchange.models import convert_money
+from djmoney.contrib.exchange.exceptions import MissingRate
 from djmoney.money import Money
 
 import common.models
@@ -14,6 +17,9 @@ from InvenTree.helpers import current_date
 
 logger = structlog.get_logger('inventree')
 
+# Number of parts to process (and commit) at once
+STOCKTAKE_BATCH_SIZE = 500
+
 
 def perform_stocktake(
     part_id: Optional[int] = None,
@@ -22,6 +28,7 @@ def perform_stocktake(
     exclude_external: Optional[bool] = None,
     generate_entry: bool = True,
     report_output_id: Optional[int] = None,
+    batch_size: int = STOCKTAKE_BATCH_SIZE,
 ) -> None:
     """Capture a snapshot of stock-on-hand and stock value.
 
@@ -32,18 +39,29 @@ def perform_stocktake(
         exclude_external: If True, exclude external stock items from the stocktake
         generate_entry: If True, create stocktake entries in the database
         report_output_id: Optional ID of a DataOutput object for the stocktake report (e.g. for download)
+        batch_size: Number of parts to process in each batch
 
     The default implementation creates stocktake entries for all active parts,
     and writes these stocktake entries to the database.
 
     Alternatively, the scope of the stocktake can be limited by providing a queryset of parts,
     or by providing a category ID or location ID to filter the parts/stock items.
+
+    Parts are processed in batches (ordered by primary key), and the stocktake entries
+    for each batch are committed to the database before the next batch is processed.
+    Stock quantities and costs are calculated using aggregate queries, rather than loading individual stock items.
+
+    If the process is interrupted (e.g. the worker is restarted), it can be resumed:
+
+    - Parts which already have a stocktake entry for today are skipped
+    - If a report output is provided, the last processed part is recorded in the 'checkpoint' field,
+      and a subsequent call with the same report output continues from that point
     """
     import InvenTree.helpers
     import part.models as part_models
     import part.serializers as part_serializers
     import stock.models as stock_models
-    from common.currency import currency_code_default
+    from common.currency import currency_code_default, get_exchange_rates
     from common.settings import get_global_setting
 
     if not get_global_setting('STOCKTAKE_ENABLE', False, cache=False):
@@ -70,9 +88,6 @@ def perform_stocktake(
     # Only use active parts
     parts = parts.filter(active=True)
 
-    # Prefetch related pricing information
-    parts = parts.prefetch_related('pricing_data', 'stock_items')
-
     # Filter part queryset by category, if provided
     if category_id is not None:
         # Filter parts by category (including subcategories)
@@ -97,14 +112,27 @@ def perform_stocktake(
         # Location limited, so we will disable saving of stocktake entries
         generate_entry = False
 
-    # New history entries to be created
+    # Filter for the stock items which are included in the stocktake
+    stock_items = stock_models.StockItem.objects.filter(
+        stock_models.StockItem.IN_STOCK_FILTER
+    )
+
+    if exclude_external:
+        # Exclude stock entries which are not 'internal'
+        stock_items = stock_items.filter(location__external=False)
+
+    if location is not None:
+        stock_items = stock_items.filter(
+            location__in=location.get_descendants(include_self=True)
+        )
+
+    # History entries which are not saved to the database (required for the report)
     history_entries = []
 
     base_currency = currency_code_default()
+    rates = get_exchange_rates()
     today = InvenTree.helpers.current_date()
 
-    logger.info('Creating new stock history entries for %s parts', parts.count())
-
     # Fetch report output object if provided
     if report_output_id is not None:
         try:
@@ -114,107 +142,72 @@ def perform_stocktake(
     else:
         report_output = None
 
-    if report_output:
+    # The last part which was processed (if resuming an interrupted stocktake)
+    last_part = 0
+
+    if report_output and report_output.checkpoint and generate_entry:
+        last_part = report_output.checkpoint.get('last_part', 0)
+        logger.info('Resuming stocktake after part %s', last_part)
+    elif report_output:
         # Initialize progress on the report output
         report_output.total = parts.count()
         report_output.progress = 0
         report_output.complete = False
         report_output.save()
 
-    for part in parts:
-        # Is there a recent stock history record for this part?
-        if (
-            generate_entry
-            and part_models.PartStocktake.objects.filter(
-                part=part, date__gte=today
-            ).exists()
-        ):
-            continue
-
-        try:
-            pricing = part.pricing_data
-        except Exception:
-            pricing = None
+    logger.info('Creating new stock history entries for %s parts', parts.count())
 
-        # Fetch all 'in stock' items for this part
-        stock_items = part.stock_entries(
-            location=location,
-            in_stock=True,
-            include_external=not exclude_external,
-            include_variants=True,
+    while True:
+        batch = list(
+            parts
+            .filter(pk__gt=last_part)
+            .select_related('pricing_data')
+            .order_by('pk')[:batch_size]
         )
 
-        total_cost_min = Money(0, base_currency)
-        total_cost_max = Money(0, base_currency)
-
-        total_quantity = 0
-        items_count = 0
-
-        if stock_items.count() == 0:
-            # No stock items - skip this part if location is specified
-            if location:
-                continue
-
-        for item in stock_items:
-            # Extract cost information
-
-            entry_cost_min = (
-                (pricing.overall_min or pricing.overall_max) if pricing else None
-            )
-            entry_cost_max = (
-                (pricing.overall_max or pricing.overall_min) if pricing else None
-            )
-
-            if item.purchase_price is not None:
-                entry_cost_min = item.purchase_price
-                entry_cost_max = item.purchase_price
-
-            try:
-                entry_cost_min = entry_cost_min * item.quantity
-                entry_cost_max = entry_cost_max * item.quantity
+        if not batch:
+            break
 
-                if entry_cost_min.currency != base_currency:
-                    entry_cost_min = convert_money(entry_cost_min, base_currency)
+        last_part = batch[-1].pk
 
-                if entry_cost_max.currency != base_currency:
-                    entry_cost_max = convert_money(entry_cost_max, base_currency)
-            except Exception:
-                entry_cost_min = Money(0, base_currency)
-                entry_cost_max = Money(0, base_currency)
-
-            # Update total quantities
-            items_count += 1
-            total_quantity += item.quantity
-            total_cost_min += entry_cost_min
-            total_cost_max += entry_cost_max
-
-        if report_output:
-            report_output.progress += 1
-
-            # Update report progress every few items, to avoid excessive database writes
-            if report_output.progress % 50 == 0:
-                report_output.save()
-
-        # Add a new stocktake entry for this part
-        history_entries.append(
-            part_models.PartStocktake(
-                part=part,
-                item_count=items_count,
-                quantity=total_quantity,
-                cost_min=total_cost_min,
-                cost_max=total_cost_max,
-            )
+        entries = stocktake_batch(
+            batch, stock_items, base_currency, rates, skip_empty=location is not None
         )
 
-    if generate_entry:
-        # Bulk-create PartStocktake entries
-        part_models.PartStocktake.objects.bulk_create(history_entries)
+        with transaction.atomic():
+            if generate_entry:
+                # Ignore any parts which already have a stocktake entry for today
+                existing = set(
+                    part_models.PartStocktake.objects.filter(
+                        part__in=batch, date__gte=today
+                    ).values_list('part', flat=True)
+                )
+
+                part_models.PartStocktake.objects.bulk_create([
+                    entry for entry in entries if entry.part_id not in existing
+                ])
+            else:
+                history_entries.extend(entries)
+
+            if report_output:
+                report_output.progress += len(batch)
+                report_output.checkpoint = {'last_part': last_part}
+                report_output.save()
 
     if report_output:
         # Save report data, and mark as complete
-
         today = current_date()
 
+        if generate_entry:
+            # Include all stocktake entries for today (including those from an interrupted run)
+            history_entries = (
+                part_models.PartStocktake.objects
+                .filter(part__in=parts, date=today)
+                .select_related('part')
+                .order_by('part')
+                .iterator()
+            )
+
         serializer = part_serializers.PartStocktakeSerializer(exclude_pk=True)
 
         headers = serializer.generate_headers()
@@ -231,6 +224,118 @@ def perform_stocktake(
 
         datafile = dataset.export('csv')
 
+        report_output.checkpoint = None
         report_output.mark_complete(
             output=ContentFile(datafile, 'stocktake_report.csv')
         )
+
+
+def stocktake_batch(
+    parts: list, stock_items, base_currency: str, rates, skip_empty: bool = False
+) -> list:
+    """Calculate (unsaved) stocktake entries for a batch of parts.
+
+    Stock quantities and costs are aggregated in the database (grouped by part and purchase currency),
+    and then rolled up for each part, including the stock for any variant parts.
+
+    Arguments:
+        parts: List of Part instances (with pricing data pre-fetched)
+        stock_items: StockItem queryset (the stock items to include in the stocktake)
+        base_currency: Currency code for the calculated stock costs
+        rates: ExchangeRates table used for currency conversion
+        skip_empty: If True, do not return entries for parts without any stock
+
+    Returns:
+        A list of PartStocktake instances (not saved to the database)
+    """
+    from part.models import PartStocktake
+
+    # Aggregate stock for all parts in the same trees (to account for variant stock)
+    rows = (
+        stock_items
+        .filter(part__tree_id__in={part.tree_id for part in parts})
+        .order_by()
+        .values('part__tree_id', 'part__lft', 'purchase_price_currency')
+        .annotate(
+            count=Count('pk'),
+            total=Sum('quantity'),
+            priced=Sum('quantity', filter=Q(purchase_price__isnull=False)),
+            cost=Sum(
+                F('quantity') * F('purchase_price'),
+                filter=Q(purchase_price__isnull=False),
+                output_field=DecimalField(),
+            ),
+        )
+    )
+
+    trees = {}
+
+    for row in rows:
+        trees.setdefault(row['part__tree_id'], []).append(row)
+
+    def convert(value) -> Money:
+        """Convert the provided value to the base currency (or zero if it cannot be converted)."""
+        if value is None:
+            return Money(0, base_currency)
+
+        try:
+            return rates.convert(value, base_currency)
+        except MissingRate:
+            return Money(0, base_currency)
+
+    entries = []
+
+    for part in parts:
+        try:
+            pricing = part.pricing_data
+        except Exception:
+            pricing = None
+
+        item_count = 0
+        quantity = Decimal(0)
+
+        # Quantity of stock without a purchase price
+        unpriced = Decimal(0)
+
+        total_cost_min = Money(0, base_currency)
+        total_cost_max = Money(0, base_currency)
+
+        for row in trees.get(part.tree_id, []):
+            # Only include stock for this part (and its variants)
+            if not part.lft <= row['part__lft'] <= part.rght:
+                continue
+
+            item_count += row['count']
+            quantity += row['total']
+            unpriced += row['total'] - (row['priced'] or 0)
+
+            if row['cost'] is not None:
+                cost = convert(Money(row['cost'], row['purchase_price_currency']))
+                total_cost_min += cost
+                total_cost_max += cost
+
+        if item_count == 0 and skip_empty:
+            continue
+
+        # Stock without a purchase price is valued using the part pricing data
+        if unpriced and pricing:
+            cost_min = pricing.overall_min or pricing.overall_max
+            cost_max = pricing.overall_max or pricing.overall_min
+
+            if cost_min is not None:
+                total_cost_min += convert(cost_min * unpriced)
+
+            if cost_max is not None:
+                total_cost_max += convert(cost_max * unpriced)
+
+        entries.append(
+            PartStocktake(
+                part=part,
+                item_count=item_count,
+                quantity=quantity,
+                cost_min=total_cost_min,
+                cost_max=total_cost_max,
+            )
+        )
+
+    return entries
@@ -156,6 +156,17 @@ def notify_low_stock_if_required(part_id: int):
             offload_task(notify_low_stock, p, group='notification')
 
 
+@tracer.start_as_current_span('notify_low_stock_if_required_batch')
+def notify_low_stock_if_required_batch(part_ids: list[int]):
+    """Check a batch of parts for low stock levels.
+
+    Arguments:
+        part_ids: List of Part IDs to check
+    """
+    for part_id in part_ids:
+        notify_low_stock_if_required(part_id)
+
+
 @tracer.start_as_current_span('check_stale_stock')
 @scheduled_task(ScheduledTask.DAILY)
 def check_stale_stock():
@@ -243,6 +254,25 @@ def update_part_pricing(pricing: Model, counter: int = 0):
     )
 
 
+@tracer.start_as_current_span('update_pricing_batch')
+def update_pricing_batch(
+    part_ids: list[int], recalculate: bool = True, max_depth: Optional[int] = None
+):
+    """Recalculate cached pricing data for a batch of parts, and any parts which depend on them.
+
+    Each affected PartPricing instance is recalculated exactly once,
+    in BOM order (components before the assemblies which use them).
+
+    Arguments:
+        part_ids: List of Part IDs for which pricing has changed
+        recalculate: If False, only the parts which depend on the provided parts are recalculated
+        max_depth: Maximum depth of dependent parts to recalculate
+    """
+    from part.pricing import recalculate_pricing
+
+    return recalculate_pricing(part_ids, recalculate=recalculate, max_depth=max_depth)
+
+
 @tracer.start_as_current_span('check_missing_pricing')
 @scheduled_task(ScheduledTask.DAILY)
 def check_missing_pricing(limit=250):
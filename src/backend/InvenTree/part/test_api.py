@@ -8,7 +8,7 @@ from random import randint
 
 from django.core.exceptions import ValidationError
 from django.db import connection
-from django.test.utils import CaptureQueriesContext
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
 
 import pytest
@@ -32,6 +32,7 @@ from part.models import (
     PartCategoryParameterTemplate,
     PartRelated,
     PartSellPriceBreak,
+    PartStockTotal,
     PartTestTemplate,
 )
 from stock.models import StockItem, StockLocation
@@ -2348,6 +2349,71 @@ class PartAPIAggregationTest(InvenTreeAPITestCase):
         self.assertEqual(data['in_stock'], 1100)
         self.assertEqual(data['stock_item_count'], 105)
 
+    def test_stock_totals(self):
+        """Test that the pre-calculated stock totals match the calculated values."""
+        fields = [
+            'in_stock',
+            'variant_stock',
+            'external_stock',
+            'building',
+            'ordering',
+            'allocated_to_build_orders',
+            'allocated_to_sales_orders',
+            'unallocated_stock',
+        ]
+
+        url = reverse('api-part-list')
+
+        def get_totals():
+            return {
+                part['pk']: {field: float(part[field]) for field in fields}
+                for part in self.get(url).data
+            }
+
+        expected = get_totals()
+
+        with override_settings(PART_STOCK_TOTALS=True):
+            # Table has not yet been populated
+            self.assertEqual(PartStockTotal.objects.count(), 0)
+
+            PartStockTotal.rebuild()
+            self.assertGreater(PartStockTotal.objects.count(), 0)
+
+            self.assertEqual(get_totals(), expected)
+
+            # Totals are updated when stock is added (once the transaction is committed)
+            with self.captureOnCommitCallbacks(execute=True):
+                item = StockItem.objects.create(
+                    part=self.part, quantity=50, location=StockLocation.objects.first()
+                )
+
+            self.assertEqual(get_totals()[self.part.pk]['in_stock'], 650)
+
+            # ... and when stock is removed
+            with self.captureOnCommitCallbacks(execute=True):
+                item.delete()
+
+            self.assertEqual(get_totals(), expected)
+
+            # ... and when a location is deleted (and the stock items are moved)
+            location = StockLocation.objects.create(
+                name='Temporary', parent=StockLocation.objects.first()
+            )
+
+            with self.captureOnCommitCallbacks(execute=True):
+                StockItem.objects.create(part=self.part, quantity=50, location=location)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                location.delete()
+
+            self.assertEqual(get_totals()[self.part.pk]['in_stock'], 650)
+
+            # Repeated refreshes do not duplicate the totals
+            PartStockTotal.refresh([self.part.pk])
+            PartStockTotal.refresh([self.part.pk])
+
+            self.assertEqual(get_totals()[self.part.pk]['in_stock'], 650)
+
     def test_allocation_annotations(self):
         """Tests for query annotations which add allocation information.
 
@@ -286,6 +286,59 @@ class ParameterTests(TestCase):
             param.calculate_numeric_value()
             self.assertAlmostEqual(param.data_numeric, expected, places=2)
 
+    def test_rebuild_parameters(self):
+        """Test that parameters are rebuilt (in batches) when template units change."""
+        from common.tasks import rebuild_parameters
+
+        template = ParameterTemplate.objects.create(name='Rebuild Length', units='m')
+
+        data = ['1', '5mm', '5mm', '2 foot', 'abc', '3mm']
+
+        for prt, value in zip(
+            Part.objects.order_by('pk')[: len(data)], data, strict=True
+        ):
+            Parameter.objects.create(content_object=prt, template=template, data=value)
+
+        # Change the template units (without triggering the signal)
+        ParameterTemplate.objects.filter(pk=template.pk).update(units='mm')
+
+        rebuild_parameters(template.pk, batch_size=4)
+
+        expected = [1.0, 5.0, 5.0, 609.6, None, 3.0]
+
+        for param, value in zip(
+            Parameter.objects.filter(template=template).order_by('pk'),
+            expected,
+            strict=True,
+        ):
+            if value is None:
+                self.assertIsNone(param.data_numeric)
+            else:
+                self.assertAlmostEqual(param.data_numeric, value, places=2)
+
+        # The checkpoint is cleared once the rebuild is complete
+        template.refresh_from_db()
+        self.assertIsNone(template.checkpoint)
+
+        # An interrupted rebuild resumes from the recorded checkpoint
+        params = list(Parameter.objects.filter(template=template).order_by('pk'))
+
+        ParameterTemplate.objects.filter(pk=template.pk).update(
+            units='m', checkpoint={'units': 'm', 'last_id': params[3].pk}
+        )
+
+        rebuild_parameters(template.pk, batch_size=4)
+
+        expected = [1.0, 5.0, 5.0, 609.6, None, 0.003]
+
+        for param, value in zip(params, expected, strict=True):
+            param.refresh_from_db()
+
+            if value is None:
+                self.assertIsNone(param.data_numeric)
+            else:
+                self.assertAlmostEqual(param.data_numeric, value, places=3)
+
 
 class ParameterTest(InvenTreeAPITestCase):
     """Tests for the Parameter API."""
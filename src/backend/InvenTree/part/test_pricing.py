@@ -1,5 +1,7 @@
 """Unit tests for Part pricing calculations."""
 
+from unittest import mock
+
 from django.core.exceptions import ObjectDoesNotExist
 from django.test.utils import override_settings
 
@@ -14,6 +16,7 @@ import stock.models
 from common.settings import set_global_setting
 from InvenTree.unit_test import InvenTreeTestCase
 from order.status_codes import PurchaseOrderStatus
+from stock.coalesce import coalesce_part_updates
 
 
 class PartPricingTests(InvenTreeTestCase):
@@ -545,3 +548,133 @@ class PartPricingTests(InvenTreeTestCase):
 
         self.assertEqual(A1.pricing.overall_min, Money(a_min, 'USD'))
         self.assertEqual(A1.pricing.overall_max, Money(a_max, 'USD'))
+
+    @override_settings(TESTING_PRICING=True)
+    def test_batch_pricing(self):
+        """Test the batched (topologically ordered) pricing recalculation."""
+        from part.pricing import (
+            get_bom_items,
+            get_dependent_parts,
+            recalculate_pricing,
+            topological_order,
+        )
+
+        # Dependencies are always ordered before the parts which depend on them
+        self.assertEqual(topological_order([3, 2, 1], {3: {2}, 2: {1}}), [1, 2, 3])
+
+        # Circular dependencies are appended to the end of the list
+        self.assertEqual(topological_order([1, 2, 3], {2: {3}, 3: {2}}), [1, 2, 3])
+
+        A = part.models.Part.objects.create(
+            name='A', description='A', assembly=True, component=True
+        )
+        B = part.models.Part.objects.create(
+            name='B', description='B', assembly=True, component=True
+        )
+        C = part.models.Part.objects.create(name='C', description='C', component=True)
+
+        part.models.BomItem.objects.create(part=A, sub_part=B, quantity=2)
+        part.models.BomItem.objects.create(part=A, sub_part=C, quantity=1)
+        part.models.BomItem.objects.create(part=B, sub_part=C, quantity=3)
+
+        # Both assemblies depend on the pricing of the component
+        self.assertEqual(get_dependent_parts([C.pk])[C.pk], {A.pk, B.pk})
+        self.assertEqual(get_dependent_parts([B.pk])[B.pk], {A.pk})
+
+        pricing = C.pricing
+        pricing.override_min = Money(1, 'USD')
+        pricing.override_max = Money(2, 'USD')
+        pricing.save()
+
+        # Each affected part is recalculated exactly once
+        result = recalculate_pricing([C.pk])
+
+        self.assertEqual(result.recomputed, 3)
+        self.assertGreaterEqual(result.duration, 0)
+
+        self.assertEqual(B.pricing.overall_min, Money(3, 'USD'))
+        self.assertEqual(B.pricing.overall_max, Money(6, 'USD'))
+
+        self.assertEqual(A.pricing.overall_min, Money(7, 'USD'))
+        self.assertEqual(A.pricing.overall_max, Money(14, 'USD'))
+
+        # Only recalculate the parts which depend on the provided part
+        result = recalculate_pricing([B.pk], recalculate=False)
+
+        self.assertEqual(result.recomputed, 1)
+        self.assertEqual(result.changed, 0)
+
+        # Parts which are already scheduled for a full update are skipped
+        part.models.PartPricing.objects.filter(part=A).update(scheduled_for_update=True)
+
+        result = recalculate_pricing([B.pk], recalculate=False)
+        self.assertEqual(result.recomputed, 0)
+
+        part.models.PartPricing.objects.filter(part=A).update(
+            scheduled_for_update=False
+        )
+
+        # Variant pricing is pre-loaded for template parts
+        T = part.models.Part.objects.create(
+            name='T', description='T', is_template=True, component=True
+        )
+
+        for idx in range(3):
+            variant = part.models.Part.objects.create(
+                name=f'V{idx}', description='V', variant_of=T, component=True
+            )
+
+            pricing = variant.pricing
+            pricing.override_min = Money(idx + 1, 'USD')
+            pricing.override_max = Money(idx + 5, 'USD')
+            pricing.save()
+
+        result = recalculate_pricing([variant.pk])
+
+        self.assertEqual(result.recomputed, 2)
+        self.assertEqual(T.pricing.variant_cost_min, Money(1, 'USD'))
+        self.assertEqual(T.pricing.variant_cost_max, Money(7, 'USD'))
+
+        # BOM items are pre-loaded in bulk (including inherited items and variants)
+        TA = part.models.Part.objects.create(
+            name='TA', description='TA', assembly=True, is_template=True
+        )
+        VA = part.models.Part.objects.create(
+            name='VA', description='VA', assembly=True, variant_of=TA
+        )
+
+        bom_item = part.models.BomItem.objects.create(
+            part=TA, sub_part=T, quantity=2, inherited=True, allow_variants=True
+        )
+
+        bom_items = get_bom_items([VA.pk])[VA.pk]
+
+        self.assertEqual(len(bom_items), 1)
+        self.assertEqual(bom_items[0][0], bom_item)
+        self.assertEqual(
+            {prt.pk for prt in bom_items[0][1]},
+            {prt.pk for prt in bom_item.get_valid_parts_for_allocation()},
+        )
+
+        recalculate_pricing([variant.pk])
+
+        self.assertEqual(VA.pricing.bom_cost_min, Money(2, 'USD'))
+        self.assertEqual(VA.pricing.bom_cost_max, Money(14, 'USD'))
+
+        # Pricing updates for dependent parts are collected into a single task
+        with (
+            mock.patch('InvenTree.tasks.offload_task') as offload,
+            self.captureOnCommitCallbacks(execute=True),
+            coalesce_part_updates(),
+        ):
+            B.pricing.update_dependents()
+            C.pricing.update_dependents(counter=1)
+
+        offload.assert_called_once()
+
+        self.assertEqual(offload.call_args.args[1], sorted([B.pk, C.pk]))
+        self.assertFalse(offload.call_args.kwargs['recalculate'])
+        self.assertEqual(
+            offload.call_args.kwargs['max_depth'],
+            part.models.PartPricing.MAX_PRICING_DEPTH,
+        )
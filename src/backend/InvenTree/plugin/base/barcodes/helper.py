@@ -1,14 +1,29 @@
 """Helper functions for barcode generation."""
 
-from typing import cast
+import time
+from typing import Optional, cast
+
+from django.conf import settings
+from django.db import transaction
+from django.db.utils import OperationalError, ProgrammingError
 
 import structlog
 
 import InvenTree.helpers_model
+from InvenTree.cache import CacheVersion, LocalLRUCache
 from InvenTree.models import InvenTreeBarcodeMixin
 
 logger = structlog.get_logger('inventree')
 
+# Process-local cache of {barcode hash: (model type, pk)} for scanned barcodes
+BARCODE_CACHE = LocalLRUCache(maxsize=4096)
+
+# Version stamp for the barcode cache (incremented whenever a barcode is assigned or unassigned)
+BARCODE_CACHE_VERSION = CacheVersion('barcodes')
+
+# Maximum time (seconds) for which a "no match" result is cached
+BARCODE_MISS_TIMEOUT = 60
+
 
 def cache(func):
     """Cache the result of a function, but do not cache falsy results."""
@@ -64,3 +79,143 @@ def get_supported_barcode_model_codes_map():
         model.barcode_model_type_code(): model
         for model in get_supported_barcode_models()
     }
+
+
+def index_barcodes(instances: list[InvenTreeBarcodeMixin]) -> None:
+    """Update the barcode index entries for the provided model instances.
+
+    - If an instance has an assigned barcode, the index entry is created (or updated)
+    - If an instance has no assigned barcode, the index entry is removed
+
+    Any cached barcode lookups (including cached "no match" results) are invalidated.
+    """
+    from common.models import BarcodeIndex
+
+    instances = [instance for instance in instances if instance.pk is not None]
+
+    if not instances:
+        return
+
+    targets = {}
+
+    for instance in instances:
+        targets.setdefault(instance.barcode_model_type(), []).append(instance.pk)
+
+    try:
+        with transaction.atomic():
+            for model_type, ids in targets.items():
+                BarcodeIndex.objects.filter(
+                    model_type=model_type, model_id__in=ids
+                ).delete()
+
+            BarcodeIndex.objects.bulk_create([
+                BarcodeIndex(
+                    barcode_hash=instance.barcode_hash,
+                    model_type=instance.barcode_model_type(),
+                    model_id=instance.pk,
+                )
+                for instance in instances
+                if instance.barcode_hash
+            ])
+    except (OperationalError, ProgrammingError):
+        # Database is likely not yet ready
+        return
+
+    try:
+        version = BARCODE_CACHE_VERSION.bump()
+    except Exception:  # pragma: no cover
+        logger.warning('Failed to update barcode cache version')
+        return
+
+    for instance in instances:
+        if instance.barcode_hash:
+            BARCODE_CACHE.set(
+                instance.barcode_hash,
+                (instance.barcode_model_type(), instance.pk),
+                version,
+            )
+
+
+def lookup_barcode_hash(barcode_hash: str) -> Optional[InvenTreeBarcodeMixin]:
+    """Find the model instance which has been assigned the provided (third-party) barcode hash.
+
+    The following sources are checked in turn:
+
+    1. The process-local barcode cache
+    2. The barcode index table
+    3. Each supported barcode model (any match is then added to the index)
+
+    Any cached or indexed match is verified against the model instance,
+    so an entry which is stale (e.g. the barcode has since been unassigned) is ignored.
+
+    If the global cache is enabled, barcodes which do not match any instance are also cached,
+    until a barcode is next assigned (or for at most BARCODE_MISS_TIMEOUT seconds,
+    as a barcode may be assigned by other means e.g. data import).
+    Without the global cache, a barcode assigned by another process could not be detected.
+
+    Arguments:
+        barcode_hash: Hash of the scanned barcode data
+
+    Returns:
+        The matching model instance, or None if no match is found
+    """
+    from common.models import BarcodeIndex
+
+    if not barcode_hash:
+        return None
+
+    models_map = get_supported_barcode_models_map()
+
+    try:
+        version = BARCODE_CACHE_VERSION.get()
+    except Exception:  # pragma: no cover
+        version = None
+
+    def fetch(model_type: str, pk: int):
+        """Return the model instance, if the barcode is (still) assigned to it."""
+        if model := models_map.get(model_type):
+            return model.objects.filter(pk=pk, barcode_hash=barcode_hash).first()
+
+    miss_key = f'miss:{barcode_hash}'
+    miss_version = (version, int(time.time() // BARCODE_MISS_TIMEOUT))
+    miss_cache = settings.GLOBAL_CACHE_ENABLED
+
+    if entry := BARCODE_CACHE.get(barcode_hash, version):
+        if instance := fetch(*entry):
+            return instance
+    elif miss_cache and BARCODE_CACHE.get(miss_key, miss_version):
+        # Cached "no match" result
+        return None
+
+    try:
+        entries = list(
+            BarcodeIndex.objects.filter(barcode_hash=barcode_hash).values_list(
+                'pk', 'model_type', 'model_id'
+            )
+        )
+    except (OperationalError, ProgrammingError):
+        # Database is likely not yet ready
+        entries = []
+
+    stale = []
+
+    for pk, model_type, model_id in entries:
+        if instance := fetch(model_type, model_id):
+            BARCODE_CACHE.set(barcode_hash, (model_type, model_id), version)
+            return instance
+
+        stale.append(pk)
+
+    if stale:
+        BarcodeIndex.objects.filter(pk__in=stale).delete()
+
+    # Barcode is not indexed (e.g. assigned before the index was created)
+    for model in get_supported_barcode_models():
+        if instance := model.lookup_barcode(barcode_hash):
+            index_barcodes([instance])
+            return instance
+
+    if miss_cache:
+        BARCODE_CACHE.set(miss_key, True, miss_version)
+
+    return None
@@ -1,4 +1,14 @@
-"""Functions for triggering and responding to server side events."""
+"""Functions for triggering and responding to server side events.
+
+Events may be triggered within a "batching" scope (e.g. for the duration of a web request).
+Within this scope, triggered events are buffered and offloaded to the background worker as a single batch,
+which is then dispatched to all interested plugins in a single pass.
+"""
+
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Optional
 
 from django.conf import settings
 from django.db import transaction
@@ -11,13 +21,94 @@ from opentelemetry import trace
 import InvenTree.exceptions
 from common.settings import get_global_setting
 from InvenTree.ready import canAppAccessDatabase, isImportingData
-from InvenTree.tasks import offload_task
+from InvenTree.tasks import offload_task, task_fingerprint
 from plugin import PluginMixinEnum
 from plugin.registry import registry
 
 tracer = trace.get_tracer(__name__)
 logger = structlog.get_logger('inventree')
 
+# Thread-local storage for the active event buffer
+_thread_data = threading.local()
+
+
+class EventBuffer:
+    """Collection of events which have been triggered within a batching scope.
+
+    Attributes:
+        events: List of (event, args, kwargs) tuples, in the order in which they were triggered
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.events: list[tuple[str, tuple, dict]] = []
+        self.fingerprints: set[str] = set()
+
+    def __len__(self) -> int:
+        """Return the number of buffered events."""
+        return len(self.events)
+
+    def add(self, event: str, args: tuple, kwargs: dict):
+        """Add an event to the buffer (ignoring exact duplicates)."""
+        fingerprint = task_fingerprint(register_event, 'plugin', event, *args, **kwargs)
+
+        if fingerprint in self.fingerprints:
+            return
+
+        self.fingerprints.add(fingerprint)
+        self.events.append((event, args, kwargs))
+
+    def flush(self):
+        """Offload the buffered events to the background worker as a single batch."""
+        events = self.events
+
+        self.events = []
+        self.fingerprints = set()
+
+        if not events:
+            return
+
+        force_async = True
+
+        # If we are running in testing mode, we can enable or disable async processing
+        if settings.PLUGIN_TESTING_EVENTS:
+            force_async = settings.PLUGIN_TESTING_EVENTS_ASYNC
+
+        offload_task(register_events, events, group='plugin', force_async=force_async)
+
+
+def get_event_buffer() -> Optional[EventBuffer]:
+    """Return the active event buffer for this thread (if any)."""
+    return getattr(_thread_data, 'event_buffer', None)
+
+
+@contextmanager
+def batch_events():
+    """Context manager which batches events triggered within the scope.
+
+    - The events are offloaded as a single batch when the outermost scope exits
+    - An event triggered inside a database transaction is only added to the batch once the transaction is committed
+    - If the scope exits inside a database transaction, the batch is offloaded once the transaction is committed
+
+    Example:
+        with batch_events():
+            for item in items:
+                item.save()
+    """
+    if get_event_buffer() is not None:
+        # Already inside a batching scope
+        yield
+        return
+
+    buffer = EventBuffer()
+    _thread_data.event_buffer = buffer
+
+    try:
+        yield
+    finally:
+        _thread_data.event_buffer = None
+        transaction.on_commit(buffer.flush)
+
 
 @tracer.start_as_current_span('trigger_event')
 def trigger_event(event: str, *args, **kwargs) -> None:
@@ -49,6 +140,11 @@ def trigger_event(event: str, *args, **kwargs) -> None:
 
     force_async = kwargs.pop('force_async', True)
 
+    if (buffer := get_event_buffer()) is not None:
+        # Discard the event if the current transaction is rolled back
+        transaction.on_commit(functools.partial(buffer.add, event, args, kwargs))
+        return
+
     # If we are running in testing mode, we can enable or disable async processing
     if settings.PLUGIN_TESTING_EVENTS:
         force_async = settings.PLUGIN_TESTING_EVENTS_ASYNC
@@ -91,6 +187,60 @@ def register_event(event, *args, **kwargs):
                 )
 
 
+@tracer.start_as_current_span('register_events')
+def register_events(events: list):
+    """Dispatch a batch of events to any interested plugins, in a single pass.
+
+    Note: This function is processed by the background worker.
+
+    Each plugin processes each event independently:
+
+    - An error raised by one plugin does not prevent other plugins from processing the event
+    - If a plugin fails to process an event, a separate 'process_event' task is offloaded,
+      so that the background worker retries that event (for that plugin only)
+
+    Arguments:
+        events: List of (event, args, kwargs) tuples
+    """
+    logger.debug('Registering batch of %s triggered events', len(events))
+
+    if not (settings.PLUGIN_TESTING or get_global_setting('ENABLE_PLUGINS_EVENTS')):
+        return
+
+    # Check if the plugin registry needs to be reloaded
+    registry.check_reload()
+
+    plugins = list(registry.with_mixin(PluginMixinEnum.EVENTS, active=True))
+
+    for event, args, kwargs in events:
+        for plugin in plugins:
+            # Let the plugin decide if it wants to process this event
+            if not plugin.wants_process_event(event):
+                continue
+
+            logger.debug(
+                "Plugin '%s' is processing triggered event '%s'", plugin.slug, event
+            )
+
+            try:
+                # Isolate any database changes made by the plugin
+                with transaction.atomic():
+                    plugin.process_event(event, *args, **kwargs)
+            except Exception:
+                InvenTree.exceptions.log_error('process_event', plugin=plugin.slug)
+
+                # Offload a separate task, so that the background worker tries again
+                offload_task(
+                    process_event,
+                    plugin.slug,
+                    event,
+                    *args,
+                    group='plugin',
+                    force_async=True,
+                    **kwargs,
+                )
+
+
 @tracer.start_as_current_span('process_event')
 def process_event(plugin_slug, event, *args, **kwargs):
     """Respond to a triggered event.
@@ -150,12 +300,16 @@ def allow_table_event(table_name):
         return False
 
     ignore_tables = [
+        'common_barcodeindex',
         'common_notificationentry',
         'common_notificationmessage',
+        'common_taskfingerprint',
         'common_webhookendpoint',
         'common_webhookmessage',
         'part_partpricing',
         'part_partstocktake',
+        'part_partstocktotal',
+        'stock_serialnumbercounter',
     ]
 
     return table_name not in ignore_tables
@@ -1,6 +1,7 @@
 """Plugin class for custom data exporting."""
 
 from collections import OrderedDict
+from collections.abc import Iterator
 from typing import Optional
 
 from django.contrib.auth.models import User
@@ -9,7 +10,7 @@ from django.db.models import QuerySet
 from rest_framework import serializers, views
 
 from common.models import DataOutput
-from InvenTree.helpers import current_date
+from InvenTree.helpers import chunked, current_date
 from plugin import PluginMixinEnum
 
 
@@ -111,29 +112,95 @@ class DataExportMixin:
 
         Returns: The exported data (a list of dict objects)
         """
-        output.refresh_from_db()
-        N = queryset.count()
-
         rows = []
 
-        offset = 0
+        for chunk in self.export_data_chunks(
+            queryset, serializer_class, output, serializer_context=serializer_context
+        ):
+            rows.extend(chunk)
+
+        return rows
+
+    def export_data_stream(
+        self,
+        queryset: QuerySet,
+        serializer_class: serializers.Serializer,
+        headers: OrderedDict,
+        context: dict,
+        output: DataOutput,
+        serializer_context: Optional[dict] = None,
+        **kwargs,
+    ) -> Iterator[list]:
+        """Export data from the queryset, as a sequence of chunks.
+
+        This allows large datasets to be written to file without first
+        loading the entire dataset into memory.
+
+        If the plugin overrides the export_data method, the data returned
+        by that method is provided as a single chunk.
+
+        Arguments:
+            queryset: The queryset to export
+            serializer_class: The serializer class to use for exporting the data
+            serializer_context: Optional context for the serializer
+            headers: The headers for the export
+            context: Any custom context for the export (provided by the plugin serializer)
+            output: The DataOutput object for the export
+
+        Yields:
+            list: A chunk of exported data (a list of dict objects)
+        """
+        if type(self).export_data is not DataExportMixin.export_data:
+            yield self.export_data(
+                queryset,
+                serializer_class,
+                headers,
+                context,
+                output,
+                serializer_context=serializer_context,
+                **kwargs,
+            )
+            return
+
+        yield from self.export_data_chunks(
+            queryset, serializer_class, output, serializer_context=serializer_context
+        )
+
+    def export_data_chunks(
+        self,
+        queryset: QuerySet,
+        serializer_class: serializers.Serializer,
+        output: DataOutput,
+        serializer_context: Optional[dict] = None,
+    ) -> Iterator[list]:
+        """Serialize the queryset in chunks of EXPORT_CHUNK_SIZE rows.
 
-        while offset < N:
-            chunk = queryset[offset : offset + self.EXPORT_CHUNK_SIZE]
+        Rows are fetched from the database using a server-side cursor (where supported),
+        and the export progress is updated after each chunk is serialized.
 
+        Arguments:
+            queryset: The queryset to export
+            serializer_class: The serializer class to use for exporting the data
+            output: The DataOutput object for the export
+            serializer_context: Optional context for the serializer
+
+        Yields:
+            list: The serialized data for each chunk (a list of dict objects)
+        """
+        output.refresh_from_db()
+
+        for chunk in chunked(
+            queryset.iterator(chunk_size=self.EXPORT_CHUNK_SIZE), self.EXPORT_CHUNK_SIZE
+        ):
             chunk_rows = serializer_class(
                 chunk, many=True, exporting=True, context=serializer_context or {}
             ).data
 
-            rows.extend(chunk_rows)
-
-            offset += self.EXPORT_CHUNK_SIZE
-
             # Update the export progress
             output.progress += len(chunk_rows)
             output.save()
 
-        return rows
+            yield chunk_rows
 
     def get_export_options_serializer(self, **kwargs) -> serializers.Serializer | None:
         """Return a serializer class with dynamic export options for this plugin.
@@ -122,16 +122,16 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
         barcode_hash = hash_barcode(barcode_data)
 
         # If no "direct" hits are found, look for assigned third-party barcodes
-        for model in supported_models:
-            label = model.barcode_model_type()
+        instance = plugin.base.barcodes.helper.lookup_barcode_hash(barcode_hash)
 
-            instance = model.lookup_barcode(barcode_hash)
+        if instance is not None:
+            model = instance.__class__
+            label = model.barcode_model_type()
 
-            if instance is not None:
-                return {
-                    **self.format_matched_response(label, model, instance),
-                    'success': succcess_message,
-                }
+            return {
+                **self.format_matched_response(label, model, instance),
+                'success': succcess_message,
+            }
 
     def generate(self, model_instance: InvenTreeBarcodeMixin):
         """Generate a barcode for a given model instance."""
@@ -1,5 +1,8 @@
 """Unit tests for InvenTreeBarcodePlugin."""
 
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 import part.models
@@ -267,6 +270,65 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
             self.assertIn('success', response.data)
             self.assertEqual(response.data['stockitem']['pk'], 1)
 
+    def test_barcode_index(self):
+        """Test that third-party barcodes are resolved via the barcode index."""
+        from common.models import BarcodeIndex
+        from InvenTree.helpers import hash_barcode
+        from plugin.base.barcodes.helper import lookup_barcode_hash
+
+        barcode_hash = hash_barcode('xyz-123')
+
+        # Scan a barcode which is not (yet) assigned
+        self.scan({'barcode': 'xyz-123'}, expected_code=400)
+        self.assertIsNone(lookup_barcode_hash(barcode_hash))
+
+        si = stock.models.StockItem.objects.get(pk=1)
+        si.assign_barcode(barcode_data='xyz-123')
+
+        # Assigning the barcode adds an entry to the index
+        entry = BarcodeIndex.objects.get(barcode_hash=barcode_hash)
+        self.assertEqual(entry.model_type, 'stockitem')
+        self.assertEqual(entry.model_id, 1)
+
+        # The cached "no match" result is no longer used
+        response = self.scan({'barcode': 'xyz-123'}, expected_code=200)
+        self.assertEqual(response.data['stockitem']['pk'], 1)
+
+        # Subsequent lookups are resolved with a single query
+        with self.assertNumQueries(1):
+            self.assertEqual(lookup_barcode_hash(barcode_hash), si)
+
+        # Barcodes which are not yet indexed are found (and then indexed)
+        stock.models.StockItem.objects.filter(pk=2).update(
+            barcode_data='xyz-456', barcode_hash=hash_barcode('xyz-456')
+        )
+
+        response = self.scan({'barcode': 'xyz-456'}, expected_code=200)
+        self.assertEqual(response.data['stockitem']['pk'], 2)
+        self.assertTrue(
+            BarcodeIndex.objects.filter(model_type='stockitem', model_id=2).exists()
+        )
+
+        # Unassigning the barcode removes the index entry
+        si.unassign_barcode()
+
+        self.assertFalse(
+            BarcodeIndex.objects.filter(barcode_hash=barcode_hash).exists()
+        )
+        self.scan({'barcode': 'xyz-123'}, expected_code=400)
+
+        # "No match" results are only cached if the global cache is enabled
+        missing = hash_barcode('xyz-789')
+
+        for enabled in [False, True]:
+            with override_settings(GLOBAL_CACHE_ENABLED=enabled):
+                self.assertIsNone(lookup_barcode_hash(missing))
+
+                with CaptureQueriesContext(connection) as queries:
+                    self.assertIsNone(lookup_barcode_hash(missing))
+
+                self.assertEqual(len(queries) == 0, enabled)
+
     def test_scan_inventree_json(self):
         """Test scanning of first-party json barcodes."""
         # Scan a StockItem object (which does not exist)
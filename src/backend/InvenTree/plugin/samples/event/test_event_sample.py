@@ -1,10 +1,15 @@
 """Unit tests for event_sample sample plugins."""
 
+from unittest import mock
+
 from django.test import TestCase
 
+from django_q.models import OrmQ
+
 from common.models import InvenTreeSetting
+from InvenTree.unit_test import findOffloadedTask
 from plugin import InvenTreePlugin, registry
-from plugin.base.event.events import trigger_event
+from plugin.base.event.events import batch_events, get_event_buffer, trigger_event
 from plugin.helpers import MixinNotImplementedError
 from plugin.mixins import EventMixin
 
@@ -26,6 +31,81 @@ class EventPluginSampleTests(TestCase):
                 trigger_event('test.event')
             self.assertIn('Event `test.event` triggered in sample plugin', str(cm[1]))
 
+    def test_batch_events(self):
+        """Check that events triggered within a batching scope are processed together."""
+        registry.set_plugin_state('sampleevent', True)
+
+        InvenTreeSetting.set_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+
+        plugin = registry.get_plugin('sampleevent')
+
+        with (
+            self.settings(PLUGIN_TESTING_EVENTS=True),
+            mock.patch.object(plugin, 'process_event') as process,
+        ):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                with batch_events():
+                    trigger_event('test.event', id=1)
+                    trigger_event('test.event', id=1)
+                    trigger_event('test.event', id=2)
+                    trigger_event('test.other')
+
+                    # Events are only added to the batch once the transaction is committed
+                    self.assertEqual(len(get_event_buffer()), 0)
+
+                self.assertIsNone(get_event_buffer())
+
+                # Events are not processed until the transaction is committed
+                process.assert_not_called()
+
+            # One callback for each event, and one to offload the batch
+            self.assertEqual(len(callbacks), 5)
+
+            # Duplicate events are ignored
+            self.assertEqual(
+                process.call_args_list,
+                [
+                    mock.call('test.event', id=1),
+                    mock.call('test.event', id=2),
+                    mock.call('test.other'),
+                ],
+            )
+
+    def test_batch_events_error(self):
+        """An error processing one event is retried in a separate task."""
+        registry.set_plugin_state('sampleevent', True)
+
+        InvenTreeSetting.set_setting('ENABLE_PLUGINS_EVENTS', True, change_user=None)
+
+        plugin = registry.get_plugin('sampleevent')
+
+        def process_event(event, *args, **kwargs):
+            if event == 'test.fail':
+                raise ValueError('Event processing failed')
+
+        OrmQ.objects.all().delete()
+
+        with (
+            self.settings(PLUGIN_TESTING_EVENTS=True),
+            mock.patch.object(
+                plugin, 'process_event', side_effect=process_event
+            ) as process,
+        ):
+            with self.captureOnCommitCallbacks(execute=True), batch_events():
+                trigger_event('test.fail', id=1)
+                trigger_event('test.event', id=2)
+
+            # The second event is still processed
+            self.assertEqual(process.call_count, 2)
+
+        task = findOffloadedTask(
+            'plugin.base.event.events.process_event',
+            matching_args=['sampleevent', 'test.fail'],
+        )
+
+        self.assertIsNotNone(task)
+        self.assertEqual(task.kwargs()['id'], 1)
+
     def test_mixin(self):
         """Test that MixinNotImplementedError is raised."""
         with self.assertRaises(MixinNotImplementedError):
@@ -26,6 +26,7 @@ import InvenTree.exceptions
 import InvenTree.helpers
 import InvenTree.models
 import report.helpers
+import report.render
 import report.validators
 from common.models import DataOutput, RenderChoices, UpdatedUserMixin
 from common.settings import get_global_setting
@@ -465,13 +466,47 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
             except Exception:
                 InvenTree.exceptions.log_error('report_callback', plugin=plugin.slug)
 
-    def print(self, items: list, request=None, output=None, **kwargs) -> DataOutput:
+    def use_render_pool(self, items: list, workers: int, debug_mode: bool) -> bool:
+        """Determine if PDF rendering should be performed by a pool of worker processes."""
+        return not debug_mode and workers > 1 and len(items) > 1
+
+    def render_documents(
+        self, documents: list[str], output: DataOutput, workers: int
+    ) -> list[bytes]:
+        """Render a list of HTML documents to PDF, using a pool of worker processes.
+
+        Arguments:
+            documents: List of HTML documents to render
+            output: The DataOutput object, which is updated as each shard is completed
+            workers: Maximum number of worker processes
+
+        Returns:
+            List of rendered PDF files, in the same order as the provided documents
+        """
+
+        def update_progress(count: int):
+            output.progress += count
+            output.save()
+
+        try:
+            return report.render.render_pdfs(
+                documents, workers=workers, callback=update_progress
+            )
+        except Exception as e:
+            msg = _('Error rendering report')
+            output.mark_failure(error=msg)
+            raise ValidationError(f'{msg}: {e!s}')
+
+    def print(
+        self, items: list, request=None, output=None, workers: int = 1, **kwargs
+    ) -> DataOutput:
         """Print reports for a list of items against this template.
 
         Arguments:
             items: A list of items to print reports for (model instance)
             output: The DataOutput object to use (if provided)
             request: The request object (optional)
+            workers: Number of worker processes to use for PDF rendering (optional)
 
         Returns:
             output: The DataOutput object representing the generated report(s)
@@ -483,6 +518,9 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
             Currently, all items are rendered separately into PDF files,
             and then combined into a single PDF file.
 
+            If multiple workers are specified, the HTML for each item is rendered first,
+            and then converted to PDF in parallel by a pool of worker processes.
+
             Further work is required to allow the following extended features:
             - Render a single PDF file with the collated items (optional per template)
             - Render a raw file (do not convert to PDF) - allows for other file types
@@ -567,6 +605,11 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
                 output.progress += 1
                 output.save()
             else:
+                parallel = self.use_render_pool(items, workers, debug_mode)
+
+                # HTML documents to be rendered to PDF by the worker pool
+                documents = []
+
                 for instance in items:
                     context = self.get_context(instance, request)
 
@@ -575,10 +618,10 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
 
                     # Render the report output
                     try:
-                        if debug_mode:
-                            report = self.render_as_string(instance, request, None)
+                        if debug_mode or parallel:
+                            report = self.render_as_string(instance, request, context)
                         else:
-                            report = self.render(instance, request, None)
+                            report = self.render(instance, request, context)
                     except TemplateDoesNotExist as e:
                         t_name = str(e) or self.template
                         msg = f'Template file {t_name} does not exist'
@@ -596,6 +639,10 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
                         output.mark_failure(error=msg)
                         raise ValidationError(f'{msg}: {e!s}')
 
+                    if parallel:
+                        documents.append(report)
+                        continue
+
                     outputs.append(report)
 
                     self.handle_attachment(
@@ -607,6 +654,15 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
                     output.progress += 1
                     output.save()
 
+                if parallel:
+                    outputs = self.render_documents(documents, output, workers)
+
+                    for instance, report in zip(items, outputs, strict=True):
+                        self.handle_attachment(
+                            instance, report, report_name, request, debug_mode
+                        )
+                        self.notify_plugins(instance, report, request)
+
         except Exception as exc:
             # Something went wrong during the report generation process
             log_report_error('ReportTemplate.print')
@@ -0,0 +1,109 @@
+"""Parallel rendering of PDF reports, using a pool of standalone subprocesses.
+
+Converting HTML to PDF (via WeasyPrint) is CPU-bound, and is the most expensive step of report generation.
+The HTML documents are rendered by the calling process (which requires database access),
+and then converted to PDF by a number of standalone Python subprocesses.
+
+Standalone subprocesses (rather than a multiprocessing pool) are used,
+as the background worker processes are daemonic, and cannot start multiprocessing children.
+
+Note: This module must not import Django (or any other InvenTree module),
+as it is executed directly (as a script) by each rendering subprocess.
+"""
+
+import math
+import pickle
+import subprocess
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional
+
+# Number of shards to create for each worker process
+SHARDS_PER_WORKER = 4
+
+
+def render_pdf(html: str) -> bytes:
+    """Render a single HTML document to PDF."""
+    from weasyprint import HTML
+
+    return HTML(string=html).write_pdf(pdf_forms=True)
+
+
+def render_pdf_shard(documents: list[str]) -> list[bytes]:
+    """Render a shard (list) of HTML documents to PDF, in order."""
+    return [render_pdf(html) for html in documents]
+
+
+def render_pdf_subprocess(documents: list[str]) -> list[bytes]:
+    """Render a shard (list) of HTML documents to PDF, in a standalone subprocess.
+
+    The documents are passed to the subprocess via stdin,
+    and the rendered PDF files are returned via stdout.
+
+    Raises:
+        RuntimeError: If the subprocess fails to render the documents
+    """
+    result = subprocess.run(
+        [sys.executable, __file__],
+        input=pickle.dumps(documents),
+        capture_output=True,
+        check=False,
+    )
+
+    if result.returncode != 0:
+        error = result.stderr.decode(errors='replace').strip().splitlines()
+        raise RuntimeError(error[-1] if error else 'PDF rendering process failed')
+
+    return pickle.loads(result.stdout)
+
+
+def render_pdfs(
+    documents: list[str], workers: int, callback: Optional[Callable[[int], None]] = None
+) -> list[bytes]:
+    """Render a list of HTML documents to PDF, using a pool of subprocesses.
+
+    The documents are split into shards, which are rendered concurrently.
+
+    Arguments:
+        documents: List of HTML documents to render
+        workers: Maximum number of concurrent subprocesses
+        callback: Optional function called (with the number of documents) as each shard is completed
+
+    Returns:
+        List of rendered PDF files, in the same order as the provided documents
+    """
+    if not documents:
+        return []
+
+    shard_size = max(1, math.ceil(len(documents) / (workers * SHARDS_PER_WORKER)))
+
+    shards = [
+        documents[idx : idx + shard_size]
+        for idx in range(0, len(documents), shard_size)
+    ]
+
+    results: list[list[bytes]] = [[] for _ in shards]
+
+    # Each thread waits on a single subprocess at a time
+    with ThreadPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+        futures = {
+            executor.submit(render_pdf_subprocess, shard): idx
+            for idx, shard in enumerate(shards)
+        }
+
+        for future in as_completed(futures):
+            idx = futures[future]
+            results[idx] = future.result()
+
+            if callback:
+                callback(len(shards[idx]))
+
+    return [pdf for shard in results for pdf in shard]
+
+
+if __name__ == '__main__':
+    # Render a shard of documents (provided via stdin) to PDF
+    sys.stdout.buffer.write(
+        pickle.dumps(render_pdf_shard(pickle.loads(sys.stdin.buffer.read())))
+    )
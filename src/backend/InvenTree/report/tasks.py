@@ -20,7 +20,12 @@ def print_reports(template_id: int, item_ids: list[int], output_id: int, **kwarg
 
     This function is intended to be called by the background worker,
     and will continuously update the status of the DataOutput object.
+
+    If the REPORT_RENDER_WORKERS setting is greater than one,
+    PDF files are rendered in parallel by a pool of worker processes.
     """
+    from django.conf import settings
+
     from common.models import DataOutput
     from report.models import ReportTemplate
 
@@ -38,7 +43,7 @@ def print_reports(template_id: int, item_ids: list[int], output_id: int, **kwarg
     # Ensure they are sorted by the order of the provided item IDs
     items = sorted(items, key=lambda item: item_ids.index(item.pk))
 
-    template.print(items, output=output)
+    template.print(items, output=output, workers=settings.REPORT_RENDER_WORKERS)
 
 
 @tracer.start_as_current_span('print_labels')
@@ -561,6 +561,26 @@ class TestReportTest(PrintTestMixins, ReportTest):
         self.assertEqual(html_report.count('<head>'), 1)
         self.assertEqual(html_report.count('<body>'), 1)
 
+    def test_print_parallel(self):
+        """Test rendering of reports using a pool of worker processes."""
+        from pypdf import PdfReader
+
+        template = ReportTemplate.objects.filter(
+            enabled=True, model_type='stockitem', merge=False
+        ).first()
+
+        items = list(StockItem.objects.all()[:3])
+
+        output = template.print(items, workers=2)
+
+        self.assertTrue(output.complete)
+        self.assertEqual(output.progress, 100)
+        self.assertTrue(output.output.name.endswith('.pdf'))
+
+        # Each item is rendered into the merged PDF
+        with output.output.open('rb') as f:
+            self.assertGreaterEqual(len(PdfReader(f).pages), len(items))
+
     def test_mdl_build(self):
         """Test the Build model."""
         self.run_print_test(Build, 'build', label=False)
@@ -0,0 +1,432 @@
+"""Bulk stock adjustment operations.
+
+Adjusting stock items one at a time (via StockItem.stocktake, add_stock, take_stock or move)
+saves each item individually, writes a separate tracking entry for each item,
+and triggers post_save signals and plugin events for every item.
+
+The StockAdjustment class applies the same adjustments to many stock items at once:
+
+- The new quantity / location / status of every item is computed up front
+- Each adjusted item is validated against the same rules as StockItem.save()
+- Changes are written to the database with a single bulk_update query
+- Tracking entries are written with a single bulk_create query
+- Low-stock checks and pricing updates are scheduled once per part
+- Per-item events (and an aggregated event for the entire adjustment) are triggered as a single batch
+"""
+
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+
+import structlog
+
+import InvenTree.helpers
+from common.settings import get_global_setting
+from InvenTree.models import defer_tree_updates
+from InvenTree.status_codes import StockHistoryCode
+from plugin.events import batch_events, trigger_event
+from stock.coalesce import coalesce_part_updates, queue_part_updates
+from stock.events import StockEvents
+from stock.models import StockItem, StockItemTracking
+
+logger = structlog.get_logger('inventree')
+
+
+class StockAdjustment:
+    """Apply a stock adjustment to multiple stock items in bulk.
+
+    Each adjustment method accepts a list of dicts (as provided by the StockAdjustmentItemSerializer):
+
+    - pk: The StockItem instance to adjust
+    - quantity: The quantity value for the adjustment
+    - batch: (optional) New batch code
+    - status: (optional) New status code
+    - packaging: (optional) New packaging value
+
+    Example:
+        StockAdjustment(user, notes='Annual stocktake').count(items)
+    """
+
+    # Fields which may be modified by a bulk adjustment
+    UPDATE_FIELDS = [
+        'quantity',
+        'location',
+        'status',
+        'status_custom_key',
+        'batch',
+        'packaging',
+        'stocktake_date',
+        'stocktake_user',
+    ]
+
+    def __init__(self, user, notes: str = ''):
+        """Initialize the stock adjustment.
+
+        Arguments:
+            user: The user performing the adjustment
+            notes: Optional notes for the tracking entries
+        """
+        self.user = user
+        self.notes = notes or ''
+
+        self.now = InvenTree.helpers.current_time()
+        self.custom_status_codes = StockItem.STATUS_CLASS.custom_values()
+
+        # Items which have been modified (keyed by primary key)
+        self.updated: dict[int, StockItem] = {}
+
+        # Items which are depleted, and will be deleted (keyed by primary key)
+        self.deleted: dict[int, StockItem] = {}
+
+        self.tracking: list[StockItemTracking] = []
+
+        # Per-item events, as (event, kwargs) tuples
+        self.events: list[tuple[str, dict]] = []
+
+    def load_items(self, items: list[dict]) -> list[tuple[StockItem, dict]]:
+        """Fetch the stock items for the adjustment with a single query.
+
+        Related fields required for validation are fetched at the same time.
+        If the same item is provided multiple times, the adjustments are applied in sequence.
+
+        Any provided quantity values are converted to Decimal (to match the StockItem.quantity field).
+
+        Arguments:
+            items: List of item adjustment dicts
+
+        Returns:
+            A list of (StockItem, adjustment) tuples
+        """
+        pks = {item['pk'].pk for item in items}
+
+        instances = StockItem.objects.filter(pk__in=pks).select_related(
+            'part', 'location', 'supplier_part__part', 'build__part'
+        )
+
+        instances = {instance.pk: instance for instance in instances}
+
+        result = []
+
+        for item in items:
+            if (quantity := item.get('quantity')) is not None:
+                item = {**item, 'quantity': Decimal(str(quantity))}
+
+            result.append((instances[item['pk'].pk], item))
+
+        return result
+
+    def set_status(self, stock_item: StockItem, status, deltas: dict):
+        """Adjust the status of a stock item (if required).
+
+        Arguments:
+            stock_item: The StockItem to adjust
+            status: The new status code (may be a custom status)
+            deltas: Dict of tracking deltas to update
+        """
+        if not status or stock_item.compare_status(status):
+            return
+
+        old_custom_status = stock_item.get_custom_status()
+        old_status_logical = stock_item.status
+        stock_item.set_status(status, custom_values=self.custom_status_codes)
+        deltas['status'] = status  # may be a custom value
+        deltas['status_logical'] = stock_item.status  # always the logical value
+        deltas['old_status'] = (
+            old_custom_status if old_custom_status else old_status_logical
+        )
+        deltas['old_status_logical'] = old_status_logical
+
+    def set_fields(self, stock_item: StockItem, item: dict, deltas: dict):
+        """Adjust the optional (non-status) fields of a stock item.
+
+        Arguments:
+            stock_item: The StockItem to adjust
+            item: The item adjustment dict
+            deltas: Dict of tracking deltas to update
+        """
+        for field in StockItem.optional_transfer_fields():
+            if field == 'status':
+                continue
+
+            if value := item.get(field):
+                setattr(stock_item, field, value)
+                deltas[field] = value
+
+    def set_quantity(self, stock_item: StockItem, quantity: Decimal) -> bool:
+        """Set the quantity of a stock item.
+
+        If the quantity reaches zero, the item may be marked for deletion.
+
+        Returns:
+            True if the item is to be updated, False if it is to be deleted
+        """
+        stock_item.quantity = max(Decimal(quantity), 0)
+
+        if (
+            stock_item.quantity == 0
+            and stock_item.delete_on_deplete
+            and stock_item.can_delete()
+        ):
+            self.deleted[stock_item.pk] = stock_item
+            self.updated.pop(stock_item.pk, None)
+            return False
+
+        return True
+
+    def add_entry(
+        self, stock_item: StockItem, code, deltas: dict, event: str, **kwargs
+    ):
+        """Mark the stock item as updated, and construct a tracking entry for it.
+
+        Arguments:
+            stock_item: The adjusted StockItem
+            code: The StockHistoryCode for the tracking entry
+            deltas: Dict of tracking deltas
+            event: The per-item event to trigger for the adjustment
+            kwargs: Additional keyword arguments for the event
+        """
+        self.updated[stock_item.pk] = stock_item
+        self.events.append((event, {'id': stock_item.pk, **kwargs}))
+
+        self.tracking.append(
+            StockItemTracking(
+                item=stock_item,
+                part=stock_item.part,
+                tracking_type=code.value,
+                user=self.user,
+                date=self.now,
+                notes=self.notes,
+                deltas=deltas,
+            )
+        )
+
+    def validate(self):
+        """Validate all updated items, using the same rules as StockItem.save()."""
+        from plugin import PluginMixinEnum, registry
+
+        plugin_validation = len(registry.with_mixin(PluginMixinEnum.VALIDATION)) > 0
+
+        for stock_item in self.updated.values():
+            stock_item.clean()
+
+            if plugin_validation:
+                stock_item.run_plugin_validation()
+
+    def commit(self, event: str, **kwargs) -> list[StockItem]:
+        """Write all pending changes to the database.
+
+        Arguments:
+            event: The aggregated event to trigger for the adjusted items
+            kwargs: Additional keyword arguments for the event
+
+        Returns:
+            The list of updated StockItem objects
+        """
+        self.validate()
+
+        items = list(self.updated.values())
+
+        with transaction.atomic(), coalesce_part_updates():
+            StockItem.objects.bulk_update(items, self.UPDATE_FIELDS, batch_size=500)
+
+            StockItemTracking.objects.bulk_create(
+                [entry for entry in self.tracking if entry.item.pk not in self.deleted],
+                batch_size=500,
+            )
+
+            for stock_item in self.deleted.values():
+                stock_item.delete()
+
+            self.schedule_part_updates(items)
+
+        logger.info(
+            'Adjusted %s stock items (%s deleted)', len(items), len(self.deleted)
+        )
+
+        ids = sorted(self.updated.keys() | self.deleted.keys())
+
+        # Per-item events are offloaded together with the aggregated event
+        with batch_events():
+            for item_event, item_kwargs in self.events:
+                if item_kwargs['id'] not in self.deleted:
+                    trigger_event(item_event, **item_kwargs)
+
+            if ids:
+                trigger_event(event, ids=ids, **kwargs)
+
+        return items
+
+    def schedule_part_updates(self, items: list[StockItem]):
+        """Schedule low-stock checks, pricing and stock totals updates for the affected parts.
+
+        These are normally triggered by the post_save signal for each StockItem,
+        which is not sent for a bulk update.
+        """
+        queue_part_updates(item.part for item in items)
+
+    def count(self, items: list[dict]) -> list[StockItem]:
+        """Perform a stocktake (count) against each of the provided items.
+
+        Serialized items cannot be counted, and are ignored.
+        """
+        for stock_item, item in self.load_items(items):
+            if stock_item.serialized or stock_item.pk in self.deleted:
+                continue
+
+            deltas = {}
+
+            self.set_status(stock_item, item.get('status', None), deltas)
+
+            if not self.set_quantity(stock_item, item['quantity']):
+                continue
+
+            deltas['quantity'] = float(stock_item.quantity)
+
+            stock_item.stocktake_date = InvenTree.helpers.current_date()
+            stock_item.stocktake_user = self.user
+
+            self.set_fields(stock_item, item, deltas)
+            self.add_entry(
+                stock_item,
+                StockHistoryCode.STOCK_COUNT,
+                deltas,
+                StockEvents.ITEM_COUNTED,
+                quantity=float(stock_item.quantity),
+            )
+
+        return self.commit(StockEvents.ITEMS_COUNTED)
+
+    def add(self, items: list[dict]) -> list[StockItem]:
+        """Add the specified quantity to each of the provided items.
+
+        Serialized items, and items with a zero quantity, are ignored.
+        """
+        for stock_item, item in self.load_items(items):
+            quantity = item['quantity']
+
+            if stock_item.serialized or stock_item.pk in self.deleted:
+                continue
+
+            if quantity is None or quantity <= 0:
+                continue
+
+            deltas = {}
+
+            self.set_status(stock_item, item.get('status', None), deltas)
+            self.set_quantity(stock_item, stock_item.quantity + quantity)
+
+            deltas['added'] = float(quantity)
+            deltas['quantity'] = float(stock_item.quantity)
+
+            self.set_fields(stock_item, item, deltas)
+            self.add_entry(
+                stock_item,
+                StockHistoryCode.STOCK_ADD,
+                deltas,
+                StockEvents.ITEM_QUANTITY_UPDATED,
+                quantity=float(stock_item.quantity),
+            )
+
+        return self.commit(StockEvents.ITEMS_QUANTITY_UPDATED)
+
+    def remove(self, items: list[dict]) -> list[StockItem]:
+        """Remove the specified quantity from each of the provided items.
+
+        Serialized items, and items with a zero quantity, are ignored.
+        Items which are depleted are deleted (if the item is marked as 'delete_on_deplete').
+        """
+        for stock_item, item in self.load_items(items):
+            quantity = item['quantity']
+
+            if stock_item.serialized or stock_item.pk in self.deleted:
+                continue
+
+            if quantity is None or quantity <= 0:
+                continue
+
+            deltas = {}
+
+            self.set_status(stock_item, item.get('status', None), deltas)
+
+            if not self.set_quantity(stock_item, stock_item.quantity - quantity):
+                continue
+
+            deltas['removed'] = float(quantity)
+            deltas['quantity'] = float(stock_item.quantity)
+
+            self.set_fields(stock_item, item, deltas)
+            self.add_entry(
+                stock_item,
+                StockHistoryCode.STOCK_REMOVE,
+                deltas,
+                StockEvents.ITEM_QUANTITY_UPDATED,
+                quantity=float(stock_item.quantity),
+            )
+
+        return self.commit(StockEvents.ITEMS_QUANTITY_UPDATED)
+
+    def transfer(self, items: list[dict], location) -> list[StockItem]:
+        """Transfer each of the provided items to a new location.
+
+        If less than the available quantity is to be moved, the item must be split,
+        and the move is performed individually (via StockItem.move).
+        The stock item trees are rebuilt once (rather than after each split).
+        """
+        allow_out_of_stock_transfer = get_global_setting(
+            'STOCK_ALLOW_OUT_OF_STOCK_TRANSFER', backup_value=False, cache=False
+        )
+
+        with defer_tree_updates():
+            for stock_item, item in self.load_items(items):
+                quantity = item['quantity']
+
+                if not allow_out_of_stock_transfer and not stock_item.is_in_stock(
+                    check_status=False, check_in_production=False
+                ):
+                    raise ValidationError(
+                        _('StockItem cannot be moved as it is not in stock')
+                    )
+
+                if quantity <= 0:
+                    continue
+
+                if quantity < stock_item.quantity:
+                    # Partial movement - the stock item must be split
+                    extra = {
+                        field: value
+                        for field in StockItem.optional_transfer_fields()
+                        if (value := item.get(field, None))
+                    }
+
+                    stock_item.move(
+                        location, self.notes, self.user, quantity=quantity, **extra
+                    )
+                    continue
+
+                deltas = {'quantity': float(quantity)}
+
+                if location == stock_item.location:
+                    # Moving into the same location triggers a different history code
+                    code = StockHistoryCode.STOCK_UPDATE
+                else:
+                    code = StockHistoryCode.STOCK_MOVE
+                    deltas['location'] = location.pk
+
+                old_location = stock_item.location
+                stock_item.location = location
+
+                self.set_status(stock_item, item.get('status', None), deltas)
+                self.set_fields(stock_item, item, deltas)
+                self.add_entry(
+                    stock_item,
+                    code,
+                    deltas,
+                    StockEvents.ITEM_MOVED,
+                    old_location=old_location.pk if old_location else None,
+                    new_location=location.pk,
+                    quantity=float(quantity),
+                )
+
+            return self.commit(StockEvents.ITEMS_MOVED, location=location.pk)
@@ -53,6 +53,7 @@ from InvenTree.mixins import (
     RetrieveUpdateDestroyAPI,
     SerializerContextMixin,
 )
+from InvenTree.pagination import InvenTreePagination
 from order.models import PurchaseOrder, ReturnOrder, SalesOrder
 from order.serializers import (
     PurchaseOrderSerializer,
@@ -1065,6 +1066,7 @@ class StockList(
 
     filterset_class = StockFilter
     output_options = StockOutputOptions
+    pagination_class = InvenTreePagination
 
     def create(self, request, *args, **kwargs):
         """Create a new StockItem object via the API.
@@ -1566,6 +1568,10 @@ class StockTrackingList(
     serializer_class = StockSerializers.StockTrackingSerializer
     filterset_class = StockTrackingFilter
     output_options = StockTrackingOutputOptions
+    pagination_class = InvenTreePagination
+
+    # Cursor pagination returns the most recent entries first
+    cursor_ordering = '-pk'
 
     def get_delta_model_map(self) -> dict:
         """Return a mapping of delta models to their respective models and serializers.
@@ -1614,9 +1620,16 @@ class StockTrackingList(
         for key in delta_models:
             model, serializer = delta_models[key]
 
+            if not related_model_lookups[key]:
+                continue
+
             # Fetch all related models in one go
             related_models = model.objects.filter(pk__in=related_model_lookups[key])
 
+            # Pre-fetch any related data required by the serializer
+            if hasattr(serializer, 'annotate_queryset'):
+                related_models = serializer.annotate_queryset(related_models)
+
             # Construct a mapping of pk -> serialized data
             related_data = {obj.pk: serializer(obj).data for obj in related_models}
 
@@ -0,0 +1,276 @@
+"""Coalescing of part updates triggered by stock item changes.
+
+Each time a StockItem is saved or deleted, the associated Part may need to:
+
+- Check if the part has fallen below its minimum stock level
+- Have its pricing information recalculated (along with any parts which depend on it)
+- Have its pre-calculated stock totals refreshed (if enabled)
+
+Any cached data which is derived from stock levels (e.g. build order availability)
+is also invalidated, by incrementing the STOCK_CACHE_VERSION stamp.
+
+When many stock items are modified together (e.g. a bulk transfer or a large receipt),
+scheduling these updates for every single item generates a large number of redundant tasks.
+
+Within a "coalescing" scope, the affected part IDs are instead collected,
+and a single (deduplicated) batch of tasks is offloaded when the scope exits.
+If the scope exits inside an open database transaction, the batch is offloaded once the transaction is committed.
+"""
+
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
+
+import structlog
+
+import InvenTree.cache
+import InvenTree.ready
+import InvenTree.tasks
+from common.settings import get_global_setting
+from part.pricing import defer_pricing_dependents
+
+logger = structlog.get_logger('inventree')
+
+# Thread-local storage for the active coalescing buffer
+_thread_data = threading.local()
+
+# Version stamp for cached data derived from stock levels, allocations and orders
+STOCK_CACHE_VERSION = InvenTree.cache.CacheVersion('stock')
+
+
+class PartUpdateBuffer:
+    """Collection of part IDs which require low-stock checks or pricing updates.
+
+    Attributes:
+        low_stock: Set of part IDs which require a low-stock check
+        pricing: Dict of {part_id: create} for parts which require a pricing update
+        stock_totals: Set of part IDs which require a stock totals refresh
+        stock_changed: True if cached stock data must be invalidated
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.low_stock: set[int] = set()
+        self.pricing: dict[int, bool] = {}
+        self.stock_totals: set[int] = set()
+        self.stock_changed = False
+
+    def __bool__(self) -> bool:
+        """Return True if there are any pending updates."""
+        return bool(
+            self.low_stock or self.pricing or self.stock_totals or self.stock_changed
+        )
+
+    def flush(self):
+        """Offload the pending updates as a single batch of background tasks.
+
+        Stock totals are refreshed immediately (rather than in the background),
+        so that subsequent requests do not read stale values.
+        """
+        from part import tasks as part_tasks
+        from part.models import PartPricing, PartStockTotal
+
+        if self.stock_changed:
+            invalidate_stock_cache()
+
+        if self.stock_totals:
+            PartStockTotal.refresh(self.stock_totals)
+
+        if self.low_stock:
+            InvenTree.tasks.offload_task(
+                part_tasks.notify_low_stock_if_required_batch,
+                sorted(self.low_stock),
+                group='notification',
+                force_async=True,
+            )
+
+        if self.pricing and get_global_setting('PRICING_AUTO_UPDATE', True):
+            part_ids = {pk for pk, create in self.pricing.items() if create}
+
+            # Parts which only require an update if pricing data already exists
+            existing = [pk for pk, create in self.pricing.items() if not create]
+
+            if existing:
+                part_ids.update(
+                    PartPricing.objects.filter(part__in=existing).values_list(
+                        'part', flat=True
+                    )
+                )
+
+            if part_ids:
+                InvenTree.tasks.offload_task(
+                    part_tasks.update_pricing_batch,
+                    sorted(part_ids),
+                    force_async=not settings.TESTING or not settings.TESTING_PRICING,
+                    group='pricing',
+                )
+
+        self.low_stock = set()
+        self.pricing = {}
+        self.stock_totals = set()
+        self.stock_changed = False
+
+
+def get_active_buffer() -> PartUpdateBuffer | None:
+    """Return the active coalescing buffer for this thread (if any)."""
+    return getattr(_thread_data, 'buffer', None)
+
+
+@contextmanager
+def coalesce_part_updates():
+    """Context manager which coalesces part updates triggered by stock item changes.
+
+    Scopes may be nested - the updates are only offloaded when the outermost scope exits.
+    The updates are offloaded once the current transaction is committed (even if an exception
+    is raised within the scope), and are discarded if the transaction is rolled back.
+
+    Pricing updates for any dependent parts are also collected (see part.pricing.defer_pricing_dependents).
+
+    Example:
+        with coalesce_part_updates():
+            for item in items:
+                item.move(location, notes, user)
+    """
+    if get_active_buffer() is not None:
+        # Already inside a coalescing scope
+        yield
+        return
+
+    buffer = PartUpdateBuffer()
+    _thread_data.buffer = buffer
+
+    try:
+        with defer_pricing_dependents():
+            yield
+    finally:
+        _thread_data.buffer = None
+
+        if buffer:
+            transaction.on_commit(buffer.flush)
+
+
+def queue_low_stock_check(part):
+    """Check if the provided part has fallen below its minimum stock level.
+
+    If a coalescing scope is active, the check is deferred until the scope exits.
+    """
+    from part import tasks as part_tasks
+
+    if part is None or part.pk is None:
+        return
+
+    buffer = get_active_buffer()
+
+    if buffer is not None:
+        buffer.low_stock.add(part.pk)
+        return
+
+    InvenTree.tasks.offload_task(
+        part_tasks.notify_low_stock_if_required,
+        part.pk,
+        group='notification',
+        force_async=True,
+    )
+
+
+def queue_pricing_update(part, create: bool = False):
+    """Schedule a pricing update for the provided part.
+
+    If a coalescing scope is active, the update is deferred until the scope exits.
+
+    Arguments:
+        part: The Part instance to update
+        create: If True, create pricing data for the part if it does not already exist
+    """
+    if part is None or part.pk is None:
+        return
+
+    buffer = get_active_buffer()
+
+    if buffer is not None:
+        buffer.pricing[part.pk] = buffer.pricing.get(part.pk, False) or create
+        return
+
+    part.schedule_pricing_update(create=create)
+
+
+def queue_stock_totals_update(part_ids):
+    """Schedule a refresh of the pre-calculated stock totals for the provided parts.
+
+    If a coalescing scope is active, the refresh is deferred until the scope exits.
+    Otherwise, the refresh is performed once the current transaction is committed.
+
+    Arguments:
+        part_ids: Iterable of Part IDs to refresh
+    """
+    from part.models import PartStockTotal
+
+    queue_stock_cache_invalidation()
+
+    if not PartStockTotal.enabled():
+        return
+
+    part_ids = {pk for pk in part_ids if pk is not None}
+
+    if not part_ids:
+        return
+
+    buffer = get_active_buffer()
+
+    if buffer is not None:
+        buffer.stock_totals.update(part_ids)
+        return
+
+    transaction.on_commit(lambda: PartStockTotal.refresh(part_ids))
+
+
+def invalidate_stock_cache():
+    """Invalidate any cached data which is derived from stock levels, allocations or orders."""
+    try:
+        STOCK_CACHE_VERSION.bump()
+    except Exception:  # pragma: no cover
+        logger.warning('Failed to update stock cache version')
+
+
+def queue_stock_cache_invalidation():
+    """Schedule invalidation of cached stock data.
+
+    If a coalescing scope is active, the cache is invalidated (once) when the scope exits.
+    Otherwise, the cache is invalidated once the current transaction is committed.
+    """
+    buffer = get_active_buffer()
+
+    if buffer is not None:
+        buffer.stock_changed = True
+        return
+
+    transaction.on_commit(invalidate_stock_cache)
+
+
+def queue_part_updates(parts):
+    """Schedule low-stock checks, pricing and stock totals updates for the provided parts.
+
+    These are normally triggered by the post_save signal for each StockItem,
+    which is not sent for bulk operations (e.g. bulk_create or bulk_update).
+
+    Arguments:
+        parts: Iterable of Part instances which have had their stock modified
+    """
+    if InvenTree.ready.isImportingData():
+        return
+
+    parts = {part.pk: part for part in parts if part is not None}
+
+    with coalesce_part_updates():
+        queue_stock_totals_update(parts.keys())
+
+        for part in parts.values():
+            if InvenTree.ready.canAppAccessDatabase(allow_test=True):
+                queue_low_stock_check(part)
+
+            if InvenTree.ready.canAppAccessDatabase(
+                allow_test=settings.TESTING_PRICING
+            ):
+                queue_pricing_update(part, create=True)
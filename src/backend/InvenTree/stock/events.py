@@ -17,3 +17,6 @@ class StockEvents(BaseEventEnum):
     ITEM_INSTALLED_INTO_ASSEMBLY = 'stockitem.installed'
 
     ITEMS_CREATED = 'stockitem.created_items'
+    ITEMS_MOVED = 'stockitem.moved_items'
+    ITEMS_COUNTED = 'stockitem.counted_items'
+    ITEMS_QUANTITY_UPDATED = 'stockitem.quantityupdated_items'
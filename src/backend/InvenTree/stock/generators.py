@@ -4,6 +4,7 @@ from inspect import signature
 from typing import Optional
 
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.template import Context, Template
 
 import common.models
@@ -78,13 +79,73 @@ def generate_batch_code(**kwargs):
     return Template(batch_template).render(Context(context))
 
 
-def generate_serial_number(part=None, quantity=1, **kwargs) -> Optional[str]:
-    """Generate a default 'serial number' for a new StockItem."""
-    quantity = quantity or 1
+def increment_serial_numbers(part, serial: Optional[str], quantity: int) -> list[str]:
+    """Generate a sequence of new serial numbers for the provided part.
 
-    if part is None:
-        # Cannot generate a serial number without a part
-        return None
+    Serial numbers which already exist (or are rejected by a plugin) are skipped.
+
+    Arguments:
+        part: The Part instance to generate serial numbers for
+        serial: The serial number to start incrementing from (not included)
+        quantity: The number of serial numbers to generate
+
+    Returns:
+        A list of serial numbers, which may be shorter than the requested quantity
+        if the serial number could not be incremented further
+    """
+    serials = []
+
+    # Limit the number of attempts, in case every generated serial number is rejected
+    for _attempt in range(10):
+        candidates = []
+        exhausted = False
+
+        # Generate the required quantity of serial numbers
+        # Note that this call gets passed through to the plugin system
+        while len(candidates) < quantity - len(serials):
+            serial = InvenTree.helpers.increment_serial_number(serial, part=part)
+
+            # Exit if an empty or duplicated serial is generated
+            if not serial or serial in candidates or serial in serials:
+                exhausted = True
+                break
+
+            candidates.append(serial)
+
+        conflicts = set(part.find_conflicting_serial_numbers(candidates))
+        serials.extend([sn for sn in candidates if sn not in conflicts])
+
+        if exhausted or len(serials) >= quantity:
+            break
+
+    return serials
+
+
+def get_serial_number_start(part) -> Optional[str]:
+    """Return the serial number from which new serial numbers are generated.
+
+    If a plugin provides the 'latest' serial number for this part, that value is used.
+    Otherwise, the serial number counter value (which includes any reserved serial numbers) is used.
+    If the counter has not yet been seeded, the latest existing serial number is used.
+    """
+    from stock.models import SerialNumberCounter
+
+    if (serial := part.get_plugin_serial_number()) is not None:
+        return serial
+
+    counter = SerialNumberCounter.objects.filter(
+        tree_id=SerialNumberCounter.get_tree_id(part)
+    ).first()
+
+    if counter is not None:
+        return counter.serial
+
+    return SerialNumberCounter.get_latest_existing(part)[0]
+
+
+def validate_serial_quantity(quantity) -> int:
+    """Validate the quantity of serial numbers to generate."""
+    quantity = quantity or 1
 
     try:
         quantity = int(quantity)
@@ -94,22 +155,61 @@ def generate_serial_number(part=None, quantity=1, **kwargs) -> Optional[str]:
     if quantity < 1:
         raise ValidationError({'quantity': 'Quantity must be greater than zero'})
 
-    # If we are here, no plugins were available to generate a serial number
-    # In this case, we will generate a simple serial number based on the provided part
-    sn = part.get_latest_serial_number()
+    return quantity
 
-    serials = []
 
-    # Generate the required quantity of serial numbers
-    # Note that this call gets passed through to the plugin system
-    while quantity > 0:
-        sn = InvenTree.helpers.increment_serial_number(sn, part=part)
+def generate_serial_number(
+    part=None, quantity=1, reserve=False, **kwargs
+) -> Optional[str]:
+    """Generate a default 'serial number' for a new StockItem.
 
-        # Exit if an empty or duplicated serial is generated
-        if not sn or sn in serials:
-            break
+    Arguments:
+        part: The Part instance to generate serial numbers for
+        quantity: The number of serial numbers to generate
+        reserve: If True, the generated serial numbers are reserved (see reserve_serial_numbers)
+    """
+    if part is None:
+        # Cannot generate a serial number without a part
+        return None
 
-        serials.append(sn)
-        quantity -= 1
+    if reserve:
+        serials = reserve_serial_numbers(part, quantity)
+    else:
+        quantity = validate_serial_quantity(quantity)
+        serials = increment_serial_numbers(
+            part, get_serial_number_start(part), quantity
+        )
 
     return ','.join(serials)
+
+
+def reserve_serial_numbers(part, quantity=1) -> list[str]:
+    """Atomically reserve a block of new serial numbers for the provided part.
+
+    The serial number counter for the part tree is locked while the serial numbers are generated,
+    so that concurrent requests are never issued the same serial numbers.
+
+    If a plugin provides the 'latest' serial number for this part,
+    the serial numbers are generated from that value instead (and are not reserved).
+
+    Arguments:
+        part: The Part instance to reserve serial numbers for
+        quantity: The number of serial numbers to reserve
+
+    Returns:
+        A list of reserved serial numbers
+    """
+    from stock.models import SerialNumberCounter
+
+    quantity = validate_serial_quantity(quantity)
+
+    if (serial := part.get_plugin_serial_number()) is not None:
+        # Serial number generation is handled by a plugin
+        return increment_serial_numbers(part, serial, quantity)
+
+    with transaction.atomic():
+        counter = SerialNumberCounter.lock(part)
+        serials = increment_serial_numbers(part, counter.serial, quantity)
+        counter.update_latest(serials)
+
+    return serials
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.13 on 2026-10-18 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stock", "0119_alter_stockitemtestresult_date"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SerialNumberCounter",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("tree_id", models.PositiveIntegerField(unique=True)),
+                (
+                    "serial",
+                    models.CharField(blank=True, max_length=100, null=True),
+                ),
+                ("serial_int", models.IntegerField(default=0)),
+            ],
+        ),
+    ]
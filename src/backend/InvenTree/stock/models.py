@@ -13,7 +13,7 @@ from django.core.validators import MinValueValidator
 from django.db import models, transaction
 from django.db.models import Q, QuerySet, Sum
 from django.db.models.functions import Coalesce
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.db.utils import IntegrityError, OperationalError
 from django.dispatch import receiver
 from django.urls import reverse
@@ -531,6 +531,7 @@ class StockItem(
         )
 
     @classmethod
+    @transaction.atomic
     def _create_serial_numbers(cls, serials: list, **kwargs) -> QuerySet:
         """Create multiple stock items with the provided serial numbers.
 
@@ -599,6 +600,22 @@ class StockItem(
 
         part = data['part']
 
+        # Lock the serial number counter for this part tree,
+        # so that concurrent requests cannot create duplicate serial numbers
+        counter = SerialNumberCounter.lock(part)
+
+        duplicates = StockItem.objects.filter(
+            serial__in=[serial for serial in serials if serial]
+        )
+
+        if counter.tree_id:
+            duplicates = duplicates.filter(part__tree_id=part.tree_id)
+
+        if duplicates.exists():
+            raise ValidationError({
+                'serial_numbers': _('Stock item with this serial number already exists')
+            })
+
         parent = kwargs.pop('parent', None) or data.get('parent')
         tree_id = kwargs.pop('tree_id', StockItem.getNextTreeID())
 
@@ -636,6 +653,13 @@ class StockItem(
         # Create the StockItem objects in bulk
         StockItem.objects.bulk_create(items)
 
+        # The post_save signal is not sent for bulk_create
+        from stock.coalesce import queue_part_updates
+
+        queue_part_updates([part])
+
+        counter.update_latest([serial for serial in serials if serial])
+
         # We will need to rebuild the stock item tree manually, due to the bulk_create operation
         if parent and parent.tree_id:
             # Rebuild the tree structure for this StockItem tree
@@ -657,17 +681,24 @@ class StockItem(
         return items
 
     @staticmethod
-    def convert_serial_to_int(serial: str) -> int | None:
+    def convert_serial_to_int(serial: str, plugins=None) -> int | None:
         """Convert the provided serial number to an integer value.
 
         This function hooks into the plugin system to allow for custom serial number conversion.
+
+        Arguments:
+            serial: The serial number to convert
+            plugins: Optional list of validation plugins (fetched from the plugin registry if not provided)
         """
         from plugin import PluginMixinEnum, registry
 
+        if plugins is None:
+            plugins = registry.with_mixin(PluginMixinEnum.VALIDATION)
+
         # First, let any plugins convert this serial number to an integer value
         # If a non-null value is returned (by any plugin) we will use that
 
-        for plugin in registry.with_mixin(PluginMixinEnum.VALIDATION):
+        for plugin in plugins:
             try:
                 serial_int = plugin.convert_serial_to_int(serial)
             except Exception:
@@ -2840,46 +2871,176 @@ class StockItem(
         return status['passed'] >= status['total']
 
 
+@receiver(pre_delete, sender=StockLocation, dispatch_uid='stock_location_pre_delete')
+def before_delete_stock_location(sender, instance: StockLocation, **kwargs):
+    """Function to be executed before a StockLocation object is deleted.
+
+    Any stock items in the location are moved (or deleted) without sending signals,
+    and the stock totals for the location are removed (by cascade),
+    so the stock totals for the affected parts must be recalculated.
+    """
+    from part.models import PartStockTotal
+    from stock.coalesce import queue_stock_totals_update
+
+    if InvenTree.ready.isImportingData() or not PartStockTotal.enabled():
+        return
+
+    queue_stock_totals_update(
+        PartStockTotal.objects.filter(location=instance).values_list('part', flat=True)
+    )
+
+
 @receiver(post_delete, sender=StockItem, dispatch_uid='stock_item_post_delete_log')
 def after_delete_stock_item(sender, instance: StockItem, **kwargs):
     """Function to be executed after a StockItem object is deleted."""
-    from part import tasks as part_tasks
+    from stock.coalesce import (
+        queue_low_stock_check,
+        queue_pricing_update,
+        queue_stock_totals_update,
+    )
 
     if InvenTree.ready.isImportingData():
         return
 
+    queue_stock_totals_update([instance.part_id])
+
     if InvenTree.ready.canAppAccessDatabase(allow_test=True):
         # Run this check in the background
-        InvenTree.tasks.offload_task(
-            part_tasks.notify_low_stock_if_required,
-            instance.part.pk,
-            group='notification',
-            force_async=True,
-        )
+        queue_low_stock_check(instance.part)
 
     if InvenTree.ready.canAppAccessDatabase(allow_test=settings.TESTING_PRICING):
         # Schedule an update on parent part pricing
         if instance.part:
-            instance.part.schedule_pricing_update(create=False)
+            queue_pricing_update(instance.part, create=False)
 
 
 @receiver(post_save, sender=StockItem, dispatch_uid='stock_item_post_save_log')
 def after_save_stock_item(sender, instance: StockItem, created, **kwargs):
     """Hook function to be executed after StockItem object is saved/updated."""
-    from part import tasks as part_tasks
+    from stock.coalesce import (
+        queue_low_stock_check,
+        queue_pricing_update,
+        queue_stock_totals_update,
+    )
+
+    if created and instance.serial:
+        # Advance the serial number counter (if required)
+        SerialNumberCounter.objects.filter(
+            tree_id=SerialNumberCounter.get_tree_id(instance.part),
+            serial_int__lt=instance.serial_int,
+        ).update(serial=instance.serial, serial_int=instance.serial_int)
 
     if not InvenTree.ready.isImportingData():
+        queue_stock_totals_update([instance.part_id])
+
         if InvenTree.ready.canAppAccessDatabase(allow_test=True):
-            InvenTree.tasks.offload_task(
-                part_tasks.notify_low_stock_if_required,
-                instance.part.pk,
-                group='notification',
-                force_async=True,
-            )
+            queue_low_stock_check(instance.part)
 
         if InvenTree.ready.canAppAccessDatabase(allow_test=settings.TESTING_PRICING):
             if instance.part:
-                instance.part.schedule_pricing_update(create=True)
+                queue_pricing_update(instance.part, create=True)
+
+
+class SerialNumberCounter(models.Model):
+    """A SerialNumberCounter records the latest serial number issued for a Part tree.
+
+    New serial numbers are handed out by locking the counter row (SELECT ... FOR UPDATE),
+    so that concurrent requests cannot be issued the same serial numbers.
+
+    The counter is seeded (once) from the latest serial number which exists in the database,
+    and is then advanced whenever serialized stock items are created.
+
+    The counter is keyed on the Part tree ID, which can change (e.g. if the part tree is rebuilt).
+    Counters for any modified part trees are removed (see Part.tree_changed),
+    and are re-seeded when next required.
+
+    Attributes:
+    - tree_id: The Part tree for this counter (0 if serial numbers are globally unique)
+    - serial: The latest serial number which has been issued
+    - serial_int: Integer representation of the latest serial number
+    """
+
+    tree_id = models.PositiveIntegerField(unique=True)
+
+    serial = models.CharField(max_length=100, blank=True, null=True)
+
+    serial_int = models.IntegerField(default=0)
+
+    @staticmethod
+    def get_tree_id(part) -> int:
+        """Return the counter tree ID for the provided Part."""
+        if get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
+            return 0
+
+        return part.tree_id
+
+    @staticmethod
+    def get_latest_existing(part) -> tuple[str | None, int]:
+        """Return the latest serial number which exists in the database for the provided Part.
+
+        Returns:
+            A tuple of (serial, serial_int) - or (None, 0) if no serial numbers exist
+        """
+        serial = part.get_latest_serial_number(allow_plugins=False)
+
+        if not serial:
+            return None, 0
+
+        return serial, StockItem.convert_serial_to_int(serial) or 0
+
+    @classmethod
+    def lock(cls, part) -> SerialNumberCounter:
+        """Return the serial number counter for the provided Part, locked for update.
+
+        If the counter does not yet exist, it is seeded from the latest existing serial number.
+
+        Note: This must be called within an atomic transaction block.
+        """
+        tree_id = cls.get_tree_id(part)
+
+        counter = cls.objects.select_for_update().filter(tree_id=tree_id).first()
+
+        if counter is None:
+            serial, serial_int = cls.get_latest_existing(part)
+
+            try:
+                with transaction.atomic():
+                    cls.objects.create(
+                        tree_id=tree_id, serial=serial, serial_int=serial_int
+                    )
+            except IntegrityError:
+                # Counter was created by a concurrent request
+                pass
+
+            counter = cls.objects.select_for_update().get(tree_id=tree_id)
+
+        return counter
+
+    def update_latest(self, serials: list[str], plugins=None):
+        """Update the counter to the latest of the provided serial numbers.
+
+        The counter is never moved backwards.
+
+        Arguments:
+            serials: The serial numbers which have been issued
+            plugins: Optional list of validation plugins (fetched from the plugin registry if not provided)
+        """
+        from plugin import PluginMixinEnum, registry
+
+        if plugins is None:
+            plugins = registry.with_mixin(PluginMixinEnum.VALIDATION)
+
+        latest = None
+
+        for serial in serials:
+            serial_int = StockItem.convert_serial_to_int(serial, plugins=plugins) or 0
+
+            if latest is None or serial_int > latest[1]:
+                latest = (serial, serial_int)
+
+        if latest and latest[1] >= self.serial_int:
+            self.serial, self.serial_int = latest
+            self.save()
 
 
 class StockItemTracking(InvenTree.models.InvenTreeModel):
@@ -2922,7 +3083,8 @@ class StockItemTracking(InvenTree.models.InvenTreeModel):
 
     def label(self):
         """Return label."""
-        if self.tracking_type in StockHistoryCode.keys():  # noqa: SIM118
+        # Custom status values are not considered (avoids a database query for each entry)
+        if self.tracking_type in StockHistoryCode.keys(custom=False):
             return StockHistoryCode.label(self.tracking_type)
 
         return getattr(self, 'title', '')
@@ -40,6 +40,7 @@ from InvenTree.serializers import (
 )
 from users.serializers import UserSerializer
 
+from .adjustment import StockAdjustment
 from .models import (
     StockItem,
     StockItemTestResult,
@@ -151,11 +152,11 @@ class GenerateSerialNumberSerializer(serializers.Serializer):
     class Meta:
         """Metaclass options."""
 
-        fields = ['serial_number', 'part', 'quantity']
+        fields = ['serial_number', 'part', 'quantity', 'reserve']
 
         read_only_fields = ['serial_number']
 
-        write_only_fields = ['part', 'quantity']
+        write_only_fields = ['part', 'quantity', 'reserve']
 
     serial_number = serializers.CharField(
         read_only=True,
@@ -181,6 +182,15 @@ class GenerateSerialNumberSerializer(serializers.Serializer):
         help_text=_('Quantity of serial numbers to generate'),
     )
 
+    reserve = serializers.BooleanField(
+        required=False,
+        default=False,
+        label=_('Reserve'),
+        help_text=_(
+            'Reserve the generated serial numbers, so they are not generated again'
+        ),
+    )
+
 
 class LocationBriefSerializer(InvenTree.serializers.InvenTreeModelSerializer):
     """Provides a brief serializer for a StockLocation object."""
@@ -1720,22 +1730,10 @@ class StockCountSerializer(StockAdjustmentSerializer):
         request = self.context['request']
 
         data = self.validated_data
-        items = data['items']
         notes = data.get('notes', '')
 
         with transaction.atomic():
-            for item in items:
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                # Optional fields
-                extra = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        extra[field_name] = field_value
-
-                stock_item.stocktake(quantity, request.user, notes=notes, **extra)
+            StockAdjustment(request.user, notes=notes).count(data['items'])
 
 
 class StockAddSerializer(StockAdjustmentSerializer):
@@ -1749,22 +1747,7 @@ class StockAddSerializer(StockAdjustmentSerializer):
         notes = data.get('notes', '')
 
         with transaction.atomic():
-            for item in data['items']:
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                if quantity is None or quantity <= 0:
-                    # Ignore in this case - no stock to add
-                    continue
-
-                # Optional fields
-                extra = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        extra[field_name] = field_value
-
-                stock_item.add_stock(quantity, request.user, notes=notes, **extra)
+            StockAdjustment(request.user, notes=notes).add(data['items'])
 
 
 class StockRemoveSerializer(StockAdjustmentSerializer):
@@ -1778,22 +1761,7 @@ class StockRemoveSerializer(StockAdjustmentSerializer):
         notes = data.get('notes', '')
 
         with transaction.atomic():
-            for item in data['items']:
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                # Ignore in this case - no stock to remove
-                if quantity is None or quantity <= 0:
-                    continue
-
-                # Optional fields
-                extra = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        extra[field_name] = field_value
-
-                stock_item.take_stock(quantity, request.user, notes=notes, **extra)
+            StockAdjustment(request.user, notes=notes).remove(data['items'])
 
 
 class StockTransferSerializer(StockAdjustmentSerializer):
@@ -1820,27 +1788,12 @@ class StockTransferSerializer(StockAdjustmentSerializer):
         request = self.context['request']
 
         data = self.validated_data
-
-        items = data['items']
         notes = data.get('notes', '')
-        location = data['location']
 
         with transaction.atomic():
-            for item in items:
-                # Required fields
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                # Optional fields
-                kwargs = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        kwargs[field_name] = field_value
-
-                stock_item.move(
-                    location, notes, request.user, quantity=quantity, **kwargs
-                )
+            StockAdjustment(request.user, notes=notes).transfer(
+                data['items'], data['location']
+            )
 
 
 class StockReturnSerializer(StockAdjustmentSerializer):
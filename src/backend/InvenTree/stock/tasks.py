@@ -45,11 +45,16 @@ def rebuild_stock_item_tree(tree_id: int, rebuild_on_fail: bool = True) -> bool:
         bool: True if the partial tree rebuild was successful, False otherwise.
 
     - If the rebuild fails, schedule a rebuild of the entire StockItem tree.
+    - If tree updates are deferred (see InvenTree.models.defer_tree_updates), the tree is marked for a later rebuild.
     """
     from InvenTree.exceptions import log_error
+    from InvenTree.models import queue_tree_rebuild
     from InvenTree.sentry import report_exception
     from stock.models import StockItem
 
+    if queue_tree_rebuild(StockItem, tree_id):
+        return True
+
     if tree_id:
         try:
             StockItem.objects.partial_rebuild(tree_id)
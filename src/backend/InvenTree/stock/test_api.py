@@ -1,9 +1,11 @@
 """Unit testing for the Stock API."""
 
+import math
 import os
 import random
 from datetime import datetime, timedelta
 from enum import IntEnum
+from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
@@ -1045,6 +1047,38 @@ class StockItemListTest(StockAPITestCase):
 
             self.assertGreaterEqual(len(data), 2500)
 
+    def test_export_chunks(self):
+        """Test that exported data is generated and written in chunks."""
+        from common.models import DataOutput
+        from plugin.registry import registry
+        from stock.serializers import StockItemSerializer
+
+        exporter = registry.get_plugin('inventree-exporter')
+
+        queryset = StockItemSerializer.annotate_queryset(StockItem.objects.all())
+        N = queryset.count()
+
+        output = DataOutput.objects.create(total=N, progress=0)
+
+        with mock.patch.object(exporter, 'EXPORT_CHUNK_SIZE', 4):
+            chunks = list(
+                exporter.export_data_stream(
+                    queryset, StockItemSerializer, {}, {}, output
+                )
+            )
+
+        self.assertEqual(len(chunks), math.ceil(N / 4))
+        self.assertTrue(all(len(chunk) <= 4 for chunk in chunks))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), N)
+
+        # Progress is updated for each chunk
+        output.refresh_from_db()
+        self.assertEqual(output.progress, N)
+
+        # Export to a streamed TSV file
+        with self.export_data(self.list_url, export_format='tsv') as data_file:
+            self.process_csv(data_file, delimiter='\t', required_rows=N)
+
     def test_filter_by_allocated(self):
         """Test that we can filter by "allocated" status.
 
@@ -2575,6 +2609,46 @@ class StockTrackingTest(StockAPITestCase):
 
         self.assertEqual(response.data['count'], 0)
 
+    def test_cursor_pagination(self):
+        """Test keyset (cursor) pagination of the list endpoint."""
+        url = self.get_url()
+
+        N = StockItemTracking.objects.count()
+
+        response = self.get(url, {'limit': 500, 'cursor': ''})
+        self.assertEqual(response.data['count'], N)
+        self.assertIsNone(response.data['previous'])
+
+        pks = [item['pk'] for item in response.data['results']]
+
+        # Follow the 'next' links to the last page (skipping the count)
+        next_url = response.data['next'] + '&skip_count=true'
+
+        while next_url:
+            response = self.get(next_url)
+            self.assertIsNone(response.data['count'])
+            self.assertIsNotNone(response.data['previous'])
+            pks.extend(item['pk'] for item in response.data['results'])
+            next_url = response.data['next']
+
+        # Most recent entries are returned first
+        expected = list(
+            StockItemTracking.objects.order_by('-pk').values_list('pk', flat=True)
+        )
+
+        self.assertEqual(pks, expected)
+
+        # Step back to the previous page
+        response = self.get(response.data['previous'])
+        self.assertEqual(
+            [item['pk'] for item in response.data['results']],
+            expected[-(N % 500 or 500) - 500 : -(N % 500 or 500)],
+        )
+
+        # Only the cursor key can be used for ordering
+        self.get(url, {'cursor': '', 'ordering': 'date'}, expected_code=400)
+        self.get(url, {'cursor': 'invalid'}, expected_code=404)
+
     def test_list(self):
         """Test list endpoint."""
         url = self.get_url()
@@ -1,6 +1,7 @@
 """Tests for stock app."""
 
 import datetime
+from unittest import mock
 
 from django.core.exceptions import ValidationError
 from django.db.models import Sum
@@ -14,6 +15,7 @@ from company.models import Company
 from InvenTree.unit_test import AdminTestCase, InvenTreeTestCase
 from order.models import SalesOrder
 from part.models import Part, PartTestTemplate
+from stock.events import StockEvents
 from stock.status_codes import StockHistoryCode, StockStatus
 
 from .models import (
@@ -805,6 +807,140 @@ class StockTest(StockTestBase):
 
         self.assertTrue(check_func())
 
+    def test_coalesce_part_updates(self):
+        """Test that part updates triggered by stock changes are coalesced."""
+        from django_q.models import OrmQ
+
+        from stock.coalesce import coalesce_part_updates, get_active_buffer
+
+        OrmQ.objects.all().delete()
+
+        part = Part.objects.first()
+        location = StockLocation.objects.first()
+
+        # Pending updates are offloaded once the transaction is committed
+        with self.captureOnCommitCallbacks(execute=True), coalesce_part_updates():
+            for idx in range(5):
+                StockItem.objects.create(part=part, quantity=idx + 1, location=location)
+
+            # Nested scopes share the same buffer
+            with coalesce_part_updates():
+                StockItem.objects.create(part=part, quantity=10, location=location)
+
+            self.assertEqual(get_active_buffer().low_stock, {part.pk})
+
+        self.assertIsNone(get_active_buffer())
+
+        funcs = [task.func() for task in OrmQ.objects.all()]
+
+        # A single batch task has been offloaded, rather than one task per item
+        self.assertEqual(
+            funcs.count('part.tasks.notify_low_stock_if_required_batch'), 1
+        )
+        self.assertNotIn('part.tasks.notify_low_stock_if_required', funcs)
+
+        OrmQ.objects.all().delete()
+
+        # Updates for committed changes are offloaded, even if an exception escapes the scope
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with coalesce_part_updates():
+                    StockItem.objects.create(part=part, quantity=1, location=location)
+                    raise ValueError('Interrupted')
+            except ValueError:
+                pass
+
+        self.assertIsNone(get_active_buffer())
+
+        funcs = [task.func() for task in OrmQ.objects.all()]
+
+        self.assertEqual(
+            funcs.count('part.tasks.notify_low_stock_if_required_batch'), 1
+        )
+
+    def test_bulk_adjustment(self):
+        """Test bulk stock adjustment operations."""
+        from stock.adjustment import StockAdjustment
+
+        user = self.user
+
+        def adjust(*items):
+            return [
+                {'pk': StockItem.objects.get(pk=pk), 'quantity': quantity, **extra}
+                for pk, quantity, extra in items
+            ]
+
+        n = StockItemTracking.objects.count()
+
+        # Count stock
+        StockAdjustment(user, notes='Counted').count(
+            adjust((1, 3500, {}), (2, 4500, {'batch': 'B999'}))
+        )
+
+        self.assertEqual(StockItem.objects.get(pk=1).quantity, 3500)
+        self.assertEqual(StockItem.objects.get(pk=2).quantity, 4500)
+        self.assertEqual(StockItem.objects.get(pk=2).batch, 'B999')
+        self.assertEqual(StockItem.objects.get(pk=2).stocktake_user, user)
+        self.assertEqual(StockItemTracking.objects.count(), n + 2)
+
+        track = StockItemTracking.objects.filter(item__pk=2).latest('id')
+        self.assertEqual(track.tracking_type, StockHistoryCode.STOCK_COUNT)
+        self.assertEqual(track.deltas['quantity'], 4500)
+        self.assertEqual(track.notes, 'Counted')
+
+        # Add and remove stock (the same item may be adjusted twice)
+        StockAdjustment(user).add(adjust((1, 100, {}), (1, 50, {}), (2, 0, {})))
+        self.assertEqual(StockItem.objects.get(pk=1).quantity, 3650)
+        self.assertEqual(StockItemTracking.objects.count(), n + 4)
+
+        # Item 101 is deleted once depleted, item 100 is not
+        StockAdjustment(user).remove(adjust((100, 30, {}), (101, 30, {})))
+        self.assertEqual(StockItem.objects.get(pk=100).quantity, 0)
+        self.assertFalse(StockItem.objects.filter(pk=101).exists())
+
+        track = StockItemTracking.objects.filter(item__pk=100).latest('id')
+        self.assertEqual(track.tracking_type, StockHistoryCode.STOCK_REMOVE)
+        self.assertEqual(track.deltas['removed'], 30)
+
+        # Transfer stock (item 2 is only partially moved, and is split)
+        with mock.patch('stock.adjustment.trigger_event') as trigger:
+            StockAdjustment(user).transfer(
+                adjust((1, 3650, {}), (2, 500, {})), self.drawer1
+            )
+
+        # Per-item events are still triggered, along with the aggregated event
+        trigger.assert_any_call(
+            StockEvents.ITEM_MOVED,
+            id=1,
+            old_location=self.diningroom.pk,
+            new_location=self.drawer1.pk,
+            quantity=3650.0,
+        )
+        trigger.assert_called_with(
+            StockEvents.ITEMS_MOVED, ids=[1], location=self.drawer1.pk
+        )
+
+        self.assertEqual(StockItem.objects.get(pk=1).location, self.drawer1)
+        self.assertEqual(StockItem.objects.get(pk=2).location, self.bathroom)
+        self.assertEqual(StockItem.objects.get(pk=2).quantity, 4000)
+        self.assertTrue(
+            StockItem.objects.filter(
+                parent__pk=2, location=self.drawer1, quantity=500
+            ).exists()
+        )
+
+        track = StockItemTracking.objects.filter(item__pk=1).latest('id')
+        self.assertEqual(track.tracking_type, StockHistoryCode.STOCK_MOVE)
+        self.assertEqual(track.deltas['location'], self.drawer1.pk)
+
+        # Validation rules are applied to the adjusted items
+        Part.objects.filter(pk=1).update(trackable=True)
+
+        with self.assertRaises(ValidationError):
+            StockAdjustment(user).add(adjust((1, 0.5, {})))
+
+        self.assertEqual(StockItem.objects.get(pk=1).quantity, 3650)
+
     def test_purchase_price(self):
         """Test purchase price field."""
         from common.currency import currency_code_default
@@ -943,6 +1079,62 @@ class VariantTest(StockTestBase):
         item.serial = int(n) + 2
         item.save()
 
+    def test_serial_number_reservation(self):
+        """Test reservation of serial numbers via the serial number counter."""
+        from stock.generators import generate_serial_number, reserve_serial_numbers
+        from stock.models import SerialNumberCounter
+
+        InvenTreeSetting.set_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False, self.user)
+
+        chair = Part.objects.get(pk=10000)
+        variant = Part.objects.get(pk=10003)
+
+        self.assertFalse(SerialNumberCounter.objects.exists())
+
+        # Generating serial numbers does not reserve them
+        self.assertEqual(generate_serial_number(chair, 2), '23,24')
+        self.assertEqual(generate_serial_number(chair, 2), '23,24')
+
+        # Counter is seeded from existing stock items
+        self.assertEqual(reserve_serial_numbers(chair, 3), ['23', '24', '25'])
+
+        counter = SerialNumberCounter.objects.get(tree_id=chair.tree_id)
+        self.assertEqual(counter.serial, '25')
+        self.assertEqual(counter.serial_int, 25)
+
+        # Counter is shared across the part tree
+        self.assertEqual(reserve_serial_numbers(variant, 2), ['26', '27'])
+        self.assertEqual(generate_serial_number(chair, 1), '28')
+        self.assertEqual(generate_serial_number(chair, 1, reserve=True), '28')
+
+        # Creating a serialized stock item advances the counter
+        StockItem.objects.create(part=variant, quantity=1, serial='50')
+        self.assertEqual(reserve_serial_numbers(chair, 1), ['51'])
+
+        # Once seeded, the counter is trusted (existing serial numbers are still skipped)
+        SerialNumberCounter.objects.filter(pk=counter.pk).update(
+            serial='20', serial_int=20
+        )
+
+        self.assertEqual(generate_serial_number(chair, 2), '23,24')
+
+        # Any change to the part tree removes the counter, which is then re-seeded
+        Part.tree_changed([chair.tree_id])
+        self.assertFalse(SerialNumberCounter.objects.exists())
+
+        self.assertEqual(generate_serial_number(chair, 2), '51,52')
+        self.assertEqual(reserve_serial_numbers(chair, 3), ['51', '52', '53'])
+
+        # Duplicate serial numbers cannot be created
+        with self.assertRaises(ValidationError):
+            StockItem._create_serial_numbers(['54', '50'], part=variant)
+
+        items = StockItem._create_serial_numbers(['54', '55'], part=variant)
+        self.assertEqual(items.count(), 2)
+        self.assertEqual(
+            SerialNumberCounter.objects.get(tree_id=chair.tree_id).serial, '55'
+        )
+
 
 class StockLocationTreeTest(StockTestBase):
     """Unit test for the StockLocation tree structure."""
@@ -1022,6 +1214,63 @@ class StockLocationTreeTest(StockTestBase):
         self.assertTrue(d.pathstring.startswith('AAAAAAAA'))
         self.assertTrue(d.pathstring.endswith('DDDDDDDD'))
 
+    def test_deferred_tree_updates(self):
+        """Check that tree maintenance can be deferred until the end of a bulk operation."""
+        from InvenTree.models import defer_tree_updates
+
+        a = StockLocation.objects.create(name='A')
+        b = StockLocation.objects.create(name='B')
+
+        children = [
+            StockLocation.objects.create(name=f'C{idx}', parent=a) for idx in range(5)
+        ]
+
+        for child in children:
+            StockLocation.objects.create(name='D', parent=child)
+
+        with mock.patch.object(
+            StockLocation.objects, 'partial_rebuild', autospec=True
+        ) as rebuild:
+            with defer_tree_updates():
+                # Re-parent each child location (and its descendants)
+                for child in children:
+                    child.parent = b
+                    child.save()
+
+            # Each affected tree is rebuilt exactly once
+            self.assertEqual(
+                sorted(call.args[0] for call in rebuild.call_args_list),
+                sorted({a.tree_id, b.tree_id}),
+            )
+
+        StockLocation.objects.partial_rebuild(a.tree_id)
+        StockLocation.objects.partial_rebuild(b.tree_id)
+
+        b.refresh_from_db()
+        self.assertEqual(b.get_descendants().count(), 10)
+
+        for child in children:
+            child.refresh_from_db()
+            self.assertEqual(child.pathstring, f'B/{child.name}')
+            self.assertEqual(
+                child.get_children().first().pathstring, f'B/{child.name}/D'
+            )
+
+        # Stock item trees are also rebuilt once, after all items are split
+        item = StockItem.objects.create(part=Part.objects.get(pk=1), quantity=100)
+
+        with defer_tree_updates():
+            for _ in range(5):
+                item.splitStock(10, b, None)
+
+        item.refresh_from_db()
+        self.assertEqual(item.quantity, 50)
+        self.assertEqual(item.get_descendants().count(), 5)
+
+        for child in item.get_children():
+            self.assertEqual(child.level, 1)
+            self.assertEqual(child.location, b)
+
     def test_location_tree(self):
         """Unit tests for stock location tree structure (MPTT).
 
@@ -26,6 +26,7 @@ import InvenTree.models
 from common.settings import get_global_setting
 from InvenTree.ready import isImportingData, isReadOnlyCommand
 
+from .permissions import invalidate_permission_cache
 from .ruleset import RULESET_CHOICES, get_ruleset_models
 
 logger = structlog.get_logger('inventree')
@@ -642,3 +643,31 @@ def validate_primary_group_on_group_change(sender, instance, action, **kwargs):
         if profile.primary_group and profile.primary_group not in instance.groups.all():
             profile.primary_group = None
             profile.save()
+
+
+# Invalidate cached user permissions
+@receiver(post_save, sender=RuleSet, dispatch_uid='ruleset_saved_permissions')
+@receiver(post_delete, sender=RuleSet, dispatch_uid='ruleset_deleted_permissions')
+@receiver(post_delete, sender=Group, dispatch_uid='group_deleted_permissions')
+def invalidate_permissions_on_change(sender, instance, **kwargs):
+    """Invalidate cached user permissions when a ruleset or group is changed."""
+    invalidate_permission_cache()
+
+
+@receiver(
+    m2m_changed, sender=User.groups.through, dispatch_uid='user_groups_permissions'
+)
+@receiver(
+    m2m_changed,
+    sender=User.user_permissions.through,
+    dispatch_uid='user_permissions_permissions',
+)
+@receiver(
+    m2m_changed,
+    sender=Group.permissions.through,
+    dispatch_uid='group_permissions_permissions',
+)
+def invalidate_permissions_on_m2m_change(sender, action, **kwargs):
+    """Invalidate cached user permissions when group or permission assignments are changed."""
+    if action in ['post_add', 'post_remove', 'post_clear']:
+        invalidate_permission_cache()
@@ -1,13 +1,50 @@
-"""Helper functions for user permission checks."""
+"""Helper functions for user permission checks.
 
+The role permissions for each user are precomputed into a "permission matrix" (see PermissionMatrix),
+which is cached for the duration of a request (session cache),
+and in the global cache (if enabled) until any group, ruleset or permission assignments are changed.
+
+Django permissions (e.g. assigned directly to the user) are only checked (and cached for the request)
+if the required permission is not granted by any role.
+"""
+
+from __future__ import annotations
+
+import functools
 from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.db import models
 from django.db.models.query import Prefetch, QuerySet
 
+import structlog
+
 import InvenTree.cache
-from users.ruleset import RULESET_CHANGE_INHERIT, get_ruleset_ignore, get_ruleset_models
+from users.ruleset import (
+    RULESET_CHANGE_INHERIT,
+    RULESET_PERMISSIONS,
+    get_ruleset_ignore,
+    get_ruleset_models,
+)
+
+logger = structlog.get_logger('inventree')
+
+# Bit flag for each permission type
+PERMISSION_FLAGS = {
+    permission: 1 << idx for idx, permission in enumerate(RULESET_PERMISSIONS)
+}
+
+# Combination of all permission flags
+PERMISSION_FLAGS_ALL = sum(PERMISSION_FLAGS.values())
+
+# Version stamp for cached permission data
+# Incremented whenever group / ruleset / permission assignments are changed
+PERMISSION_CACHE_VERSION = InvenTree.cache.CacheVersion('permissions')
+
+# Timeout (seconds) for permission data stored in the global cache
+PERMISSION_CACHE_TIMEOUT = 3600
 
 
 def split_model(model_label: str) -> tuple[str, str]:
@@ -72,6 +109,123 @@ def prefetch_rule_sets(user) -> QuerySet:
     )
 
 
+@functools.cache
+def get_ruleset_ignore_tables() -> frozenset[str]:
+    """Return the (cached) set of database tables which do not require permissions."""
+    return frozenset(get_ruleset_ignore())
+
+
+class PermissionMatrix:
+    """Precomputed role permissions for a single user.
+
+    Each role permission check is then a simple dictionary lookup.
+
+    Attributes:
+        roles: Dict of {role: flags} for each role assigned to the user
+        tables: Dict of {table_name: flags} for each database table the user's roles grant permissions for
+    """
+
+    def __init__(self, roles: dict, tables: dict):
+        """Initialize the permission matrix."""
+        self.roles = roles
+        self.tables = tables
+
+    @classmethod
+    def build(cls, user: User, groups: Optional[QuerySet] = None) -> PermissionMatrix:
+        """Calculate the permission matrix for the provided user.
+
+        Arguments:
+            user: The user object
+            groups: Optional cached queryset of groups to check (defaults to user's groups)
+        """
+        roles: dict[str, int] = {}
+
+        for group in groups or prefetch_rule_sets(user):
+            for rule in group.prefetched_rule_sets:
+                for permission, flag in PERMISSION_FLAGS.items():
+                    # e.g. "view" role maps to "can_view" attribute
+                    if getattr(rule, f'can_{permission}', False):
+                        roles[rule.name] = roles.get(rule.name, 0) | flag
+
+        tables: dict[str, int] = {}
+
+        for role, table_names in get_ruleset_models().items():
+            if flags := roles.get(role, 0):
+                for table_name in table_names:
+                    tables[table_name] = tables.get(table_name, 0) | flags
+
+        # Child models which inherit all permissions from the 'change' permission of the parent role
+        for parent, child in RULESET_CHANGE_INHERIT:
+            if roles.get(parent, 0) & PERMISSION_FLAGS['change']:
+                tables[f'{parent}_{child}'] = PERMISSION_FLAGS_ALL
+
+        return cls(roles, tables)
+
+    def has_role(self, role: str, permission: str) -> bool:
+        """Check if the user has the specified role:permission combination."""
+        return bool(self.roles.get(role, 0) & PERMISSION_FLAGS.get(permission, 0))
+
+    def has_permission(self, table_name: str, permission: str) -> bool:
+        """Check if the user's roles grant the specified permission against a database table."""
+        return bool(
+            self.tables.get(table_name, 0) & PERMISSION_FLAGS.get(permission, 0)
+        )
+
+
+def get_permission_matrix(
+    user: User, groups: Optional[QuerySet] = None
+) -> PermissionMatrix:
+    """Return the permission matrix for the provided user.
+
+    The matrix is looked up in the following order:
+    1. The session cache (for the current request)
+    2. The global cache (if enabled)
+    3. Calculated from the database (and stored in the caches)
+
+    Arguments:
+        user: The user object
+        groups: Optional cached queryset of groups to check (defaults to user's groups)
+    """
+    session_key = f'permission_matrix_{user.pk}'
+
+    if matrix := InvenTree.cache.get_session_cache(session_key):
+        return matrix
+
+    cache_key = None
+
+    if settings.GLOBAL_CACHE_ENABLED:
+        try:
+            cache_key = f'permission-matrix:{PERMISSION_CACHE_VERSION.get()}:{user.pk}'
+            matrix = cache.get(cache_key)
+        except Exception:  # pragma: no cover
+            cache_key = None
+            matrix = None
+
+    if matrix is None:
+        matrix = PermissionMatrix.build(user, groups=groups)
+
+        if cache_key:
+            try:
+                cache.set(cache_key, matrix, timeout=PERMISSION_CACHE_TIMEOUT)
+            except Exception:  # pragma: no cover
+                pass
+
+    InvenTree.cache.set_session_cache(session_key, matrix)
+
+    return matrix
+
+
+def invalidate_permission_cache():
+    """Invalidate the cached permission data for all users."""
+    if not settings.GLOBAL_CACHE_ENABLED:
+        return
+
+    try:
+        PERMISSION_CACHE_VERSION.bump()
+    except Exception:  # pragma: no cover
+        logger.warning('Failed to update permission cache version')
+
+
 def check_user_role(
     user: User,
     role: str,
@@ -91,7 +245,7 @@ def check_user_role(
     Returns:
         bool: True if the user has the specified role:permission combination
 
-    Note: As this check may be called frequently, we cache the result in the session cache.
+    Note: As this check may be called frequently, the permission matrix for the user is cached.
     """
     if not user:
         return False
@@ -102,31 +256,7 @@ def check_user_role(
     if user.is_superuser:
         return True
 
-    # First, check the session cache
-    cache_key = f'role_{user.pk}_{role}_{permission}'
-    result = InvenTree.cache.get_session_cache(cache_key)
-
-    if result is not None:
-        return result
-
-    # Default for no match
-    result = False
-
-    groups = groups or prefetch_rule_sets(user)
-
-    for group in groups:
-        for rule in group.prefetched_rule_sets:
-            if rule.name == role:
-                # Check if the rule has the specified permission
-                # e.g. "view" role maps to "can_view" attribute
-                if getattr(rule, f'can_{permission}', False):
-                    result = True
-                    break
-
-    # Save result to session-cache
-    InvenTree.cache.set_session_cache(cache_key, result)
-
-    return result
+    return get_permission_matrix(user, groups=groups).has_role(role, permission)
 
 
 def check_user_permission(
@@ -148,7 +278,7 @@ def check_user_permission(
     Returns:
         bool: True if the user has the specified permission
 
-    Note: As this check may be called frequently, we cache the result in the session cache.
+    Note: As this check may be called frequently, the permission matrix for the user is cached.
     """
     if not user:
         return False
@@ -162,25 +292,13 @@ def check_user_permission(
     table_name = f'{model._meta.app_label}_{model._meta.model_name}'
 
     # Particular table does not require specific permissions
-    if table_name in get_ruleset_ignore():
+    if table_name in get_ruleset_ignore_tables():
         return True
 
-    groups = groups or prefetch_rule_sets(user)
-
-    for role, table_names in get_ruleset_models().items():
-        if table_name in table_names:
-            if check_user_role(user, role, permission, groups=groups):
-                return True
-
-    # Check for children models which inherits from parent role
-    for parent, child in RULESET_CHANGE_INHERIT:
-        # Get child model name
-        parent_child_string = f'{parent}_{child}'
-
-        if parent_child_string == table_name:
-            # Check if parent role has change permission
-            if check_user_role(user, parent, 'change', groups=groups):
-                return True
+    if get_permission_matrix(user, groups=groups).has_permission(
+        table_name, permission
+    ):
+        return True
 
     # Generate the permission name based on the model and permission
     # e.g. 'part.view_part'
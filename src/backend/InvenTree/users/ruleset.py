@@ -102,6 +102,7 @@ def get_ruleset_models() -> dict:
         RuleSetEnum.PART: [
             'part_part',
             'part_partpricing',
+            'part_partstocktotal',
             'part_bomitem',
             'part_bomitemsubstitute',
             'part_partsellpricebreak',
@@ -191,6 +192,9 @@ def get_ruleset_ignore() -> list[str]:
         'common_inventreecustomuserstatemodel',
         'common_selectionlistentry',
         'common_selectionlist',
+        'common_taskfingerprint',
+        'common_barcodeindex',
+        'stock_serialnumbercounter',
         'users_owner',
         'users_userprofile',  # User profile is handled in the serializer - only own user can change
         # Third-party tables
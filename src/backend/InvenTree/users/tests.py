@@ -1,8 +1,11 @@
 """Unit tests for the 'users' app."""
 
+from unittest import mock
+
 from django.apps import apps
 from django.contrib.auth.models import Group
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from common.settings import set_global_setting
@@ -10,6 +13,12 @@ from InvenTree.helpers_mfa import get_codes
 from InvenTree.unit_test import AdminTestCase, InvenTreeAPITestCase, InvenTreeTestCase
 from users.models import ApiToken, Owner
 from users.oauth2_scopes import _roles
+from users.permissions import (
+    PERMISSION_CACHE_VERSION,
+    PermissionMatrix,
+    check_user_permission,
+    check_user_role,
+)
 from users.ruleset import (
     RULESET_CHOICES,
     RULESET_NAMES,
@@ -193,6 +202,75 @@ class RuleSetModelTest(TestCase):
         self.assertEqual(group.permissions.count(), 0)
 
 
+class PermissionMatrixTest(InvenTreeTestCase):
+    """Unit tests for the precomputed user permission matrix."""
+
+    def test_matrix(self):
+        """Test that the permission matrix reflects the assigned roles."""
+        from part.models import BomItem, Part
+        from stock.models import StockItem
+
+        self.clearRoles()
+
+        matrix = PermissionMatrix.build(self.user)
+        self.assertEqual(matrix.roles, {})
+        self.assertFalse(matrix.has_permission('part_part', 'view'))
+
+        self.assignRole('part.change')
+
+        matrix = PermissionMatrix.build(self.user)
+
+        self.assertTrue(matrix.has_role('part', 'view'))
+        self.assertTrue(matrix.has_role('part', 'change'))
+        self.assertFalse(matrix.has_role('part', 'delete'))
+        self.assertFalse(matrix.has_role('stock', 'view'))
+
+        self.assertTrue(matrix.has_permission('part_part', 'change'))
+        self.assertFalse(matrix.has_permission('part_part', 'delete'))
+
+        # BomItem inherits from the 'change' permission of the 'part' role
+        self.assertTrue(matrix.has_permission('part_bomitem', 'delete'))
+
+        self.assertTrue(check_user_permission(self.user, Part, 'change'))
+        self.assertTrue(check_user_permission(self.user, BomItem, 'add'))
+        self.assertFalse(check_user_permission(self.user, StockItem, 'view'))
+
+    @override_settings(GLOBAL_CACHE_ENABLED=True)
+    def test_matrix_cache(self):
+        """Test that the cached permission matrix is invalidated by role changes."""
+        cache.clear()
+
+        self.clearRoles()
+
+        with (
+            mock.patch.object(PERMISSION_CACHE_VERSION, 'interval', 0),
+            mock.patch.object(
+                PermissionMatrix, 'build', wraps=PermissionMatrix.build
+            ) as build,
+        ):
+            self.assertFalse(check_user_role(self.user, 'part', 'view'))
+            self.assertEqual(build.call_count, 1)
+
+            # Second lookup is served from the global cache
+            self.assertFalse(check_user_role(self.user, 'part', 'view'))
+            self.assertFalse(check_user_role(self.user, 'part', 'change'))
+            self.assertEqual(build.call_count, 1)
+
+            # Changing a ruleset invalidates the cached data
+            self.assignRole('part.view')
+            self.assertTrue(check_user_role(self.user, 'part', 'view'))
+            self.assertEqual(build.call_count, 2)
+
+            # Removing the user from a group invalidates the cached data
+            self.user.groups.remove(self.group)
+            self.assertFalse(check_user_role(self.user, 'part', 'view'))
+            self.assertEqual(build.call_count, 3)
+
+            self.user.groups.add(self.group)
+            self.assertTrue(check_user_role(self.user, 'part', 'view'))
+            self.assertEqual(build.call_count, 4)
+
+
 class OwnerModelTest(InvenTreeTestCase):
     """Some simplistic tests to ensure the Owner model is setup correctly."""
 
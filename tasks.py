@@ -1715,6 +1715,67 @@ def test(
         manage(c, cmd, pty=pty)
 
 
+@task(
+    help={
+        'parts': 'Number of parts to generate (default = 1000)',
+        'stock': 'Number of stock items to generate (default = 10000)',
+        'orders': 'Number of purchase and sales orders to generate (default = 50)',
+        'builds': 'Number of build orders to generate (default = 10)',
+        'depth': 'Depth of the part category tree (default = 4)',
+        'repeat': 'Number of runs for each benchmark (default = 3)',
+        'only': 'Comma-separated list of benchmarks to run (default = all)',
+        'output': "Output file for the JSON results (default = 'benchmark.json')",
+        'user': 'Username of the account used for API requests (default = first superuser)',
+        'skip_generate': 'Run benchmarks against the existing database (default = False)',
+        'force': 'Generate the dataset even if the database is not empty (default = False)',
+    }
+)
+def benchmark(
+    c,
+    parts: int = 1000,
+    stock: int = 10000,
+    orders: int = 50,
+    builds: int = 10,
+    depth: int = 4,
+    repeat: int = 3,
+    only: str = '',
+    output: str = 'benchmark.json',
+    user: str = '',
+    skip_generate: bool = False,
+    force: bool = False,
+):
+    """Run the performance benchmark suite against a synthetic dataset.
+
+    This generates a synthetic dataset of the specified size, times a set of key operations,
+    and exports the results as JSON.
+
+    Warning: The generated dataset is added to the current database - use a dedicated database!
+    """
+    output = Path(output).resolve()
+
+    cmd = (
+        f'benchmark --parts {parts} --stock {stock} --orders {orders} --builds {builds}'
+    )
+    cmd += f' --depth {depth} --repeat {repeat} --output {output}'
+
+    if only:
+        cmd += f' --only {only}'
+
+    if user:
+        cmd += f' --user {user}'
+
+    if skip_generate:
+        cmd += ' --skip-generate'
+
+    if force:
+        cmd += ' --force'
+
+    info('Running benchmark suite ...')
+    manage(c, cmd, pty=True)
+
+    success(f'Benchmark results written to {output}')
+
+
 @task(
     help={
         'dev': 'Set up development environment at the end',
@@ -2364,6 +2425,7 @@ def monitor(c):
 
 # Collection sorting
 development = Collection(
+    benchmark,
     delete_data,
     docs_server,
     frontend_server,